@@ -0,0 +1,236 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""トークン検証のベンチマーク（ローカルのJWKSサーバー）.
+
+CognitoTokenVerifierRepository の JWKS のURLと発行者を LocalJwksServer に向け、ローカルで署名した
+トークンをJWKSの取得を含めて検証する。Cognitoに接続しないため、オフラインで実行できる。
+
+シナリオ:
+    valid: キャッシュ済みの鍵で署名したトークンを検証する
+    rotation: 鍵をローテーションした直後に、新しい鍵で署名したトークンを同時に検証する
+    unknown_kid_storm: JWKSにないkidのトークンを大量に送りながら、正しいトークンを検証する
+        （rotation の再取得の最小間隔の影響を受けないように、JWKSを取得したばかりの別のインスタンスで
+        検証する。最初の不明なkidでJWKSを1回再取得し、同じkidの繰り返しは記録したkidとして拒否する）
+
+シナリオごとのスループット・正しいトークンの検証のレイテンシ（p50/p99）・JWKSの取得回数を表示する。
+JWKSの配信は --jwks-latency-ms だけ遅らせ、Cognitoから取得する場合の遅延を再現する。
+
+実行方法: PYTHONPATH=src python -m benchmarks.auth_benchmark
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import statistics
+import time
+from dataclasses import dataclass
+
+import aiohttp
+
+from benchmarks.local_jwt import (
+    LOCAL_APP_CLIENT_ID,
+    LOCAL_ISSUER,
+    LocalJwksServer,
+    LocalSigningKey,
+    mint_access_token,
+    mint_unknown_kid_tokens,
+)
+from domain.lgtm_image_errors import ErrExpiredToken, ErrInvalidToken
+from infrastructure.cognito_token_verifier_repository import (
+    CognitoTokenVerifierRepository,
+)
+
+DEFAULT_REQUESTS = 1_000
+DEFAULT_CONCURRENCY = 32
+# CognitoからJWKSを取得するまでの遅延
+DEFAULT_JWKS_LATENCY_MS = 50.0
+# 同じトークンを検証し続けないように用意する正しいトークンの数
+VALID_TOKEN_VARIANTS = 100
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    rejected: int
+    elapsed: float
+    valid_latencies: list[float]
+    jwks_fetches: int
+
+
+async def verify_tokens(
+    verifier: CognitoTokenVerifierRepository,
+    tokens: list[tuple[str, bool]],
+    concurrency: int,
+) -> tuple[list[float], int]:
+    """(トークン, 正しいトークンか) を並行して検証し、正しいトークンのレイテンシと拒否した数を返す"""
+    queue = iter(tokens)
+    valid_latencies: list[float] = []
+    rejected = 0
+
+    async def worker() -> None:
+        nonlocal rejected
+        for token, is_valid in queue:
+            # キャッシュ済みの鍵での検証は他のコルーチンに切り替わらないため、リクエストごとに切り替える
+            await asyncio.sleep(0)
+            started_at = time.perf_counter()
+            try:
+                await verifier.verify(token)
+            except (ErrInvalidToken, ErrExpiredToken):
+                rejected += 1
+                if is_valid:
+                    raise
+                continue
+            if is_valid:
+                valid_latencies.append(time.perf_counter() - started_at)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return valid_latencies, rejected
+
+
+async def run_scenario(
+    name: str,
+    verifier: CognitoTokenVerifierRepository,
+    server: LocalJwksServer,
+    tokens: list[tuple[str, bool]],
+    concurrency: int,
+) -> ScenarioResult:
+    fetches_before = server.fetch_count
+    started_at = time.perf_counter()
+    valid_latencies, rejected = await verify_tokens(verifier, tokens, concurrency)
+    return ScenarioResult(
+        name=name,
+        requests=len(tokens),
+        rejected=rejected,
+        elapsed=time.perf_counter() - started_at,
+        valid_latencies=valid_latencies,
+        jwks_fetches=server.fetch_count - fetches_before,
+    )
+
+
+def _create_verifier(
+    http_session: aiohttp.ClientSession, jwks_url: str
+) -> CognitoTokenVerifierRepository:
+    return CognitoTokenVerifierRepository(
+        region="ap-northeast-1",
+        user_pool_id="local",
+        app_client_id=LOCAL_APP_CLIENT_ID,
+        http_session=http_session,
+        jwks_url=jwks_url,
+        issuer=LOCAL_ISSUER,
+    )
+
+
+def _mint_valid_tokens(key: LocalSigningKey, count: int) -> list[tuple[str, bool]]:
+    variants = [mint_access_token(key) for _ in range(VALID_TOKEN_VARIANTS)]
+    return [
+        (token, True) for token in itertools.islice(itertools.cycle(variants), count)
+    ]
+
+
+async def run(
+    requests: int, concurrency: int, jwks_latency_ms: float
+) -> list[ScenarioResult]:
+    server = LocalJwksServer(response_delay=jwks_latency_ms / 1000)
+    jwks_url = await server.start()
+    forged_tokens = mint_unknown_kid_tokens(requests)
+    results = []
+    try:
+        async with aiohttp.ClientSession() as http_session:
+            verifier = _create_verifier(http_session, jwks_url)
+            # 初回のJWKSの取得はシナリオに含めない
+            await verifier.verify(mint_access_token(server.signing_key))
+
+            results.append(
+                await run_scenario(
+                    "valid",
+                    verifier,
+                    server,
+                    _mint_valid_tokens(server.signing_key, requests),
+                    concurrency,
+                )
+            )
+
+            rotated_key = server.rotate()
+            results.append(
+                await run_scenario(
+                    "rotation",
+                    verifier,
+                    server,
+                    _mint_valid_tokens(rotated_key, requests),
+                    concurrency,
+                )
+            )
+
+            # rotation で再取得した直後のため、新しいインスタンスでJWKSを取得してから始める
+            verifier = _create_verifier(http_session, jwks_url)
+            await verifier.verify(mint_access_token(rotated_key))
+
+            # 不正なトークンと正しいトークンを交互に送る（不正なトークンの半分は最初のkidを繰り返す）
+            storm = [
+                pair
+                for i, (forged_token, valid) in enumerate(
+                    zip(forged_tokens, _mint_valid_tokens(rotated_key, requests))
+                )
+                for pair in (
+                    (forged_tokens[0] if i % 2 == 0 else forged_token, False),
+                    valid,
+                )
+            ]
+            results.append(
+                await run_scenario(
+                    "unknown_kid_storm", verifier, server, storm, concurrency
+                )
+            )
+    finally:
+        await server.close()
+    return results
+
+
+def _percentile_ms(latencies: list[float], percentile: int) -> float:
+    if len(latencies) < 2:
+        return latencies[0] * 1000 if latencies else 0.0
+    return (
+        statistics.quantiles(latencies, n=100, method="inclusive")[percentile - 1]
+        * 1000
+    )
+
+
+def print_results(results: list[ScenarioResult]) -> None:
+    print(
+        f"{'scenario':<20}{'requests':>10}{'rejected':>10}{'rps':>10}"
+        f"{'valid p50 ms':>14}{'valid p99 ms':>14}{'jwks fetches':>14}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<20}{result.requests:>10}{result.rejected:>10}"
+            f"{result.requests / result.elapsed:>10.0f}"
+            f"{_percentile_ms(result.valid_latencies, 50):>14.3f}"
+            f"{_percentile_ms(result.valid_latencies, 99):>14.3f}"
+            f"{result.jwks_fetches:>14}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0] if __doc__ else None
+    )
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--jwks-latency-ms", type=float, default=DEFAULT_JWKS_LATENCY_MS
+    )
+    args = parser.parse_args()
+
+    # 不正なトークンごとの警告ログを出力しない
+    logging.getLogger("infrastructure.cognito_token_verifier_repository").setLevel(
+        logging.CRITICAL
+    )
+    print_results(
+        asyncio.run(run(args.requests, args.concurrency, args.jwks_latency_ms))
+    )
+
+
+if __name__ == "__main__":
+    main()
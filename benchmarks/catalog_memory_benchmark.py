@@ -0,0 +1,90 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""画像のレコードをメモリに保持する表現のベンチマーク（行ごとの辞書 vs CompactLgtmImageStore）.
+
+100万件の (id, path, filename) を、行ごとのLgtmImageObject（TypedDict）のリストとして
+保持した場合と、CompactLgtmImageStoreに保持した場合のメモリ使用量（tracemalloc）と、
+1件をLgtmImageとして取り出す時間を比較する。
+
+実行方法: PYTHONPATH=src python -m benchmarks.catalog_memory_benchmark
+"""
+
+import gc
+import random
+import timeit
+import tracemalloc
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject, create_lgtm_image
+from infrastructure.compact_lgtm_image_store import CompactLgtmImageStore
+
+ROW_COUNT = 1_000_000
+BASE_URL = "lgtm-images.lgtmeow.com"
+ACCESS_COUNT = 100_000
+
+
+def _iter_rows() -> Iterator[tuple[int, str, str]]:
+    # DBから読み込んだ場合と同じく、行ごとに別の文字列オブジェクトを作成する
+    # 1時間あたり20件ずつ作成された画像とする
+    rng = random.Random(0)
+    started_at = datetime(2021, 3, 16)
+    for i in range(1, ROW_COUNT + 1):
+        yield (
+            i,
+            (started_at + timedelta(hours=i // 20)).strftime("%Y/%m/%d/%H"),
+            str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        )
+
+
+def _measure(build: Callable[[], Any]) -> tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    def build_dicts() -> list[LgtmImageObject]:
+        return [
+            LgtmImageObject(id=LgtmImageId(id_), path=path, filename=filename)
+            for id_, path, filename in _iter_rows()
+        ]
+
+    def build_store() -> CompactLgtmImageStore:
+        store = CompactLgtmImageStore()
+        for id_, path, filename in _iter_rows():
+            store.append(id_, path, filename)
+        return store
+
+    objects, dicts_size = _measure(build_dicts)
+    store, store_size = _measure(build_store)
+
+    positions = [random.randrange(ROW_COUNT) for _ in range(ACCESS_COUNT)]
+    dicts_time = timeit.timeit(
+        lambda: [create_lgtm_image(objects[p], BASE_URL) for p in positions], number=1
+    )
+    store_time = timeit.timeit(
+        lambda: [store.image_at(p, BASE_URL) for p in positions], number=1
+    )
+
+    print(f"rows={ROW_COUNT:,}")
+    print(f"{'representation':<24} {'MB':>8} {'bytes/row':>10} {'us/LgtmImage':>13}")
+    for name, size, elapsed in (
+        ("list[LgtmImageObject]", dicts_size, dicts_time),
+        ("CompactLgtmImageStore", store_size, store_time),
+    ):
+        print(
+            f"{name:<24} {size / 1e6:>8.1f} {size / ROW_COUNT:>10.1f} "
+            f"{elapsed / ACCESS_COUNT * 1e6:>13.2f}"
+        )
+    print(f"memory reduction: {dicts_size / store_size:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
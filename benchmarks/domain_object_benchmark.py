@@ -0,0 +1,190 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""ドメインオブジェクトの表現のベンチマーク（TypedDict vs NamedTuple）.
+
+LgtmImageObject・LgtmImageを改善前のTypedDict（インスタンスごとの辞書）と、現在の
+NamedTuple で比較する。
+
+- 1インスタンスあたりのメモリ使用量（tracemalloc、フィールドの値は共有して除外）
+- 1インスタンスの作成と属性の読み取りにかかる時間
+- DBの行から一覧レスポンスの本文（JSON）を作成するまでの1件あたりの時間
+  （改善前: TypedDict + レスポンスのモデルで検証・変換、現在: NamedTuple + 本文を直接作成）
+
+実行方法: PYTHONPATH=src python -m benchmarks.domain_object_benchmark
+"""
+
+import gc
+import timeit
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from typing import Any, Required, TypedDict
+
+from fastapi.responses import JSONResponse
+
+from domain.lgtm_image import LgtmImage, LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject, get_lgtm_image_url_factory
+from presentation.controller.lgtm_image_response import (
+    LgtmImageRandomListResponse,
+    create_lgtm_image_list_content,
+)
+from presentation.controller.response_helper import create_json_response
+
+BASE_URL = "lgtm-images.lgtmeow.com"
+INSTANCE_COUNT = 100_000
+ITERATIONS = 200_000
+ITEM_COUNTS = (9, 1000)
+# 1回の計測で処理する画像の件数の目安
+ITEMS_PER_MEASUREMENT = 200_000
+
+
+class LegacyLgtmImageObject(TypedDict):
+    """比較用: 改善前のLgtmImageObject"""
+
+    id: Required[LgtmImageId]
+    path: Required[str]
+    filename: Required[str]
+
+
+class LegacyLgtmImage(TypedDict):
+    """比較用: 改善前のLgtmImage"""
+
+    id: Required[str]
+    url: Required[str]
+
+
+Row = tuple[int, str, str]
+
+
+def _create_rows(count: int) -> list[Row]:
+    return [
+        (i, f"2021/03/16/{i % 24:02d}", str(uuid.UUID(int=i, version=4)))
+        for i in range(1, count + 1)
+    ]
+
+
+def _measure_memory(create: Callable[[int], object]) -> float:
+    """1インスタンスあたりのメモリ使用量（バイト）を返す"""
+    gc.collect()
+    tracemalloc.start()
+    instances = [create(i) for i in range(INSTANCE_COUNT)]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    # リスト自体（1要素あたり8バイト）は除く
+    return used / INSTANCE_COUNT - 8
+
+
+def _measure_ns(statement: Callable[[], object]) -> float:
+    """1回あたりの処理時間（ナノ秒）を返す"""
+    elapsed = min(timeit.repeat(statement, number=ITERATIONS, repeat=5))
+    return elapsed / ITERATIONS * 1_000_000_000
+
+
+def _legacy_body(rows: list[Row]) -> bytes:
+    prefix = f"https://{BASE_URL}/"
+    objects = [
+        LegacyLgtmImageObject(id=LgtmImageId(id_), path=path, filename=filename)
+        for id_, path, filename in rows
+    ]
+    images = [
+        LegacyLgtmImage(
+            id=str(obj["id"]), url=f"{prefix}{obj['path']}/{obj['filename']}.webp"
+        )
+        for obj in objects
+    ]
+    response = LgtmImageRandomListResponse.model_validate({"lgtmImages": images})
+    return bytes(create_json_response(response).body)
+
+
+def _current_body(rows: list[Row]) -> bytes:
+    create = get_lgtm_image_url_factory(BASE_URL).create
+    objects = [
+        LgtmImageObject(LgtmImageId(id_), path, filename)
+        for id_, path, filename in rows
+    ]
+    images = [create(obj) for obj in objects]
+    return bytes(JSONResponse(content=create_lgtm_image_list_content(images)).body)
+
+
+def _measure_body(build: Callable[[list[Row]], bytes], count: int) -> float:
+    """1件あたりの処理時間（マイクロ秒）を返す"""
+    rows = _create_rows(count)
+    number = max(ITEMS_PER_MEASUREMENT // count, 1)
+    elapsed = min(timeit.repeat(lambda: build(rows), number=number, repeat=5))
+    return elapsed / (number * count) * 1_000_000
+
+
+def main() -> None:
+    path = "2021/03/16/23"
+    filename = "5947f291-a46e-453c-a230-0d756d7174cb"
+    url = f"https://{BASE_URL}/{path}/{filename}.webp"
+    legacy_object = LegacyLgtmImageObject(
+        id=LgtmImageId(1), path=path, filename=filename
+    )
+    current_object = LgtmImageObject(LgtmImageId(1), path, filename)
+
+    measurements: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        (
+            "object create",
+            lambda: LegacyLgtmImageObject(
+                id=LgtmImageId(1), path=path, filename=filename
+            ),
+            lambda: LgtmImageObject(LgtmImageId(1), path, filename),
+        ),
+        (
+            "image create",
+            lambda: LegacyLgtmImage(id="1", url=url),
+            lambda: LgtmImage("1", url),
+        ),
+        (
+            "object read",
+            lambda: legacy_object["path"],
+            lambda: current_object.path,
+        ),
+    ]
+
+    print(f"{'memory':<14} {'typeddict B':>12} {'namedtuple B':>12} {'ratio':>7}")
+    legacy_bytes = _measure_memory(
+        lambda i: LegacyLgtmImageObject(id=LgtmImageId(i), path=path, filename=filename)
+    )
+    current_bytes = _measure_memory(
+        lambda i: LgtmImageObject(LgtmImageId(i), path, filename)
+    )
+    print(
+        f"{'object':<14} {legacy_bytes:>12.1f} {current_bytes:>12.1f} "
+        f"{legacy_bytes / current_bytes:>6.2f}x"
+    )
+
+    print()
+    print(
+        f"{'operation':<14} {'typeddict ns':>12} {'namedtuple ns':>12} {'speedup':>8}"
+    )
+    for name, legacy_statement, current_statement in measurements:
+        legacy_ns = _measure_ns(legacy_statement)
+        current_ns = _measure_ns(current_statement)
+        print(
+            f"{name:<14} {legacy_ns:>12.1f} {current_ns:>12.1f} "
+            f"{legacy_ns / current_ns:>7.2f}x"
+        )
+
+    # 改善前後で同じレスポンスになることを確認してから計測する
+    for count in ITEM_COUNTS:
+        rows = _create_rows(count)
+        assert _legacy_body(rows) == _current_body(rows)
+
+    print()
+    print(
+        f"{'rows -> body':<14} {'typeddict us':>12} {'namedtuple us':>12} {'speedup':>8}"
+    )
+    for count in ITEM_COUNTS:
+        legacy_us = _measure_body(_legacy_body, count)
+        current_us = _measure_body(_current_body, count)
+        print(
+            f"{f'{count} items':<14} {legacy_us:>12.3f} {current_us:>12.3f} "
+            f"{legacy_us / current_us:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
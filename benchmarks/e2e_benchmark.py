@@ -0,0 +1,399 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""全エンドポイントのエンドツーエンドのベンチマーク.
+
+main:app をインメモリのリポジトリ（benchmarks.fakes）に差し替えて起動し、プロセス内のASGIクライアント
+からリクエストを送信して、エンドポイントごとのレイテンシ（p50/p95/p99）とRPSを計測する。
+ミドルウェア・依存性注入・バリデーション・JSONへの変換を含めて計測し、DB・S3・Cognitoには
+接続しないため、オフラインで実行できる。
+
+計測結果はJSONのベースラインと比較し、--update-baseline を指定した場合はベースラインを更新する。
+ベースラインの値は計測したマシンに依存するため、同じマシンで計測した結果どうしを比較すること。
+
+実行方法:
+    PYTHONPATH=src python -m benchmarks.e2e_benchmark
+    PYTHONPATH=src python -m benchmarks.e2e_benchmark --update-baseline
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, TypedDict
+from urllib.parse import urlsplit
+
+from starlette.types import ASGIApp, Message
+
+from benchmarks.fakes import (
+    InMemoryLgtmImageRepository,
+    InMemoryObjectStorageRepository,
+    StaticJwtTokenVerifierRepository,
+    create_lgtm_image_objects,
+)
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baselines" / "e2e_benchmark.json"
+DEFAULT_IMAGE_COUNT = 10_000
+DEFAULT_REQUESTS = 2_000
+DEFAULT_WARMUP_REQUESTS = 100
+# ベースラインからこの割合を超えて悪化した場合に回帰とみなす
+DEFAULT_TOLERANCE = 0.2
+
+# 1x1ピクセルのPNG画像
+_PNG_IMAGE = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+
+
+class EndpointResult(TypedDict):
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    rps: float
+
+
+class BenchmarkResult(TypedDict):
+    config: dict[str, Any]
+    endpoints: dict[str, EndpointResult]
+
+
+@dataclass(frozen=True)
+class AsgiResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class AsgiClient:
+    """ASGIアプリケーションを直接呼び出すクライアント（ソケットを使わない）"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        body: bytes = b"",
+    ) -> AsgiResponse:
+        parts = urlsplit(url)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": parts.path,
+            "raw_path": parts.path.encode(),
+            "query_string": parts.query.encode(),
+            "root_path": "",
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in (headers or {}).items()
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("benchmark", 80),
+        }
+        request_sent = False
+        response_complete = asyncio.Event()
+        status = 0
+        response_headers: dict[str, str] = {}
+        chunks: list[bytes] = []
+
+        async def receive() -> Message:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # リクエストの本文を送信した後は、レスポンスを返し終えるまで切断を待たせる
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers.update(
+                    (name.decode(), value.decode())
+                    for name, value in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            response_complete.set()
+        return AsgiResponse(status, response_headers, b"".join(chunks))
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    url: str
+    expected_status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+
+def create_app(image_count: int) -> "FastAPI":
+    """リポジトリをインメモリの実装に差し替えた main:app を返す
+
+    lifespan は実行しないため、DB・S3・Cognitoへの接続は発生しない。
+    """
+    # main の読み込み時に必須の環境変数を検証するため、ダミーの値を設定する
+    os.environ.setdefault("COGNITO_USER_POOL_ID", "ap-northeast-1_benchmark")
+    os.environ.setdefault("COGNITO_APP_CLIENT_ID", "benchmark")
+    # リクエストごとのアクセスログを出力しない
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from config import get_random_sampler_mode
+    from infrastructure.random_id_sampler import create_random_id_sampler
+    from main import app
+    from presentation.dependencies.auth import create_token_verifier_repository
+    from presentation.router.lgtm_image_router import (
+        create_lgtm_image_repository,
+        create_object_storage_repository,
+        get_random_id_sampler,
+    )
+
+    repository = InMemoryLgtmImageRepository(create_lgtm_image_objects(image_count))
+    object_storage = InMemoryObjectStorageRepository()
+    token_verifier = StaticJwtTokenVerifierRepository()
+    sampler = create_random_id_sampler(get_random_sampler_mode())
+
+    app.dependency_overrides[create_lgtm_image_repository] = lambda: repository
+    app.dependency_overrides[create_object_storage_repository] = lambda: object_storage
+    app.dependency_overrides[create_token_verifier_repository] = lambda: token_verifier
+    app.dependency_overrides[get_random_id_sampler] = lambda: sampler
+    return app
+
+
+async def create_scenarios(client: AsgiClient) -> list[Scenario]:
+    """計測するリクエストの一覧を作成する（カーソル・ETagは実際のレスポンスから取得する）"""
+    auth = {"Authorization": "Bearer benchmark"}
+
+    first_page = await client.request("GET", "/lgtm-images?cursor=", auth)
+    next_cursor = json.loads(first_page.body)["nextCursor"]
+    seeded = await client.request("GET", "/lgtm-images?seed=42", auth)
+    recent = await client.request("GET", "/lgtm-images/recently-created", auth)
+    before = json.loads(recent.body)["nextCursor"]
+    ids = ",".join(str(i) for i in range(1, 10))
+    create_body = json.dumps(
+        {
+            "image": base64.b64encode(_PNG_IMAGE).decode(),
+            "imageExtension": ".png",
+        }
+    ).encode()
+
+    return [
+        Scenario("health_check", "GET", "/health-checks", 200),
+        Scenario("random", "GET", "/lgtm-images", 200, auth),
+        Scenario("random_limit_100", "GET", "/lgtm-images?limit=100", 200, auth),
+        Scenario(
+            "unseen_cursor", "GET", f"/lgtm-images?cursor={next_cursor}", 200, auth
+        ),
+        Scenario("seeded", "GET", "/lgtm-images?seed=42", 200, auth),
+        Scenario(
+            "seeded_not_modified",
+            "GET",
+            "/lgtm-images?seed=42",
+            304,
+            {**auth, "If-None-Match": seeded.headers["etag"]},
+        ),
+        Scenario("recently_created", "GET", "/lgtm-images/recently-created", 200, auth),
+        Scenario(
+            "recently_created_before",
+            "GET",
+            f"/lgtm-images/recently-created?before={before}",
+            200,
+            auth,
+        ),
+        Scenario("batch", "GET", f"/lgtm-images/batch?ids={ids}", 200, auth),
+        Scenario(
+            "create",
+            "POST",
+            "/lgtm-images",
+            202,
+            {**auth, "Content-Type": "application/json"},
+            create_body,
+        ),
+        Scenario("missing_authorization", "GET", "/lgtm-images", 422),
+    ]
+
+
+async def measure(
+    client: AsgiClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup_requests: int,
+) -> EndpointResult:
+    """同時に concurrency 件ずつリクエストを送信し、レイテンシとRPSを返す"""
+
+    async def send() -> float:
+        started_at = time.perf_counter()
+        response = await client.request(
+            scenario.method, scenario.url, scenario.headers, scenario.body
+        )
+        elapsed = time.perf_counter() - started_at
+        if response.status != scenario.expected_status:
+            raise RuntimeError(
+                f"{scenario.name}: expected {scenario.expected_status}, "
+                f"got {response.status}: {response.body[:200]!r}"
+            )
+        return elapsed
+
+    async def worker(count: int) -> list[float]:
+        return [await send() for _ in range(count)]
+
+    await worker(warmup_requests)
+
+    per_worker = [
+        requests // concurrency + (1 if i < requests % concurrency else 0)
+        for i in range(concurrency)
+    ]
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*(worker(count) for count in per_worker))
+    elapsed = time.perf_counter() - started_at
+
+    latencies = [latency for result in results for latency in result]
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return EndpointResult(
+        p50_ms=round(percentiles[49] * 1000, 4),
+        p95_ms=round(percentiles[94] * 1000, 4),
+        p99_ms=round(percentiles[98] * 1000, 4),
+        rps=round(len(latencies) / elapsed, 1),
+    )
+
+
+async def run(
+    image_count: int, requests: int, concurrency: int, warmup_requests: int
+) -> BenchmarkResult:
+    client = AsgiClient(create_app(image_count))
+    endpoints: dict[str, EndpointResult] = {}
+    for scenario in await create_scenarios(client):
+        endpoints[scenario.name] = await measure(
+            client, scenario, requests, concurrency, warmup_requests
+        )
+    return BenchmarkResult(
+        config={
+            "images": image_count,
+            "requests": requests,
+            "concurrency": concurrency,
+            "python": platform.python_version(),
+        },
+        endpoints=endpoints,
+    )
+
+
+def find_regressions(
+    result: BenchmarkResult, baseline: BenchmarkResult, tolerance: float
+) -> list[str]:
+    """ベースラインより p95 が tolerance を超えて遅い、または RPS が下がったエンドポイントを返す"""
+    regressions = []
+    for name, current in result["endpoints"].items():
+        previous = baseline["endpoints"].get(name)
+        if previous is None:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance) or current[
+            "rps"
+        ] < previous["rps"] / (1 + tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def _format_change(current: float, previous: Optional[float]) -> str:
+    if previous is None or previous == 0:
+        return "-"
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def print_result(
+    result: BenchmarkResult,
+    baseline: Optional[BenchmarkResult],
+    regressions: list[str],
+) -> None:
+    print(
+        f"{'endpoint':<24} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rps':>9}"
+        f" {'p95 vs base':>12} {'rps vs base':>12}"
+    )
+    for name, current in result["endpoints"].items():
+        previous = baseline["endpoints"].get(name) if baseline else None
+        mark = "  REGRESSION" if name in regressions else ""
+        print(
+            f"{name:<24} {current['p50_ms']:>8.3f} {current['p95_ms']:>8.3f}"
+            f" {current['p99_ms']:>8.3f} {current['rps']:>9.1f}"
+            f" {_format_change(current['p95_ms'], previous and previous['p95_ms']):>12}"
+            f" {_format_change(current['rps'], previous and previous['rps']):>12}{mark}"
+        )
+
+
+def load_baseline(path: Path) -> Optional[BenchmarkResult]:
+    if not path.exists():
+        return None
+    baseline: BenchmarkResult = json.loads(path.read_text())
+    return baseline
+
+
+def save_baseline(path: Path, result: BenchmarkResult) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0] if __doc__ else None
+    )
+    parser.add_argument("--images", type=int, default=DEFAULT_IMAGE_COUNT)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP_REQUESTS)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="計測結果でベースラインを上書きする",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="ベースラインより悪化したエンドポイントがある場合は終了コード1で終了する",
+    )
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.images, args.requests, args.concurrency, args.warmup))
+    baseline = load_baseline(args.baseline)
+    # 条件の異なるベースラインとは比較しない
+    if baseline is not None and baseline["config"] != result["config"]:
+        print(
+            f"Baseline was measured with {baseline['config']}, skipping comparison",
+            file=sys.stderr,
+        )
+        baseline = None
+    regressions = find_regressions(result, baseline, args.tolerance) if baseline else []
+    print_result(result, baseline, regressions)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, result)
+        print(f"Baseline saved to {args.baseline}")
+    elif args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""ベンチマーク用のリポジトリのインメモリ実装（DB・S3・Cognitoに接続しない）."""
+
+import bisect
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from domain.create_lgtm_image import UploadObjectStorageDto
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
+
+
+def create_lgtm_image_objects(count: int) -> list[LgtmImageObject]:
+    """1時間あたり20件ずつ作成された画像を、IDの昇順（作成日時の昇順）で返す"""
+    started_at = datetime(2021, 3, 16)
+    return [
+        LgtmImageObject(
+            LgtmImageId(i),
+            (started_at + timedelta(hours=i // 20)).strftime("%Y/%m/%d/%H"),
+            str(uuid.UUID(int=i, version=4)),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+class InMemoryLgtmImageRepository:
+    """LgtmImageRepositoryInterface のインメモリ実装
+
+    画像はIDの昇順に作成されたものとして、作成日時の降順はIDの降順とする。
+    """
+
+    def __init__(self, lgtm_image_objects: list[LgtmImageObject]) -> None:
+        self._objects = sorted(lgtm_image_objects, key=lambda obj: obj.id)
+        self._objects_by_id = {obj.id: obj for obj in self._objects}
+        self._ids = [obj.id for obj in self._objects]
+
+    async def find_all_ids(self) -> list[LgtmImageId]:
+        return self._ids
+
+    async def find_by_ids(self, ids: list[LgtmImageId]) -> list[LgtmImageObject]:
+        return [
+            self._objects_by_id[id_]
+            for id_ in dict.fromkeys(ids)
+            if id_ in self._objects_by_id
+        ]
+
+    async def find_recently_created(
+        self, limit: int, before: Optional[LgtmImageId] = None
+    ) -> list[LgtmImageObject]:
+        if before is None:
+            end = len(self._ids)
+        elif before in self._objects_by_id:
+            end = bisect.bisect_left(self._ids, before)
+        else:
+            # LgtmImageRepository と同じく、カーソルの画像が存在しない場合は空のリストを返す
+            return []
+        return self._objects[max(end - limit, 0) : end][::-1]
+
+
+class InMemoryObjectStorageRepository:
+    """ObjectStorageRepositoryInterface のインメモリ実装（アップロードしたキーだけを保持する）"""
+
+    def __init__(self) -> None:
+        self.uploaded_keys: list[str] = []
+
+    async def upload(self, param: UploadObjectStorageDto) -> None:
+        self.uploaded_keys.append(param.key)
+
+
+class StaticJwtTokenVerifierRepository:
+    """JwtTokenVerifierRepositoryInterface のインメモリ実装（常に同じペイロードを返す）"""
+
+    def __init__(self, payload: Optional[dict[str, Any]] = None) -> None:
+        self._payload = payload or {"sub": "benchmark", "token_use": "access"}
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        return self._payload
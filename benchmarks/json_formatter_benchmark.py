@@ -0,0 +1,110 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""JsonFormatterのマイクロベンチマーク.
+
+実行方法: PYTHONPATH=src python -m benchmarks.json_formatter_benchmark
+"""
+
+import json
+import logging
+import timeit
+import traceback
+from datetime import datetime, timezone
+from typing import Any
+
+from log.formatter import JsonFormatter, get_json_encoder
+
+ITERATIONS = 100_000
+
+
+class LegacyJsonFormatter(logging.Formatter):
+    """比較用: 改善前のJsonFormatter"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        if hasattr(record, "request_id"):
+            log_data["request_id"] = record.request_id
+
+        for key, value in record.__dict__.items():
+            if key not in [
+                "name",
+                "msg",
+                "args",
+                "created",
+                "filename",
+                "funcName",
+                "levelname",
+                "levelno",
+                "lineno",
+                "module",
+                "msecs",
+                "message",
+                "pathname",
+                "process",
+                "processName",
+                "relativeCreated",
+                "thread",
+                "threadName",
+                "exc_info",
+                "exc_text",
+                "stack_info",
+                "request_id",
+            ]:
+                log_data[key] = value
+
+        if record.exc_info:
+            log_data["traceback"] = "".join(
+                traceback.format_exception(*record.exc_info)
+            )
+
+        return json.dumps(log_data, ensure_ascii=False, default=str)
+
+
+def _create_record() -> logging.LogRecord:
+    record = logging.getLogger("benchmark").makeRecord(
+        "benchmark",
+        logging.INFO,
+        __file__,
+        1,
+        "Found LGTM images",
+        (),
+        None,
+        extra={"count": 9, "method": "GET", "path": "/lgtm-images"},
+    )
+    setattr(record, "request_id", "5947f291-a46e-453c-a230-0d756d7174cb")
+    return record
+
+
+def _measure(formatter: logging.Formatter, record: logging.LogRecord) -> float:
+    """1レコードあたりの処理時間（マイクロ秒）を返す"""
+    elapsed = min(
+        timeit.repeat(lambda: formatter.format(record), number=ITERATIONS, repeat=5)
+    )
+    return elapsed / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    record = _create_record()
+    formatters: list[tuple[str, logging.Formatter]] = [
+        ("legacy", LegacyJsonFormatter()),
+        ("json", JsonFormatter(encoder=get_json_encoder("json"))),
+        ("orjson", JsonFormatter(encoder=get_json_encoder("orjson"))),
+    ]
+
+    baseline = _measure(formatters[0][1], record)
+    print(f"{'formatter':<10} {'us/record':>10} {'speedup':>8}")
+    for name, formatter in formatters:
+        per_record = baseline if name == "legacy" else _measure(formatter, record)
+        print(f"{name:<10} {per_record:>10.3f} {baseline / per_record:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
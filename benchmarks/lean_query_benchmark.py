@@ -0,0 +1,100 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""LGTM画像の読み取りクエリのベンチマーク（ORMエンティティ vs カラム射影）.
+
+インメモリSQLiteに行を挿入し、同じ行をORMエンティティとして取得した場合と、
+LgtmImageRepository.find_by_ids（必要な3カラムだけを取得してLgtmImageObjectに変換する）で
+取得した場合の処理速度（rows/sec）を比較する。
+
+実行方法: PYTHONPATH=src python -m benchmarks.lean_query_benchmark
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from tests.fixtures.sqlite_database import (
+    create_sqlite_database_engine,
+    insert_lgtm_image_rows,
+)
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
+from infrastructure.lgtm_image_repository import (
+    FIND_BY_IDS_CHUNK_SIZE,
+    LgtmImageRepository,
+)
+from infrastructure.models import LgtmImageModel
+
+ROW_COUNTS = (1_000, 100_000)
+REPEAT = 5
+
+
+async def _read_orm_entities(
+    session: AsyncSession, ids: list[LgtmImageId]
+) -> list[LgtmImageObject]:
+    """比較用: 改善前のORMエンティティを生成する読み取り（find_by_ids と同じ件数ずつ取得する）"""
+    image_objects: list[LgtmImageObject] = []
+    for start in range(0, len(ids), FIND_BY_IDS_CHUNK_SIZE):
+        chunk = [int(id_) for id_ in ids[start : start + FIND_BY_IDS_CHUNK_SIZE]]
+        result = await session.execute(
+            select(LgtmImageModel).where(LgtmImageModel.id.in_(chunk))
+        )
+        image_objects.extend(
+            LgtmImageObject(
+                id=LgtmImageId(model.id), path=model.path, filename=model.filename
+            )
+            for model in result.scalars()
+        )
+    return image_objects
+
+
+async def _read_columns(
+    session: AsyncSession, ids: list[LgtmImageId]
+) -> list[LgtmImageObject]:
+    return await LgtmImageRepository(session).find_by_ids(ids)
+
+
+async def _measure(
+    engine: AsyncEngine,
+    read: Callable[[AsyncSession, list[LgtmImageId]], Awaitable[list[LgtmImageObject]]],
+    row_count: int,
+) -> float:
+    """1秒あたりに変換できた行数を返す（identity mapの影響を避けるため毎回新しいセッションを使う）"""
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+    ids = [LgtmImageId(id_) for id_ in range(1, row_count + 1)]
+    best = float("inf")
+    for _ in range(REPEAT):
+        async with session_factory() as session:
+            started_at = time.perf_counter()
+            objects = await read(session, ids)
+            best = min(best, time.perf_counter() - started_at)
+        assert len(objects) == row_count
+    return row_count / best
+
+
+async def run() -> None:
+    print(f"{'rows':>8} {'query':<8} {'rows/sec':>12} {'speedup':>8}")
+    for row_count in ROW_COUNTS:
+        engine = await create_sqlite_database_engine()
+        try:
+            await insert_lgtm_image_rows(engine, row_count)
+            baseline = await _measure(engine, _read_orm_entities, row_count)
+            lean = await _measure(engine, _read_columns, row_count)
+        finally:
+            await engine.dispose()
+        print(f"{row_count:>8} {'orm':<8} {baseline:>12,.0f} {1:>7.2f}x")
+        print(f"{row_count:>8} {'columns':<8} {lean:>12,.0f} {lean / baseline:>7.2f}x")
+
+
+def main() -> None:
+    # 読み取りごとのリポジトリのログを出力しない
+    logging.getLogger("infrastructure.lgtm_image_repository").setLevel(logging.CRITICAL)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
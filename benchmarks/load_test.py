@@ -0,0 +1,632 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""ローカルのスタックに対する負荷試験.
+
+compose.yml の loadtest プロファイル（API・MySQL・S3互換のMinIO・JWKSを配信するサーバー）に対して、
+本番に近い割合でリクエストを送信し、スループット・レイテンシのヒストグラム・エラー率と
+APIのメモリ使用量（RSS）の推移を記録する。FargateのCPU・メモリのサイズを決めるための計測に使う。
+
+認証にはローカルで作成したRSA鍵で署名したJWTを使う（benchmarks.local_jwt）。
+
+実行方法:
+    PYTHONPATH=src python -m benchmarks.load_test keys
+    PYTHONPATH=src python -m benchmarks.load_test seed --images 100000
+    PYTHONPATH=src python -m benchmarks.load_test run --duration 300 --concurrency 32 \\
+        --rss-container lgtm-cat-load-test-app --output load-test-report.json
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Final, Optional, TypedDict
+
+import aiohttp
+from sqlalchemy import insert, text
+
+from benchmarks.fakes import create_lgtm_image_objects
+from benchmarks.local_jwt import (
+    LOCAL_APP_CLIENT_ID,
+    LOCAL_ISSUER,
+    LocalSigningKey,
+    mint_access_token,
+    mint_unknown_kid_tokens,
+    read_signing_key,
+    write_signing_key,
+)
+from config import get_database_ssl
+from infrastructure.database import (
+    DatabasePoolSettings,
+    create_database_engine,
+    get_database_url,
+)
+from infrastructure.models import Base, LgtmImageModel
+from metrics.registry import Histogram, HistogramSnapshot
+
+DEFAULT_KEYS_DIR: Final[Path] = Path(".loadtest")
+DEFAULT_BASE_URL: Final[str] = "http://127.0.0.1:8000"
+SCENARIO_NAMES: Final[tuple[str, ...]] = (
+    "random",
+    "recently_created",
+    "create",
+    "unknown_kid",
+)
+# 2xx以外を成功とみなすシナリオ（JWKSにないkidのトークンは401で拒否される）
+EXPECTED_STATUS: Final[dict[str, str]] = {"unknown_kid": "401"}
+# 本番のアクセスの大半はランダム画像の取得で、画像の作成はまれ
+DEFAULT_MIX: Final[str] = "random=90,recently_created=9,create=1"
+DEFAULT_UPLOAD_SIZE_MB: Final[str] = "1-5"
+DEFAULT_SEED_IMAGE_COUNT: Final[int] = 100_000
+SEED_BATCH_SIZE: Final[int] = 5_000
+# アップロードする画像のパターン数（リクエストごとにbase64エンコードしないように事前に作成する）
+UPLOAD_PAYLOAD_VARIANTS: Final[int] = 8
+# JWKSにないkidのトークンの数（kidごとにAPIがJWKSを再取得する）
+UNKNOWN_KID_TOKEN_VARIANTS: Final[int] = 1000
+
+# レイテンシのヒストグラムのバケット（上限値、秒）
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.15,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_PNG_SIGNATURE: Final[bytes] = b"\x89PNG\r\n\x1a\n"
+
+
+class ScenarioReport(TypedDict):
+    requests: int
+    errors: int
+    error_rate: float
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    status_codes: dict[str, int]
+    latency_histogram: HistogramSnapshot
+
+
+class IntervalReport(TypedDict):
+    elapsed_seconds: float
+    requests: int
+    errors: int
+    rps: float
+    p95_ms: float
+    rss_mb: Optional[float]
+
+
+class LoadTestReport(TypedDict):
+    config: dict[str, Any]
+    duration_seconds: float
+    requests: int
+    errors: int
+    error_rate: float
+    rps: float
+    scenarios: dict[str, ScenarioReport]
+    intervals: list[IntervalReport]
+    peak_rss_mb: Optional[float]
+
+
+@dataclass
+class ScenarioStats:
+    histogram: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    latencies: list[float] = field(default_factory=list)
+    status_codes: dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+
+    def record(self, status: str, elapsed: float, is_error: bool) -> None:
+        self.histogram.observe(elapsed)
+        self.latencies.append(elapsed)
+        self.status_codes[status] = self.status_codes.get(status, 0) + 1
+        if is_error:
+            self.errors += 1
+
+
+@dataclass
+class IntervalStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+Scenario = Callable[[aiohttp.ClientSession], Awaitable[int]]
+
+
+def is_expected_status(scenario: str, status: str) -> bool:
+    expected = EXPECTED_STATUS.get(scenario)
+    return status == expected if expected else status.startswith("2")
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    """シナリオごとの割合（例: random=90,recently_created=9,create=1）を解析する"""
+    weights: dict[str, int] = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in SCENARIO_NAMES or not weight.strip().isdigit():
+            raise ValueError(f"Invalid mix entry: {item}")
+        weights[name.strip()] = int(weight)
+    if sum(weights.values()) <= 0:
+        raise ValueError("Mix must have at least one positive weight")
+    return weights
+
+
+def parse_size_range_mb(size_range: str) -> tuple[int, int]:
+    """MB単位の範囲（例: 1-5）をバイト数の範囲に変換する"""
+    low, _, high = size_range.partition("-")
+    low_mb = float(low)
+    high_mb = float(high or low)
+    if low_mb <= 0 or high_mb < low_mb:
+        raise ValueError(f"Invalid size range: {size_range}")
+    return int(low_mb * 1024 * 1024), int(high_mb * 1024 * 1024)
+
+
+def create_upload_payloads(size_range: tuple[int, int], count: int) -> list[bytes]:
+    """指定した範囲の大きさの画像を作成するリクエストボディ（JSON）を作成する
+
+    APIは画像の中身を検証しないため、PNGのシグネチャに乱数を続けたものを画像として送信する。
+    """
+    payloads = []
+    for _ in range(count):
+        size = random.randint(*size_range)
+        image = _PNG_SIGNATURE + os.urandom(size - len(_PNG_SIGNATURE))
+        payloads.append(
+            json.dumps(
+                {
+                    "image": base64.b64encode(image).decode(),
+                    "imageExtension": ".png",
+                }
+            ).encode()
+        )
+    return payloads
+
+
+def create_scenarios(
+    base_url: str,
+    token: str,
+    upload_payloads: list[bytes],
+    unknown_kid_tokens: list[str],
+) -> dict[str, Scenario]:
+    authorization = {"Authorization": f"Bearer {token}"}
+    upload_headers = {**authorization, "Content-Type": "application/json"}
+
+    async def get(
+        session: aiohttp.ClientSession,
+        path: str,
+        headers: dict[str, str] = authorization,
+    ) -> int:
+        async with session.get(f"{base_url}{path}", headers=headers) as response:
+            await response.read()
+            return response.status
+
+    async def random_images(session: aiohttp.ClientSession) -> int:
+        return await get(session, "/lgtm-images")
+
+    async def recently_created(session: aiohttp.ClientSession) -> int:
+        return await get(session, "/lgtm-images/recently-created")
+
+    async def create(session: aiohttp.ClientSession) -> int:
+        async with session.post(
+            f"{base_url}/lgtm-images",
+            data=random.choice(upload_payloads),
+            headers=upload_headers,
+        ) as response:
+            await response.read()
+            return response.status
+
+    async def unknown_kid(session: aiohttp.ClientSession) -> int:
+        token = random.choice(unknown_kid_tokens)
+        return await get(session, "/lgtm-images", {"Authorization": f"Bearer {token}"})
+
+    return {
+        "random": random_images,
+        "recently_created": recently_created,
+        "create": create,
+        "unknown_kid": unknown_kid,
+    }
+
+
+async def read_rss_mb(pids: list[int], container: Optional[str]) -> Optional[float]:
+    """APIのプロセス（複数の場合は合計）またはコンテナのメモリ使用量をMB単位で返す"""
+    if container:
+        process = await asyncio.create_subprocess_exec(
+            "docker",
+            "stats",
+            "--no-stream",
+            "--format",
+            "{{.MemUsage}}",
+            container,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        # 例: "123.4MiB / 512MiB"
+        return _parse_memory_usage_mb(stdout.decode().split("/")[0].strip())
+    if not pids:
+        return None
+
+    total_kb = 0
+    for pid in pids:
+        try:
+            status = Path(f"/proc/{pid}/status").read_text()
+        except OSError:
+            return None
+        for line in status.splitlines():
+            if line.startswith("VmRSS:"):
+                total_kb += int(line.split()[1])
+    return round(total_kb / 1024, 1)
+
+
+def _parse_memory_usage_mb(value: str) -> Optional[float]:
+    units = {"KiB": 1 / 1024, "MiB": 1.0, "GiB": 1024.0, "kB": 1 / 1000, "MB": 1.0}
+    for unit, factor in units.items():
+        if value.endswith(unit):
+            try:
+                return round(float(value[: -len(unit)]) * factor, 1)
+            except ValueError:
+                return None
+    return None
+
+
+def _percentile_ms(latencies: list[float], percentile: int) -> float:
+    if not latencies:
+        return 0.0
+    if len(latencies) == 1:
+        return round(latencies[0] * 1000, 2)
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return round(quantiles[percentile - 1] * 1000, 2)
+
+
+class LoadGenerator:
+    """指定した割合でシナリオを選び、一定時間リクエストを送信し続ける
+
+    rate を指定した場合は全体で毎秒 rate 件になるように送信間隔を空ける（オープンループ）。
+    指定しない場合は concurrency 件のリクエストを送信し続ける（クローズドループ）。
+    """
+
+    def __init__(
+        self,
+        scenarios: dict[str, Scenario],
+        mix: dict[str, int],
+        concurrency: int,
+        rate: Optional[float] = None,
+    ) -> None:
+        self._scenarios = scenarios
+        self._names = list(mix)
+        self._weights = [mix[name] for name in self._names]
+        self._concurrency = concurrency
+        self._rate = rate
+        self._next_send_at = 0.0
+        self.stats = {name: ScenarioStats() for name in self._names}
+        self.interval = IntervalStats()
+
+    async def run(self, session: aiohttp.ClientSession, duration: float) -> None:
+        deadline = time.perf_counter() + duration
+        self._next_send_at = time.perf_counter()
+        await asyncio.gather(
+            *(self._worker(session, deadline) for _ in range(self._concurrency))
+        )
+
+    def take_interval(self) -> IntervalStats:
+        interval, self.interval = self.interval, IntervalStats()
+        return interval
+
+    async def _wait_for_slot(self) -> None:
+        if self._rate is None:
+            return
+        send_at = self._next_send_at
+        self._next_send_at = max(send_at, time.perf_counter()) + 1 / self._rate
+        delay = send_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _worker(self, session: aiohttp.ClientSession, deadline: float) -> None:
+        while True:
+            await self._wait_for_slot()
+            if time.perf_counter() >= deadline:
+                return
+            name = random.choices(self._names, self._weights)[0]
+            started_at = time.perf_counter()
+            try:
+                status = str(await self._scenarios[name](session))
+                is_error = not is_expected_status(name, status)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status = type(e).__name__
+                is_error = True
+            elapsed = time.perf_counter() - started_at
+            self.stats[name].record(status, elapsed, is_error)
+            self.interval.latencies.append(elapsed)
+            if is_error:
+                self.interval.errors += 1
+
+
+async def run_load_test(
+    base_url: str,
+    token: str,
+    unknown_kid_tokens: list[str],
+    mix: dict[str, int],
+    duration: float,
+    concurrency: int,
+    rate: Optional[float],
+    upload_size_range: tuple[int, int],
+    report_interval: float,
+    rss_pids: list[int],
+    rss_container: Optional[str],
+) -> LoadTestReport:
+    upload_payloads = (
+        create_upload_payloads(upload_size_range, UPLOAD_PAYLOAD_VARIANTS)
+        if mix.get("create")
+        else []
+    )
+    generator = LoadGenerator(
+        create_scenarios(base_url, token, upload_payloads, unknown_kid_tokens),
+        mix,
+        concurrency,
+        rate,
+    )
+    intervals: list[IntervalReport] = []
+
+    async def report_periodically(started_at: float) -> None:
+        while True:
+            await asyncio.sleep(report_interval)
+            interval = generator.take_interval()
+            rss_mb = await read_rss_mb(rss_pids, rss_container)
+            report = IntervalReport(
+                elapsed_seconds=round(time.perf_counter() - started_at, 1),
+                requests=len(interval.latencies),
+                errors=interval.errors,
+                rps=round(len(interval.latencies) / report_interval, 1),
+                p95_ms=_percentile_ms(interval.latencies, 95),
+                rss_mb=rss_mb,
+            )
+            intervals.append(report)
+            print(
+                f"[{report['elapsed_seconds']:>7.1f}s] "
+                f"rps={report['rps']:>8.1f} p95={report['p95_ms']:>8.2f}ms "
+                f"errors={report['errors']:>5} rss={rss_mb if rss_mb is not None else '-'}MB",
+                flush=True,
+            )
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        started_at = time.perf_counter()
+        reporter = asyncio.create_task(report_periodically(started_at))
+        try:
+            await generator.run(session, duration)
+        finally:
+            reporter.cancel()
+        elapsed = time.perf_counter() - started_at
+
+    scenarios: dict[str, ScenarioReport] = {}
+    for name, stats in generator.stats.items():
+        count = len(stats.latencies)
+        scenarios[name] = ScenarioReport(
+            requests=count,
+            errors=stats.errors,
+            error_rate=round(stats.errors / count, 4) if count else 0.0,
+            rps=round(count / elapsed, 1),
+            p50_ms=_percentile_ms(stats.latencies, 50),
+            p95_ms=_percentile_ms(stats.latencies, 95),
+            p99_ms=_percentile_ms(stats.latencies, 99),
+            max_ms=round(max(stats.latencies, default=0.0) * 1000, 2),
+            status_codes=stats.status_codes,
+            latency_histogram=stats.histogram.snapshot(),
+        )
+    total = sum(report["requests"] for report in scenarios.values())
+    errors = sum(report["errors"] for report in scenarios.values())
+    rss_values = [i["rss_mb"] for i in intervals if i["rss_mb"] is not None]
+    return LoadTestReport(
+        config={
+            "base_url": base_url,
+            "mix": mix,
+            "duration": duration,
+            "concurrency": concurrency,
+            "rate": rate,
+            "upload_size_bytes": list(upload_size_range),
+        },
+        duration_seconds=round(elapsed, 1),
+        requests=total,
+        errors=errors,
+        error_rate=round(errors / total, 4) if total else 0.0,
+        rps=round(total / elapsed, 1),
+        scenarios=scenarios,
+        intervals=intervals,
+        peak_rss_mb=max(rss_values, default=None),
+    )
+
+
+def print_report(report: LoadTestReport) -> None:
+    print()
+    print(
+        f"{'scenario':<18}{'requests':>10}{'rps':>10}{'errors':>9}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    )
+    for name, scenario in report["scenarios"].items():
+        print(
+            f"{name:<18}{scenario['requests']:>10}{scenario['rps']:>10.1f}"
+            f"{scenario['error_rate']:>9.2%}{scenario['p50_ms']:>10.2f}"
+            f"{scenario['p95_ms']:>10.2f}{scenario['p99_ms']:>10.2f}"
+            f"{scenario['max_ms']:>10.2f}"
+        )
+    print(
+        f"{'total':<18}{report['requests']:>10}{report['rps']:>10.1f}"
+        f"{report['error_rate']:>9.2%}"
+    )
+    for name, scenario in report["scenarios"].items():
+        non_success = {
+            status: count
+            for status, count in scenario["status_codes"].items()
+            if not is_expected_status(name, status)
+        }
+        if non_success:
+            print(f"{name} errors: {non_success}")
+    if report["peak_rss_mb"] is not None:
+        print(f"peak RSS: {report['peak_rss_mb']} MB")
+
+
+async def seed_lgtm_images(image_count: int) -> None:
+    """DATABASE_* の環境変数で指定したDBにテーブルを作成し、画像のレコードを登録する
+
+    データベースが存在しない場合は作成する。既存のレコードは削除してから登録する。
+    """
+    database_url = get_database_url()
+    server_engine = create_database_engine(
+        database_url.set(database=None),
+        DatabasePoolSettings(pool_size=1, max_overflow=0),
+        ssl=get_database_ssl(),
+    )
+    try:
+        async with server_engine.begin() as conn:
+            await conn.execute(
+                text(f"CREATE DATABASE IF NOT EXISTS `{database_url.database}`")
+            )
+    finally:
+        await server_engine.dispose()
+
+    engine = create_database_engine(
+        database_url,
+        DatabasePoolSettings(pool_size=1, max_overflow=0),
+        ssl=get_database_ssl(),
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(text("DELETE FROM lgtm_images"))
+            objects = create_lgtm_image_objects(image_count)
+            started_at = datetime(2021, 3, 16)
+            for start in range(0, image_count, SEED_BATCH_SIZE):
+                await conn.execute(
+                    insert(LgtmImageModel),
+                    [
+                        {
+                            "id": obj.id,
+                            "path": obj.path,
+                            "filename": obj.filename,
+                            "created_at": started_at + timedelta(hours=obj.id // 20),
+                            "updated_at": started_at + timedelta(hours=obj.id // 20),
+                        }
+                        for obj in objects[start : start + SEED_BATCH_SIZE]
+                    ],
+                )
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0] if __doc__ else None
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    keys_parser = subparsers.add_parser(
+        "keys", help="署名用の鍵とAPIに配信するJWKSを作成する"
+    )
+    keys_parser.add_argument("--keys-dir", type=Path, default=DEFAULT_KEYS_DIR)
+    keys_parser.add_argument(
+        "--rotate",
+        action="store_true",
+        help="古い公開鍵をJWKSに残したまま新しい鍵を追加し、以降は新しい鍵で署名する",
+    )
+
+    seed_parser = subparsers.add_parser(
+        "seed", help="DATABASE_* で指定したDBに画像のレコードを登録する"
+    )
+    seed_parser.add_argument("--images", type=int, default=DEFAULT_SEED_IMAGE_COUNT)
+
+    run_parser = subparsers.add_parser("run", help="負荷をかけて結果を出力する")
+    run_parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    run_parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"シナリオごとの割合（{', '.join(SCENARIO_NAMES)}）",
+    )
+    run_parser.add_argument("--duration", type=float, default=60.0)
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument(
+        "--rate", type=float, help="毎秒のリクエスト数（未指定の場合は上限なし）"
+    )
+    run_parser.add_argument(
+        "--upload-size-mb",
+        default=DEFAULT_UPLOAD_SIZE_MB,
+        help="作成する画像の大きさの範囲（MB）",
+    )
+    run_parser.add_argument("--report-interval", type=float, default=5.0)
+    run_parser.add_argument("--keys-dir", type=Path, default=DEFAULT_KEYS_DIR)
+    run_parser.add_argument("--issuer", default=LOCAL_ISSUER)
+    run_parser.add_argument("--client-id", default=LOCAL_APP_CLIENT_ID)
+    run_parser.add_argument(
+        "--rss-pid",
+        type=int,
+        action="append",
+        default=[],
+        help="RSSを記録するAPIのプロセスID（複数指定した場合は合計）",
+    )
+    run_parser.add_argument(
+        "--rss-container", help="メモリ使用量を記録するAPIのコンテナ名"
+    )
+    run_parser.add_argument("--output", type=Path, help="結果を書き出すJSONファイル")
+    args = parser.parse_args()
+
+    if args.command == "keys":
+        key = LocalSigningKey.generate()
+        write_signing_key(args.keys_dir, key, rotate=args.rotate)
+        print(f"Signing key {key.kid} written to {args.keys_dir}")
+    elif args.command == "seed":
+        asyncio.run(seed_lgtm_images(args.images))
+        print(f"Seeded {args.images} images")
+    else:
+        token = mint_access_token(
+            read_signing_key(args.keys_dir),
+            issuer=args.issuer,
+            app_client_id=args.client_id,
+            expires_in=int(args.duration) + 3600,
+        )
+        mix = parse_mix(args.mix)
+        unknown_kid_tokens = (
+            mint_unknown_kid_tokens(
+                UNKNOWN_KID_TOKEN_VARIANTS, args.issuer, args.client_id
+            )
+            if mix.get("unknown_kid")
+            else []
+        )
+        report = asyncio.run(
+            run_load_test(
+                base_url=args.base_url.rstrip("/"),
+                token=token,
+                unknown_kid_tokens=unknown_kid_tokens,
+                mix=mix,
+                duration=args.duration,
+                concurrency=args.concurrency,
+                rate=args.rate,
+                upload_size_range=parse_size_range_mb(args.upload_size_mb),
+                report_interval=args.report_interval,
+                rss_pids=args.rss_pid,
+                rss_container=args.rss_container,
+            )
+        )
+        print_report(report)
+        if args.output:
+            args.output.write_text(json.dumps(report, indent=2))
+            print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
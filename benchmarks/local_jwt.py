@@ -0,0 +1,189 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""ローカルで署名したJWTを発行する（負荷試験・ベンチマーク用）
+
+Cognitoの代わりにローカルで作成したRSA鍵でトークンに署名し、公開鍵をJWKSの形式で書き出す
+（または LocalJwksServer で配信する）。API側は COGNITO_JWKS_URL と COGNITO_ISSUER で
+このJWKSと発行者を指定して検証する。
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Final
+
+from aiohttp import web
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk
+from jose.backends.base import Key
+from jose import jwt as jose_jwt
+
+LOCAL_ISSUER: Final[str] = "http://jwks:8080"
+LOCAL_APP_CLIENT_ID: Final[str] = "load-test-client"
+
+SIGNING_KEY_FILENAME: Final[str] = "signing_key.json"
+JWKS_FILENAME: Final[str] = "jwks.json"
+
+
+@dataclass(frozen=True)
+class LocalSigningKey:
+    """トークンの署名に使う鍵"""
+
+    kid: str
+    private_key_pem: str
+
+    @classmethod
+    def generate(cls, kid: str | None = None) -> "LocalSigningKey":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode()
+        return cls(kid=kid or uuid.uuid4().hex, private_key_pem=pem)
+
+    def public_jwk(self) -> dict[str, Any]:
+        """公開鍵をJWKの形式で返す（CognitoのJWKSと同じ項目）"""
+        return dict(self._public_jwk)
+
+    @cached_property
+    def jose_key(self) -> Key:
+        """署名に使う鍵（秘密鍵の読み込みは数十ミリ秒かかるため、1回だけ読み込む）"""
+        return jwk.construct(self.private_key_pem, "RS256")
+
+    @cached_property
+    def _public_jwk(self) -> dict[str, Any]:
+        return {**self.jose_key.public_key().to_dict(), "kid": self.kid, "use": "sig"}
+
+
+def create_jwks(keys: list[LocalSigningKey]) -> dict[str, Any]:
+    return {"keys": [key.public_jwk() for key in keys]}
+
+
+def mint_access_token(
+    key: LocalSigningKey,
+    issuer: str = LOCAL_ISSUER,
+    app_client_id: str = LOCAL_APP_CLIENT_ID,
+    expires_in: int = 3600,
+    kid: str | None = None,
+) -> str:
+    """Cognitoのクライアントクレデンシャルで発行されるアクセストークンと同じ形式のトークンを作成する
+
+    kid を指定した場合はヘッダーのkidを差し替える（JWKSにないkidのトークンを作成する場合）。
+    """
+    now = int(time.time())
+    claims = {
+        "sub": app_client_id,
+        "iss": issuer,
+        "aud": app_client_id,
+        "client_id": app_client_id,
+        "token_use": "access",
+        "iat": now,
+        "exp": now + expires_in,
+        "jti": uuid.uuid4().hex,
+    }
+    return jose_jwt.encode(
+        claims, key.jose_key, algorithm="RS256", headers={"kid": kid or key.kid}
+    )
+
+
+def mint_unknown_kid_tokens(
+    count: int,
+    issuer: str = LOCAL_ISSUER,
+    app_client_id: str = LOCAL_APP_CLIENT_ID,
+) -> list[str]:
+    """JWKSにない鍵で署名し、トークンごとに異なるkidを持つトークンを作成する
+
+    kidが見つからない場合のJWKSの再取得を再現するために使う。RSAの署名を送信側の処理時間に
+    含めないように、事前にまとめて作成する。
+    """
+    key = LocalSigningKey.generate()
+    return [
+        mint_access_token(key, issuer, app_client_id, kid=uuid.uuid4().hex)
+        for _ in range(count)
+    ]
+
+
+def write_signing_key(
+    directory: Path, key: LocalSigningKey, rotate: bool = False
+) -> None:
+    """秘密鍵とJWKSをディレクトリに書き出す
+
+    rotate を指定した場合は、Cognitoの鍵のローテーションと同じように古い公開鍵をJWKSに残したまま
+    新しい鍵を追加し、以降は新しい鍵で署名する。
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    jwks_path = directory / JWKS_FILENAME
+    jwks = json.loads(jwks_path.read_text()) if rotate else {"keys": []}
+    jwks["keys"].append(key.public_jwk())
+    (directory / SIGNING_KEY_FILENAME).write_text(
+        json.dumps({"kid": key.kid, "private_key_pem": key.private_key_pem})
+    )
+    jwks_path.write_text(json.dumps(jwks))
+
+
+def read_signing_key(directory: Path) -> LocalSigningKey:
+    data = json.loads((directory / SIGNING_KEY_FILENAME).read_text())
+    return LocalSigningKey(kid=data["kid"], private_key_pem=data["private_key_pem"])
+
+
+@dataclass
+class LocalJwksServer:
+    """JWKSを配信するHTTPサーバー（同じプロセスのイベントループで動かす）
+
+    鍵のローテーションでJWKSが取得された回数を確認できるように、取得された回数を記録する。
+    response_delay 秒だけ待ってから応答し、Cognitoまでのネットワークの遅延を再現する。
+    """
+
+    keys: list[LocalSigningKey] = field(default_factory=list)
+    response_delay: float = 0.0
+    fetch_count: int = 0
+    _runner: web.AppRunner | None = None
+    _url: str = ""
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def signing_key(self) -> LocalSigningKey:
+        """最後に追加した（現在の署名に使う）鍵"""
+        return self.keys[-1]
+
+    def rotate(self) -> LocalSigningKey:
+        """新しい鍵を追加する（古い鍵も署名済みのトークンを検証できるように残す）"""
+        key = LocalSigningKey.generate()
+        # 配信時に鍵を読み込まないように、公開鍵を先に変換しておく
+        key.public_jwk()
+        self.keys.append(key)
+        return key
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """サーバーを起動してJWKSのURLを返す（port に0を指定した場合は空いているポートを使う）"""
+        if not self.keys:
+            self.rotate()
+        app = web.Application()
+        app.router.add_get(f"/{JWKS_FILENAME}", self._handle_jwks)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self._url = f"http://{bound_host}:{bound_port}/{JWKS_FILENAME}"
+        return self._url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_jwks(self, request: web.Request) -> web.Response:
+        self.fetch_count += 1
+        if self.response_delay > 0:
+            await asyncio.sleep(self.response_delay)
+        return web.json_response(create_jwks(self.keys))
@@ -0,0 +1,86 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""LgtmImageRepository のベンチマーク（インメモリSQLite）.
+
+MySQLに接続せずに、インメモリのSQLiteに10万件の画像を登録してリポジトリの各メソッドの処理時間を計測する。
+SQLiteとMySQLでは実行計画が異なるため、値はクエリの変更前後の比較に使う。
+
+実行方法: PYTHONPATH=src python -m benchmarks.sqlite_repository_benchmark
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from domain.lgtm_image import LgtmImageId
+from infrastructure.lgtm_image_repository import LgtmImageRepository
+from tests.fixtures.sqlite_database import (
+    create_sqlite_database_engine,
+    insert_lgtm_image_rows,
+)
+
+ROW_COUNT = 100_000
+REPEAT = 50
+
+
+async def _measure(
+    engine: AsyncEngine,
+    query: Callable[[LgtmImageRepository], Awaitable[list[Any]]],
+    repeat: int,
+) -> tuple[float, float]:
+    """中央値と最小値（ミリ秒）を返す（identity mapの影響を避けるため毎回新しいセッションを使う）"""
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+    elapsed = []
+    for _ in range(repeat):
+        async with session_factory() as session:
+            started_at = time.perf_counter()
+            await query(LgtmImageRepository(session))
+            elapsed.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(elapsed), min(elapsed)
+
+
+async def run() -> None:
+    started_at = time.perf_counter()
+    engine = await create_sqlite_database_engine()
+    await insert_lgtm_image_rows(engine, ROW_COUNT)
+    print(f"seeded {ROW_COUNT:,} rows in {time.perf_counter() - started_at:.2f}s")
+
+    ids = [LgtmImageId(id_) for id_ in range(1, ROW_COUNT + 1)]
+    queries: list[
+        tuple[str, Callable[[LgtmImageRepository], Awaitable[list[Any]]], int]
+    ] = [
+        ("find_all_ids", lambda r: r.find_all_ids(), 5),
+        ("find_by_ids (9)", lambda r: r.find_by_ids(random.sample(ids, 9)), REPEAT),
+        (
+            "find_by_ids (1000)",
+            lambda r: r.find_by_ids(random.sample(ids, 1000)),
+            REPEAT,
+        ),
+        ("find_recently_created", lambda r: r.find_recently_created(9), REPEAT),
+        (
+            "find_recently_created (deep)",
+            lambda r: r.find_recently_created(9, before=LgtmImageId(ROW_COUNT // 10)),
+            REPEAT,
+        ),
+    ]
+
+    print(f"{'query':<30} {'median ms':>10} {'best ms':>10}")
+    try:
+        for name, query, repeat in queries:
+            median, best = await _measure(engine, query, repeat)
+            print(f"{name:<30} {median:>10.3f} {best:>10.3f}")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""受け付けられないトークンを拒否するまでのコストのベンチマーク.
+
+CognitoTokenVerifierRepository.verify（署名の検証の前に形式・alg・exp・iss・client_id を確認する）と、
+python-jose で署名から検証する場合（verify の事前の確認を追加する前の処理）で、トークンの種類ごとに
+1件あたりの処理時間を比較する。JWKSはローカルのJWKSサーバー（LocalJwksServer）から事前に取得する。
+
+トークンの種類:
+    malformed: JWTの形式でない文字列
+    oversized: 長さの上限（MAX_TOKEN_LENGTH）を超えるトークン
+    alg_none: alg が none の署名のないトークン
+    expired: 有効期限が切れたトークン
+    wrong_issuer: 別の発行者のトークン
+    wrong_client: 別のアプリクライアントに発行されたトークン
+    bad_signature: JWKSにない鍵で、JWKSにあるkidを指定して署名したトークン（署名の検証まで必要）
+    valid: 受け付けられるトークン（参考）
+
+実行方法: PYTHONPATH=src python -m benchmarks.token_rejection_benchmark
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import time
+from typing import Any
+
+from jose import JWTError
+from jose import jwt as jose_jwt
+
+from benchmarks.local_jwt import (
+    LOCAL_APP_CLIENT_ID,
+    LOCAL_ISSUER,
+    LocalJwksServer,
+    LocalSigningKey,
+    mint_access_token,
+)
+from domain.lgtm_image_errors import ErrExpiredToken, ErrInvalidToken
+from infrastructure.cognito_token_verifier_repository import (
+    CognitoTokenVerifierRepository,
+)
+from infrastructure.jwt_prevalidation import MAX_TOKEN_LENGTH
+
+DEFAULT_ITERATIONS = 2_000
+
+
+def _encode_segment(segment: dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(segment).encode()).rstrip(b"=").decode()
+
+
+def create_tokens(key: LocalSigningKey) -> dict[str, str]:
+    """トークンの種類ごとにトークンを作成する"""
+    valid = mint_access_token(key)
+    claims = jose_jwt.get_unverified_claims(valid)
+    oversized = jose_jwt.encode(
+        {**claims, "padding": "x" * MAX_TOKEN_LENGTH},
+        key.jose_key,
+        algorithm="RS256",
+        headers={"kid": key.kid},
+    )
+    alg_none = ".".join(
+        (
+            _encode_segment({"alg": "none", "kid": key.kid}),
+            _encode_segment(claims),
+            "",
+        )
+    )
+    return {
+        "malformed": "not-a-jwt",
+        "oversized": oversized,
+        "alg_none": alg_none,
+        "expired": mint_access_token(key, expires_in=-60),
+        "wrong_issuer": mint_access_token(key, issuer="https://example.com/other"),
+        "wrong_client": mint_access_token(key, app_client_id="other-client"),
+        "bad_signature": mint_access_token(LocalSigningKey.generate(), kid=key.kid),
+        "valid": valid,
+    }
+
+
+async def measure_verify(
+    verifier: CognitoTokenVerifierRepository, token: str, iterations: int
+) -> float:
+    """verify の1件あたりの処理時間（マイクロ秒）を返す"""
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            await verifier.verify(token)
+        except (ErrInvalidToken, ErrExpiredToken):
+            pass
+    return (time.perf_counter() - started_at) / iterations * 1_000_000
+
+
+def measure_signature_first(
+    public_jwk: dict[str, Any], token: str, iterations: int
+) -> float:
+    """python-jose で署名から検証する場合の1件あたりの処理時間（マイクロ秒）を返す"""
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            jose_jwt.get_unverified_header(token)
+            jose_jwt.decode(
+                token,
+                public_jwk,
+                algorithms=["RS256"],
+                audience=LOCAL_APP_CLIENT_ID,
+                issuer=LOCAL_ISSUER,
+            )
+        except JWTError:
+            pass
+    return (time.perf_counter() - started_at) / iterations * 1_000_000
+
+
+async def run(iterations: int) -> list[tuple[str, float, float]]:
+    server = LocalJwksServer()
+    jwks_url = await server.start()
+    try:
+        verifier = CognitoTokenVerifierRepository(
+            region="ap-northeast-1",
+            user_pool_id="local",
+            app_client_id=LOCAL_APP_CLIENT_ID,
+            jwks_url=jwks_url,
+            issuer=LOCAL_ISSUER,
+        )
+        key = server.signing_key
+        tokens = create_tokens(key)
+        # JWKSの取得は計測に含めない
+        await verifier.verify(tokens["valid"])
+
+        return [
+            (
+                name,
+                await measure_verify(verifier, token, iterations),
+                measure_signature_first(key.public_jwk(), token, iterations),
+            )
+            for name, token in tokens.items()
+        ]
+    finally:
+        await server.close()
+
+
+def print_results(results: list[tuple[str, float, float]]) -> None:
+    print(f"{'token':<16}{'verify us':>12}{'signature first us':>22}{'speedup':>10}")
+    for name, verify_us, signature_first_us in results:
+        print(
+            f"{name:<16}{verify_us:>12.1f}{signature_first_us:>22.1f}"
+            f"{signature_first_us / verify_us:>9.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0] if __doc__ else None
+    )
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    # 拒否したトークンごとのログを出力しない
+    logging.getLogger("infrastructure.cognito_token_verifier_repository").setLevel(
+        logging.CRITICAL
+    )
+    print_results(asyncio.run(run(args.iterations)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""重複なしランダム取得のカーソル処理のベンチマーク.
+
+10万件の画像に対して、カーソルのデコード・並べ替えによるlimit件の抽選・カーソルのエンコードに
+かかる時間を計測する（DBアクセスは含まない）。
+
+実行方法: PYTHONPATH=src python -m benchmarks.unseen_cursor_benchmark
+"""
+
+import timeit
+
+from domain.lgtm_image_cursor import (
+    RandomLgtmImageCursor,
+    decode_random_lgtm_image_cursor,
+    encode_random_lgtm_image_cursor,
+)
+from domain.random_permutation import RandomPermutation
+
+POOL_SIZE = 100_000
+LIMITS = (9, 100)
+ITERATIONS = 1_000
+
+
+def _advance(cursor: str, limit: int) -> str:
+    state = decode_random_lgtm_image_cursor(cursor)
+    permutation = RandomPermutation(state["pool_size"], state["seed"])
+    for _ in range(limit):
+        permutation[state["position"]]
+        state["position"] += 1
+    return encode_random_lgtm_image_cursor(state)
+
+
+def main() -> None:
+    cursor = encode_random_lgtm_image_cursor(
+        RandomLgtmImageCursor(seed=123456789, pool_size=POOL_SIZE, position=0)
+    )
+    codec = min(
+        timeit.repeat(
+            lambda: encode_random_lgtm_image_cursor(
+                decode_random_lgtm_image_cursor(cursor)
+            ),
+            number=ITERATIONS,
+            repeat=5,
+        )
+    )
+    print(f"pool_size={POOL_SIZE:,}")
+    print(f"{'operation':<20} {'ms/request':>10}")
+    print(f"{'decode+encode':<20} {codec / ITERATIONS * 1000:>10.4f}")
+    for limit in LIMITS:
+        elapsed = min(
+            timeit.repeat(lambda: _advance(cursor, limit), number=ITERATIONS, repeat=5)
+        )
+        print(f"{f'advance limit={limit}':<20} {elapsed / ITERATIONS * 1000:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
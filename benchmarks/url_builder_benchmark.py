@@ -0,0 +1,105 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""画像の一覧レスポンスを作成するコストのベンチマーク（改善前 vs LgtmImageUrlFactory）.
+
+LgtmImageObjectのリストからLgtmImageを作成し、レスポンスの本文を組み立ててJSONに変換するまでの
+1件あたりの処理時間を、ランダム取得の件数（9件）と大きな一覧（1000件）で比較する。
+
+実行方法: PYTHONPATH=src python -m benchmarks.url_builder_benchmark
+"""
+
+import timeit
+import uuid
+from collections.abc import Callable
+from typing import Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+
+from domain.lgtm_image import LgtmImage, LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject, get_lgtm_image_url_factory
+from presentation.controller.lgtm_image_response import create_lgtm_image_list_content
+from presentation.controller.response_helper import create_json_response
+
+BASE_URL = "lgtm-images.lgtmeow.com"
+ITEM_COUNTS = (9, 1000)
+# 1回の計測で処理する画像の件数の目安
+ITEMS_PER_MEASUREMENT = 200_000
+
+
+class LegacyLgtmImageItem(BaseModel):
+    """比較用: 改善前のLgtmImageItem（URLをHttpUrlとして検証する）"""
+
+    id: str
+    url: HttpUrl
+
+
+class LegacyLgtmImageRandomListResponse(BaseModel):
+    """比較用: 改善前のLgtmImageRandomListResponse"""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    lgtm_images: list[LegacyLgtmImageItem] = Field(..., alias="lgtmImages")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+
+
+def _legacy_create_lgtm_image(
+    lgtm_image_object: LgtmImageObject, base_url: str
+) -> LgtmImage:
+    """比較用: 改善前のcreate_lgtm_image"""
+    return LgtmImage(
+        id=str(lgtm_image_object.id),
+        url=f"https://{base_url}/{lgtm_image_object.path}/{lgtm_image_object.filename}.webp",
+    )
+
+
+def _create_objects(count: int) -> list[LgtmImageObject]:
+    return [
+        LgtmImageObject(
+            id=LgtmImageId(i),
+            path=f"2021/03/16/{i % 24:02d}",
+            filename=str(uuid.UUID(int=i, version=4)),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _legacy(objects: list[LgtmImageObject]) -> bytes:
+    images = [_legacy_create_lgtm_image(obj, BASE_URL) for obj in objects]
+    items = [
+        LegacyLgtmImageItem(id=image.id, url=image.url)  # type: ignore[arg-type]
+        for image in images
+    ]
+    response = LegacyLgtmImageRandomListResponse(lgtmImages=items, nextCursor=None)
+    return bytes(create_json_response(response).body)
+
+
+def _current(objects: list[LgtmImageObject]) -> bytes:
+    create = get_lgtm_image_url_factory(BASE_URL).create
+    images = [create(obj) for obj in objects]
+    return bytes(JSONResponse(content=create_lgtm_image_list_content(images)).body)
+
+
+def _measure(build: Callable[[list[LgtmImageObject]], bytes], count: int) -> float:
+    """1件あたりの処理時間（マイクロ秒）を返す"""
+    objects = _create_objects(count)
+    number = max(ITEMS_PER_MEASUREMENT // count, 1)
+    elapsed = min(timeit.repeat(lambda: build(objects), number=number, repeat=5))
+    return elapsed / (number * count) * 1_000_000
+
+
+def main() -> None:
+    # 改善前後で同じレスポンスになることを確認してから計測する
+    for count in ITEM_COUNTS:
+        objects = _create_objects(count)
+        assert _legacy(objects) == _current(objects)
+
+    print(f"{'items':>6} {'legacy us/item':>15} {'factory us/item':>16} {'speedup':>8}")
+    for count in ITEM_COUNTS:
+        legacy = _measure(_legacy, count)
+        current = _measure(_current, count)
+        print(f"{count:>6} {legacy:>15.3f} {current:>16.3f} {legacy / current:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+-- 最近作成された画像の一覧（ORDER BY created_at DESC, id DESC）をインデックスで読むためのインデックス
+-- キーセットページネーション（GET /lgtm-images/recently-created?before=）でも同じインデックスを使う
+ALTER TABLE lgtm_images ADD INDEX idx_lgtm_images_created_at_id (created_at, id);
@@ -0,0 +1 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
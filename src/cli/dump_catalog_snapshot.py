@@ -0,0 +1,57 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""lgtm_images の全件をスナップショットのファイルに書き出す
+
+イメージのビルド時に実行し、起動時に CATALOG_SNAPSHOT_FILE で読み込ませることで、
+DBから読み込むのを差分だけにする。接続先は DATABASE_* の環境変数で指定する
+（DATABASE_REPLICA_* が設定されている場合はレプリカから読み込む）。
+
+実行方法: PYTHONPATH=src python -m cli.dump_catalog_snapshot --output catalog-snapshot.bin
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from config import get_database_ssl
+from infrastructure.catalog_snapshot import CatalogSnapshot
+from infrastructure.database import (
+    DatabasePoolSettings,
+    create_database_engine,
+    create_session_factory,
+    get_database_url,
+    get_replica_database_url,
+)
+
+
+async def dump_catalog_snapshot(output: str, base: Optional[str] = None) -> int:
+    """スナップショットを書き出し、行数を返す（base を指定した場合はその差分だけを読み込む）"""
+    snapshot = CatalogSnapshot.load(base) if base else CatalogSnapshot()
+    engine = create_database_engine(
+        get_replica_database_url() or get_database_url(),
+        DatabasePoolSettings(pool_size=1, max_overflow=0),
+        ssl=get_database_ssl(),
+    )
+    try:
+        await snapshot.refresh(create_session_factory(engine))
+    finally:
+        await engine.dispose()
+    snapshot.dump(output)
+    return len(snapshot)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", required=True, help="書き出すファイルのパス")
+    parser.add_argument(
+        "--base", help="前回書き出したファイル（指定した場合は差分だけを読み込む）"
+    )
+    args = parser.parse_args(argv)
+
+    count = asyncio.run(dump_catalog_snapshot(args.output, args.base))
+    print(f"Wrote {count} images to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,72 @@ UPLOAD_S3_BUCKET_NAME: Final[str] = os.getenv("UPLOAD_S3_BUCKET_NAME", "")
 # ログレベル設定（デフォルト: INFO）
 LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "INFO")
 
+# ログ出力に使うJSONエンコーダー（json または orjson、デフォルト: json）
+LOG_JSON_ENCODER: Final[str] = os.getenv("LOG_JSON_ENCODER", "json")
+
+# ログサンプリング設定
+# LOG_SAMPLING_PATHS（カンマ区切り）へのリクエストは LOG_SAMPLING_RATE 件に1件だけINFOログを出力する
+LOG_SAMPLING_RATE: Final[int] = int(os.getenv("LOG_SAMPLING_RATE", "1"))
+LOG_SAMPLING_PATHS: Final[tuple[str, ...]] = tuple(
+    path.strip()
+    for path in os.getenv("LOG_SAMPLING_PATHS", "").split(",")
+    if path.strip()
+)
+
+# DBコネクションプール設定
+DATABASE_POOL_SIZE: Final[int] = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+DATABASE_MAX_OVERFLOW: Final[int] = int(os.getenv("DATABASE_MAX_OVERFLOW", "5"))
+DATABASE_POOL_TIMEOUT: Final[float] = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+DATABASE_POOL_RECYCLE: Final[int] = int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))
+# コネクション取得待ちの上限秒数（0より大きい場合、超過したリクエストは503を返す）
+DATABASE_POOL_CHECKOUT_BUDGET: Final[float] = float(
+    os.getenv("DATABASE_POOL_CHECKOUT_BUDGET", "0")
+)
+# DBにTLSで接続するか（ローカルのMySQLに接続する場合のみ false にする）
+DATABASE_SSL: Final[bool] = os.getenv("DATABASE_SSL", "true").lower() != "false"
+
+# ランダム画像の抽選方式（uniform: リクエストごとに独立して抽選、deck: 山札方式で連続した重複を避ける、
+# recency: 新しい画像ほど選ばれやすくする）
+RANDOM_SAMPLER_MODE: Final[str] = os.getenv("RANDOM_SAMPLER_MODE", "uniform")
+# recencyモードで重みが半分になる画像の件数
+RANDOM_SAMPLER_RECENCY_HALF_LIFE: Final[int] = int(
+    os.getenv("RANDOM_SAMPLER_RECENCY_HALF_LIFE", "5000")
+)
+
+# seed指定のランダム画像のレスポンスをキャッシュしてよい秒数（Cache-Controlのmax-age）
+SEEDED_RANDOM_CACHE_MAX_AGE: Final[int] = int(
+    os.getenv("SEEDED_RANDOM_CACHE_MAX_AGE", "300")
+)
+
+# ワーカープロセスごとにキャッシュする画像のレコードの最大件数（0の場合はキャッシュしない）
+# キャッシュは無効化されないため、DBで削除・変更された画像を最大で LGTM_IMAGE_CACHE_TTL 秒
+# （0の場合は追い出されるか再起動されるまで）返し続ける。この古さを許容できる場合だけ有効にする
+LGTM_IMAGE_CACHE_SIZE: Final[int] = int(os.getenv("LGTM_IMAGE_CACHE_SIZE", "0"))
+# キャッシュした画像のレコードを保持する秒数（0の場合は期限を設けない）
+LGTM_IMAGE_CACHE_TTL: Final[float] = float(os.getenv("LGTM_IMAGE_CACHE_TTL", "300"))
+
+# 全画像をメモリ上のスナップショットに保持し、新しい画像をこの間隔（秒）で読み込む（0の場合はDBから読み取る）
+CATALOG_SNAPSHOT_REFRESH_INTERVAL: Final[float] = float(
+    os.getenv("CATALOG_SNAPSHOT_REFRESH_INTERVAL", "0")
+)
+
+# スナップショットの全件をこの間隔（秒）で読み込み直し、削除された画像を取り除く（0の場合は読み込み直さない）
+CATALOG_SNAPSHOT_FULL_RELOAD_INTERVAL: Final[float] = float(
+    os.getenv("CATALOG_SNAPSHOT_FULL_RELOAD_INTERVAL", "3600")
+)
+
+# 起動時に読み込むスナップショットのファイル（未設定の場合はDBから全件を読み込む）
+CATALOG_SNAPSHOT_FILE: Final[str] = os.getenv("CATALOG_SNAPSHOT_FILE", "")
+
+# メトリクスをログに出力する間隔（秒、0の場合は出力しない）
+METRICS_LOG_INTERVAL: Final[float] = float(os.getenv("METRICS_LOG_INTERVAL", "60"))
+
 # AWS Cognito設定
 COGNITO_REGION: Final[str] = os.getenv("COGNITO_REGION", "ap-northeast-1")
+# JWKSのURLとトークンの発行者（未設定の場合はリージョンとユーザープールIDから組み立てる）
+# 負荷試験などでローカルで署名したトークンを検証する場合に設定する
+COGNITO_JWKS_URL: Final[str] = os.getenv("COGNITO_JWKS_URL", "")
+COGNITO_ISSUER: Final[str] = os.getenv("COGNITO_ISSUER", "")
 
 # Sentry設定
 SENTRY_DSN: Final[str] = os.getenv("SENTRY_DSN", "")
@@ -58,6 +122,78 @@ def get_log_level() -> str:
     return LOG_LEVEL
 
 
+def get_log_json_encoder() -> str:
+    return LOG_JSON_ENCODER
+
+
+def get_log_sampling_rate() -> int:
+    return LOG_SAMPLING_RATE
+
+
+def get_log_sampling_paths() -> tuple[str, ...]:
+    return LOG_SAMPLING_PATHS
+
+
+def get_database_pool_size() -> int:
+    return DATABASE_POOL_SIZE
+
+
+def get_database_max_overflow() -> int:
+    return DATABASE_MAX_OVERFLOW
+
+
+def get_database_pool_timeout() -> float:
+    return DATABASE_POOL_TIMEOUT
+
+
+def get_database_pool_recycle() -> int:
+    return DATABASE_POOL_RECYCLE
+
+
+def get_database_pool_checkout_budget() -> float:
+    return DATABASE_POOL_CHECKOUT_BUDGET
+
+
+def get_database_ssl() -> bool:
+    return DATABASE_SSL
+
+
+def get_metrics_log_interval() -> float:
+    return METRICS_LOG_INTERVAL
+
+
+def get_random_sampler_mode() -> str:
+    return RANDOM_SAMPLER_MODE
+
+
+def get_random_sampler_recency_half_life() -> int:
+    return RANDOM_SAMPLER_RECENCY_HALF_LIFE
+
+
+def get_seeded_random_cache_max_age() -> int:
+    return SEEDED_RANDOM_CACHE_MAX_AGE
+
+
+def get_lgtm_image_cache_size() -> int:
+    return LGTM_IMAGE_CACHE_SIZE
+
+
+def get_lgtm_image_cache_ttl() -> float:
+    return LGTM_IMAGE_CACHE_TTL
+
+
+def get_catalog_snapshot_refresh_interval() -> float:
+    return CATALOG_SNAPSHOT_REFRESH_INTERVAL
+
+
+def get_catalog_snapshot_full_reload_interval() -> float:
+    return CATALOG_SNAPSHOT_FULL_RELOAD_INTERVAL
+
+
+def get_catalog_snapshot_file() -> str:
+    return CATALOG_SNAPSHOT_FILE
+
+
 def get_cognito_region() -> str:
     return COGNITO_REGION
 
@@ -70,6 +206,14 @@ def get_cognito_app_client_id() -> str:
     return COGNITO_APP_CLIENT_ID
 
 
+def get_cognito_jwks_url() -> str:
+    return COGNITO_JWKS_URL
+
+
+def get_cognito_issuer() -> str:
+    return COGNITO_ISSUER
+
+
 def get_sentry_dsn() -> str:
     return SENTRY_DSN
 
@@ -2,17 +2,17 @@
 
 import uuid
 from datetime import datetime, timezone
-from typing import Required, TypedDict
+from typing import NamedTuple
 
 
-class UploadedLgtmImage(TypedDict):
-    url: Required[str]
+class UploadedLgtmImage(NamedTuple):
+    url: str
 
 
-class UploadObjectStorageDto(TypedDict):
-    body: Required[bytes]
-    image_extension: Required[str]
-    key: Required[str]
+class UploadObjectStorageDto(NamedTuple):
+    body: bytes
+    image_extension: str
+    key: str
 
 
 def generate_lgtm_image_name() -> str:
@@ -1,14 +1,55 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from typing import Final, NewType, Required, TypedDict
+from typing import Final, NamedTuple, NewType, Optional, Required, TypedDict
 
+from domain.lgtm_image_errors import ErrInvalidImageIds
 
 # LGTM画像のID型（intと区別して型安全性を向上）
 LgtmImageId = NewType("LgtmImageId", int)
 
 DEFAULT_RANDOM_IMAGES_LIMIT: Final[int] = 9
 
+# 1回のリクエストで取得できるLGTM画像の最大件数
+MAX_IMAGES_LIMIT: Final[int] = 100
 
-class LgtmImage(TypedDict):
-    id: Required[str]
-    url: Required[str]
+
+class LgtmImage(NamedTuple):
+    id: str
+    url: str
+
+
+class LgtmImagePage(TypedDict):
+    images: Required[list[LgtmImage]]
+    # 次のページを取得するためのカーソル（最後のページの場合はNone）
+    next_cursor: Required[Optional[str]]
+
+
+class SeededLgtmImages(TypedDict):
+    # seed・件数・画像の一覧のバージョンから決まるタグ（同じタグであれば同じ画像を返す）
+    tag: Required[str]
+    # クライアントが同じタグのレスポンスを保持している場合はNone
+    images: Required[Optional[list[LgtmImage]]]
+
+
+def is_ascii_decimal(value: str) -> bool:
+    """ASCIIの10進数字だけからなる文字列かどうかを返す
+
+    str.isdigit() は "²" などint()で変換できない文字も受け付けるため、IDなどの数値の検証に使う。
+    """
+    return value.isascii() and value.isdecimal()
+
+
+def parse_lgtm_image_ids(raw: str) -> list[LgtmImageId]:
+    """カンマ区切りの画像IDを重複を除いて指定順に取り出す
+
+    Raises:
+        ErrInvalidImageIds: 形式が不正な場合、または MAX_IMAGES_LIMIT 件を超える場合
+    """
+    fields = [field.strip() for field in raw.split(",")]
+    if not all(is_ascii_decimal(field) and int(field) > 0 for field in fields):
+        raise ErrInvalidImageIds(f"Invalid image ids: {raw}")
+
+    ids = list(dict.fromkeys(LgtmImageId(int(field)) for field in fields))
+    if len(ids) > MAX_IMAGES_LIMIT:
+        raise ErrInvalidImageIds(f"Too many image ids: {len(ids)}")
+    return ids
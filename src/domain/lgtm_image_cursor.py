@@ -0,0 +1,80 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import base64
+import binascii
+from typing import Required, TypedDict
+
+from domain.lgtm_image import LgtmImageId, is_ascii_decimal
+from domain.lgtm_image_errors import ErrInvalidCursor
+from domain.random_permutation import MAX_SEED
+
+# カーソルの形式が変わった場合に古いカーソルを判別するためのバージョン
+_CURSOR_VERSION = "v1"
+_RANDOM_CURSOR_VERSION = "r1"
+
+
+class RandomLgtmImageCursor(TypedDict):
+    """ランダム画像の重複なし取得の進み具合
+
+    ID順に並べた pool_size 件の画像を seed で並べ替え、position 件目まで返したことを表す。
+    """
+
+    seed: Required[int]
+    pool_size: Required[int]
+    position: Required[int]
+
+
+def _encode(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> str:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ErrInvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+def encode_lgtm_image_cursor(last_id: LgtmImageId) -> str:
+    """ページの最後の画像IDから次のページを取得するためのカーソルを作成する"""
+    return _encode(f"{_CURSOR_VERSION}:{last_id}")
+
+
+def decode_lgtm_image_cursor(cursor: str) -> LgtmImageId:
+    """カーソルから画像IDを取り出す
+
+    Raises:
+        ErrInvalidCursor: カーソルの形式が不正な場合
+    """
+    version, _, id_ = _decode(cursor).partition(":")
+    if version != _CURSOR_VERSION or not is_ascii_decimal(id_) or int(id_) <= 0:
+        raise ErrInvalidCursor(f"Invalid cursor: {cursor}")
+    return LgtmImageId(int(id_))
+
+
+def encode_random_lgtm_image_cursor(state: RandomLgtmImageCursor) -> str:
+    """ランダム画像の重複なし取得の進み具合からカーソルを作成する"""
+    return _encode(
+        f"{_RANDOM_CURSOR_VERSION}:{state['seed']}:{state['pool_size']}:{state['position']}"
+    )
+
+
+def decode_random_lgtm_image_cursor(cursor: str) -> RandomLgtmImageCursor:
+    """カーソルからランダム画像の重複なし取得の進み具合を取り出す
+
+    Raises:
+        ErrInvalidCursor: カーソルの形式が不正な場合
+    """
+    fields = _decode(cursor).split(":")
+    if (
+        len(fields) != 4
+        or fields[0] != _RANDOM_CURSOR_VERSION
+        or not all(is_ascii_decimal(field) for field in fields[1:])
+    ):
+        raise ErrInvalidCursor(f"Invalid cursor: {cursor}")
+
+    seed, pool_size, position = (int(field) for field in fields[1:])
+    if seed > MAX_SEED or pool_size <= 0 or position > pool_size:
+        raise ErrInvalidCursor(f"Invalid cursor: {cursor}")
+    return RandomLgtmImageCursor(seed=seed, pool_size=pool_size, position=position)
@@ -17,3 +17,15 @@ class ErrJwksFetchFailed(Exception):
 
 class ErrExpiredToken(Exception):
     pass
+
+
+class ErrDatabaseBusy(Exception):
+    pass
+
+
+class ErrInvalidCursor(Exception):
+    pass
+
+
+class ErrInvalidImageIds(Exception):
+    pass
@@ -1,17 +1,56 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
-from typing import Required, TypedDict
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import NamedTuple
 
 from domain.lgtm_image import LgtmImage, LgtmImageId
 
 
-class LgtmImageObject(TypedDict):
-    id: Required[LgtmImageId]
-    path: Required[str]
-    filename: Required[str]
+# キャッシュやスナップショットでリクエストをまたいで共有するため、変更できないNamedTupleにする
+class LgtmImageObject(NamedTuple):
+    id: LgtmImageId
+    path: str
+    filename: str
+
+
+class LgtmImageUrlFactory:
+    """ベースURLを束縛してLgtmImageObjectからLgtmImageを作成する
+
+    "https://{base_url}/" の部分は作成時に1度だけ組み立て、画像ごとにはパスとファイル名を埋め込むだけにする。
+    作成したURLはサーバーで組み立てた信頼できる文字列として扱い、レスポンスで再検証しない。
+    """
+
+    __slots__ = ("_prefix",)
+
+    def __init__(self, base_url: str) -> None:
+        self._prefix = f"https://{base_url}/"
+
+    def create_url(self, path: str, filename: str) -> str:
+        return f"{self._prefix}{path}/{filename}.webp"
+
+    def create(self, lgtm_image_object: LgtmImageObject) -> LgtmImage:
+        return LgtmImage(
+            str(lgtm_image_object.id),
+            self.create_url(lgtm_image_object.path, lgtm_image_object.filename),
+        )
+
+
+@lru_cache(maxsize=8)
+def get_lgtm_image_url_factory(base_url: str) -> LgtmImageUrlFactory:
+    """ベースURLごとに使い回すLgtmImageUrlFactoryを返す"""
+    return LgtmImageUrlFactory(base_url)
 
 
 def create_lgtm_image(lgtm_image_object: LgtmImageObject, base_url: str) -> LgtmImage:
-    return LgtmImage(
-        id=str(lgtm_image_object["id"]),
-        url=f"https://{base_url}/{lgtm_image_object['path']}/{lgtm_image_object['filename']}.webp",
-    )
+    return get_lgtm_image_url_factory(base_url).create(lgtm_image_object)
+
+
+def create_lgtm_images_in_order(
+    lgtm_image_objects: Iterable[LgtmImageObject],
+    ids: Iterable[LgtmImageId],
+    base_url: str,
+) -> list[LgtmImage]:
+    """idsの順序に並べてLgtmImageに変換する（存在しないIDは除く）"""
+    objects_by_id = {obj.id: obj for obj in lgtm_image_objects}
+    create = get_lgtm_image_url_factory(base_url).create
+    return [create(objects_by_id[id_]) for id_ in ids if id_ in objects_by_id]
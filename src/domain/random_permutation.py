@@ -0,0 +1,68 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from typing import Final
+
+_MASK64: Final[int] = (1 << 64) - 1
+# seedとして使える最大値（64ビット）
+MAX_SEED: Final[int] = _MASK64
+_ROUNDS: Final[int] = 6
+_MIN_BITS: Final[int] = 8
+
+
+def next_seed(seed: int) -> int:
+    """seedから次のseedを決定的に導出する（splitmix64）"""
+    z = (seed + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class RandomPermutation:
+    """0からsize-1までの整数の、seedで決まる疑似ランダムな並べ替え
+
+    Feistel暗号で位置から値を直接計算するため、並べ替え全体を保持せずに
+    任意の位置の値をO(1)（平均4回未満の試行）で求められる。
+    同じsizeとseedであれば、プロセスやホストが異なっても同じ並べ替えになる。
+    """
+
+    def __init__(self, size: int, seed: int) -> None:
+        if size <= 0:
+            raise ValueError(f"size must be positive: {size}")
+        self._size = size
+        # 2のべき乗の定義域を左右に分けるため、ビット数は偶数にする
+        # 定義域が小さすぎると並べ替えに偏りが出るため、最低でも8ビットにする
+        bits = max(_MIN_BITS, (size - 1).bit_length())
+        bits += bits % 2
+        self._half_bits = bits // 2
+        self._half_mask = (1 << self._half_bits) - 1
+        keys = []
+        key = seed & _MASK64
+        for _ in range(_ROUNDS):
+            key = next_seed(key)
+            keys.append(key)
+        self._keys = tuple(keys)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __getitem__(self, position: int) -> int:
+        if not 0 <= position < self._size:
+            raise IndexError(f"position out of range: {position}")
+
+        # 定義域外の値になった場合は、定義域内に入るまで暗号化を繰り返す（cycle walking）
+        value = self._encrypt(position)
+        while value >= self._size:
+            value = self._encrypt(value)
+        return value
+
+    def _encrypt(self, value: int) -> int:
+        half_bits = self._half_bits
+        half_mask = self._half_mask
+        left = value >> half_bits
+        right = value & half_mask
+        for key in self._keys:
+            # ラウンド関数: キーと混ぜた値に定数を掛け、上位ビットを使う
+            mixed = ((right ^ key) * 0x9E3779B97F4A7C15) & _MASK64
+            left, right = right, left ^ ((mixed >> 32) & half_mask)
+        return (left << half_bits) | right
@@ -0,0 +1,12 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from domain.lgtm_image import LgtmImageId
+
+
+class RandomIdSamplerInterface(Protocol):
+    def sample(self, ids: Sequence[LgtmImageId], limit: int) -> list[LgtmImageId]:
+        """ID順に並んだIDの一覧から重複なしでlimit件を抽選する"""
+        ...
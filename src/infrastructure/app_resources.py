@@ -0,0 +1,215 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import asyncio
+import struct
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+import aioboto3
+import aiohttp
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from domain.repository.jwt_token_verifier_repository_interface import (
+    JwtTokenVerifierRepositoryInterface,
+)
+from domain.repository.random_id_sampler_interface import RandomIdSamplerInterface
+from infrastructure.catalog_snapshot import (
+    CatalogSnapshot,
+    refresh_catalog_snapshot_periodically,
+)
+from infrastructure.cognito_token_verifier_repository import (
+    CognitoTokenVerifierRepository,
+)
+from infrastructure.database import (
+    DatabasePoolSettings,
+    PoolMetrics,
+    create_database_engine,
+    create_session_factory,
+    warm_up_connection_pool,
+)
+from infrastructure.lgtm_image_object_cache import LgtmImageObjectCache
+from infrastructure.random_id_sampler import (
+    DEFAULT_RECENCY_HALF_LIFE,
+    RANDOM_SAMPLER_MODE_UNIFORM,
+    UniformRandomIdSampler,
+    create_random_id_sampler,
+)
+from log.logger import get_logger
+from metrics.registry import get_metrics_registry
+
+if TYPE_CHECKING:
+    from types_aiobotocore_s3 import S3Client
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class AppResources:
+    """アプリケーションの起動から終了まで共有するリソース"""
+
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    s3_client: "S3Client"
+    http_session: aiohttp.ClientSession
+    token_verifier: JwtTokenVerifierRepositoryInterface
+    # リードレプリカ用のセッションファクトリー（レプリカ未設定の場合はNone）
+    read_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+    # ランダム画像の抽選（山札方式の場合はワーカープロセス内で状態を共有する）
+    random_id_sampler: RandomIdSamplerInterface = field(
+        default_factory=UniformRandomIdSampler
+    )
+    # 画像のレコードのキャッシュ（無効の場合はNone）
+    lgtm_image_object_cache: Optional[LgtmImageObjectCache] = None
+    # 全画像のスナップショット（無効の場合はNone）
+    catalog_snapshot: Optional[CatalogSnapshot] = None
+
+
+@asynccontextmanager
+async def create_app_resources(
+    database_url: URL,
+    pool_settings: DatabasePoolSettings,
+    cognito_region: str,
+    cognito_user_pool_id: str,
+    cognito_app_client_id: str,
+    replica_database_url: Optional[URL] = None,
+    database_ssl: bool = True,
+    cognito_jwks_url: str = "",
+    cognito_issuer: str = "",
+    random_sampler_mode: str = RANDOM_SAMPLER_MODE_UNIFORM,
+    random_sampler_recency_half_life: int = DEFAULT_RECENCY_HALF_LIFE,
+    lgtm_image_cache_size: int = 0,
+    lgtm_image_cache_ttl: float = 0,
+    catalog_snapshot_refresh_interval: float = 0,
+    catalog_snapshot_file: str = "",
+    catalog_snapshot_full_reload_interval: float = 0,
+) -> AsyncIterator[AppResources]:
+    """共有リソースを作成し、終了時にまとめて解放する
+
+    DBコネクションプールは起動時に事前接続しておく。事前接続に失敗しても起動は継続する
+    （最初のリクエストで接続を試みる）。
+    レプリカの接続URLが指定された場合は、読み取り用のエンジンも作成する。
+    スナップショットの更新間隔が指定された場合は、起動時に全画像を読み込み、以降は定期的に差分を読み込む
+    （全件の読み込み直しの間隔が指定された場合は、その間隔ごとに全件を読み込み直す）。
+    スナップショットのファイルが指定された場合は、ファイルを読み込んだうえで差分だけをDBから読み込む。
+    """
+    random_id_sampler = create_random_id_sampler(
+        random_sampler_mode, random_sampler_recency_half_life
+    )
+    lgtm_image_object_cache = (
+        LgtmImageObjectCache(lgtm_image_cache_size, ttl_seconds=lgtm_image_cache_ttl)
+        if lgtm_image_cache_size > 0
+        else None
+    )
+
+    async with AsyncExitStack() as stack:
+        engine = create_database_engine(
+            database_url,
+            pool_settings,
+            PoolMetrics.create(get_metrics_registry(), "primary"),
+            ssl=database_ssl,
+        )
+        stack.push_async_callback(engine.dispose)
+
+        replica_engine = None
+        if replica_database_url is not None:
+            replica_engine = create_database_engine(
+                replica_database_url,
+                pool_settings,
+                PoolMetrics.create(get_metrics_registry(), "replica"),
+                ssl=database_ssl,
+            )
+            stack.push_async_callback(replica_engine.dispose)
+
+        http_session = await stack.enter_async_context(aiohttp.ClientSession())
+
+        s3_client = await stack.enter_async_context(aioboto3.Session().client("s3"))
+
+        token_verifier = CognitoTokenVerifierRepository(
+            cognito_region,
+            cognito_user_pool_id,
+            cognito_app_client_id,
+            http_session=http_session,
+            jwks_url=cognito_jwks_url or None,
+            issuer=cognito_issuer or None,
+        )
+
+        await _warm_up(engine, pool_settings.pool_size, "primary")
+        if replica_engine is not None:
+            await _warm_up(replica_engine, pool_settings.pool_size, "replica")
+
+        session_factory = create_session_factory(engine)
+        read_session_factory = (
+            create_session_factory(replica_engine)
+            if replica_engine is not None
+            else None
+        )
+
+        catalog_snapshot = None
+        if catalog_snapshot_refresh_interval > 0:
+            catalog_snapshot = _open_catalog_snapshot(catalog_snapshot_file)
+            snapshot_session_factory = read_session_factory or session_factory
+            await _load_catalog_snapshot(catalog_snapshot, snapshot_session_factory)
+            refresh_task = asyncio.create_task(
+                refresh_catalog_snapshot_periodically(
+                    catalog_snapshot,
+                    snapshot_session_factory,
+                    catalog_snapshot_refresh_interval,
+                    catalog_snapshot_full_reload_interval,
+                )
+            )
+            stack.callback(refresh_task.cancel)
+
+        yield AppResources(
+            engine=engine,
+            session_factory=session_factory,
+            s3_client=s3_client,
+            http_session=http_session,
+            token_verifier=token_verifier,
+            read_session_factory=read_session_factory,
+            random_id_sampler=random_id_sampler,
+            lgtm_image_object_cache=lgtm_image_object_cache,
+            catalog_snapshot=catalog_snapshot,
+        )
+
+
+async def _warm_up(engine: AsyncEngine, connections: int, name: str) -> None:
+    try:
+        await warm_up_connection_pool(engine, connections)
+        logger.info(
+            "Database connection pool warmed up",
+            extra={"pool": name, "connections": connections},
+        )
+    except Exception as e:
+        logger.warning(f"Failed to warm up {name} database connection pool: {e}")
+
+
+async def _load_catalog_snapshot(
+    snapshot: CatalogSnapshot, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    # 読み込みに失敗しても起動は継続する（定期的な更新で読み込めるまではDBから読み取る）
+    try:
+        appended = await snapshot.refresh(session_factory)
+        logger.info(
+            "Catalog snapshot loaded",
+            extra={"appended": appended, "size": len(snapshot)},
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load catalog snapshot: {e}")
+
+
+def _open_catalog_snapshot(path: str) -> CatalogSnapshot:
+    # ファイルがない・壊れている場合はDBから全件を読み込む
+    if not path:
+        return CatalogSnapshot()
+    try:
+        snapshot = CatalogSnapshot.load(path)
+        logger.info(
+            "Catalog snapshot file loaded", extra={"path": path, "size": len(snapshot)}
+        )
+        return snapshot
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning(f"Failed to load catalog snapshot file {path}: {e}")
+        return CatalogSnapshot()
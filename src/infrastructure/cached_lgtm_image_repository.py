@@ -0,0 +1,50 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from typing import Optional
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
+from domain.repository.lgtm_image_repository_interface import (
+    LgtmImageRepositoryInterface,
+)
+from infrastructure.lgtm_image_object_cache import LgtmImageObjectCache
+from log.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CachedLgtmImageRepository(LgtmImageRepositoryInterface):
+    """find_by_ids の結果を画像ごとにキャッシュするリポジトリ
+
+    キャッシュにない画像だけを元のリポジトリから取得する。
+    find_recently_created で取得した画像もキャッシュに追加する。
+    """
+
+    def __init__(
+        self, repository: LgtmImageRepositoryInterface, cache: LgtmImageObjectCache
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def find_all_ids(self) -> list[LgtmImageId]:
+        return await self._repository.find_all_ids()
+
+    async def find_by_ids(self, ids: list[LgtmImageId]) -> list[LgtmImageObject]:
+        found, misses = self._cache.get_many(dict.fromkeys(ids))
+        if not misses:
+            return found
+
+        logger.info(
+            "LGTM image cache miss",
+            extra={"hits_count": len(found), "misses_count": len(misses)},
+        )
+        fetched = await self._repository.find_by_ids(misses)
+        self._cache.put_many(fetched)
+        return found + fetched
+
+    async def find_recently_created(
+        self, limit: int, before: Optional[LgtmImageId] = None
+    ) -> list[LgtmImageObject]:
+        lgtm_image_objects = await self._repository.find_recently_created(limit, before)
+        self._cache.put_many(lgtm_image_objects)
+        return lgtm_image_objects
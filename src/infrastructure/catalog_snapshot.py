@@ -0,0 +1,356 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import asyncio
+import bisect
+import itertools
+import operator
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+from typing import Final, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
+from infrastructure.compact_lgtm_image_store import (
+    CompactLgtmImageColumns,
+    CompactLgtmImageStore,
+)
+from infrastructure.models import LgtmImageModel
+from log.logger import get_logger
+from metrics.registry import get_metrics_registry
+
+logger = get_logger(__name__)
+
+# 1回のクエリで読み込む行数の上限（起動時の全件読み込みを分割する）
+CATALOG_REFRESH_BATCH_SIZE: Final[int] = 10000
+
+# スナップショットファイルの形式（リトルエンディアン）
+#   ヘッダー: マジック・バージョン・行数・パスの一覧のバイト数・UUIDでないファイル名のバイト数
+#   id (int64 × 行数)、created_at (int64 × 行数)、(created_at, id) 順の位置 (int64 × 行数)、
+#   パスの番号 (uint32 × 行数)、ファイル名のUUID (16バイト × 行数)、
+#   重複を除いたパスの一覧（改行区切りのUTF-8）、UUIDでないファイル名（"位置\tファイル名" の改行区切り）
+_FILE_MAGIC: Final[bytes] = b"LGTMCAT\x00"
+_FILE_VERSION: Final[int] = 2
+# 1行あたりの固定長の列のバイト数
+_FILE_ROW_SIZE: Final[int] = 8 + 8 + 8 + 4 + 16
+_FILE_HEADER: Final[struct.Struct] = struct.Struct("<8sIQQQ")
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+CatalogRow = tuple[int, str, str, datetime]
+
+
+class CatalogSnapshot:
+    """lgtm_images の (id, path, filename, created_at) を列ごとの配列で保持するスナップショット
+
+    id・path・filename は CompactLgtmImageStore に保持する。
+    行はID順に追加され、id > 最大ID の行を差分として読み込んで更新する。
+    作成後に削除された画像は、次に reload で全件を読み込み直すまで残る。
+    """
+
+    def __init__(self) -> None:
+        self._store = CompactLgtmImageStore()
+        # created_at はUNIXエポックからのマイクロ秒
+        self._created_at = array("q")
+        # (created_at, id) の昇順に並べた位置（最近作成された画像の一覧用）
+        self._recent_order = array("q")
+        self._loaded = False
+        # all_ids の結果（行が追加されるまで使い回す）
+        self._ids_list: Optional[list[LgtmImageId]] = None
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @classmethod
+    def load(cls, path: str) -> "CatalogSnapshot":
+        """dump で書き出したファイルを読み込む
+
+        ファイルを1回で読み込み、各列をまとめてコピーする（行ごとの処理は検証だけ）。
+        読み込んだ後も差分の追加や全件の読み込み直しで列を変更するため、ファイルをメモリマップして
+        そのまま参照することはしない。
+        読み込んだスナップショットは読み込み済みとして扱う（差分は refresh で読み込む）。
+
+        Raises:
+            ValueError: ファイルの形式が不正な場合、または内容が壊れている場合
+        """
+        with open(path, "rb") as f:
+            return cls._from_buffer(memoryview(f.read()))
+
+    @classmethod
+    def _from_buffer(cls, buffer: memoryview) -> "CatalogSnapshot":
+        if len(buffer) < _FILE_HEADER.size:
+            raise ValueError("catalog snapshot file is truncated")
+        magic, version, count, paths_size, irregular_size = _FILE_HEADER.unpack_from(
+            buffer
+        )
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            raise ValueError("unsupported catalog snapshot file")
+        expected_size = (
+            _FILE_HEADER.size + count * _FILE_ROW_SIZE + paths_size + irregular_size
+        )
+        if len(buffer) != expected_size:
+            raise ValueError("catalog snapshot file is truncated")
+
+        offset = _FILE_HEADER.size
+
+        def read_bytes(size: int) -> memoryview:
+            nonlocal offset
+            data = buffer[offset : offset + size]
+            offset += size
+            return data
+
+        def read_array(typecode: str, item_size: int) -> array[int]:
+            column = array(typecode)
+            column.frombytes(read_bytes(count * item_size))
+            if sys.byteorder != "little":
+                column.byteswap()
+            return column
+
+        snapshot = cls()
+        ids = read_array("q", 8)
+        snapshot._created_at = read_array("q", 8)
+        snapshot._recent_order = read_array("q", 8)
+        path_indexes = read_array("I", 4)
+        uuids = bytes(read_bytes(count * 16))
+        paths_text = str(read_bytes(paths_size), "utf-8")
+        irregular_text = str(read_bytes(irregular_size), "utf-8")
+
+        paths = paths_text.split("\n") if count else []
+
+        irregular_filenames: dict[int, str] = {}
+        for line in irregular_text.split("\n") if irregular_text else []:
+            position, _, filename = line.partition("\t")
+            irregular_filenames[int(position)] = filename
+
+        # all_ids の結果としても使う
+        ids_list = ids.tolist()
+        _validate_columns(count, ids_list, snapshot._recent_order)
+
+        # パスの番号とUUIDでないファイル名の位置の範囲は from_columns で検証する
+        snapshot._store = CompactLgtmImageStore.from_columns(
+            CompactLgtmImageColumns(
+                ids=ids,
+                path_indexes=path_indexes,
+                paths=paths,
+                uuids=uuids,
+                irregular_filenames=irregular_filenames,
+            )
+        )
+        snapshot._ids_list = ids_list  # type: ignore[assignment]
+        snapshot._loaded = True
+        return snapshot
+
+    def dump(self, path: str) -> None:
+        """スナップショットをファイルに書き出す（書き込み途中のファイルは読み込まれない）"""
+        columns = self._store.columns()
+        if any("\n" in value for value in columns["paths"]) or any(
+            "\n" in value for value in columns["irregular_filenames"].values()
+        ):
+            raise ValueError("paths and filenames must not contain newlines")
+
+        paths_bytes = "\n".join(columns["paths"]).encode()
+        irregular_bytes = "\n".join(
+            f"{position}\t{filename}"
+            for position, filename in columns["irregular_filenames"].items()
+        ).encode()
+
+        arrays = [
+            columns["ids"],
+            self._created_at,
+            self._recent_order,
+            columns["path_indexes"],
+        ]
+        if sys.byteorder != "little":
+            arrays = [array(column.typecode, column) for column in arrays]
+            for column in arrays:
+                column.byteswap()
+
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(
+                _FILE_HEADER.pack(
+                    _FILE_MAGIC,
+                    _FILE_VERSION,
+                    len(self),
+                    len(paths_bytes),
+                    len(irregular_bytes),
+                )
+            )
+            for column in arrays:
+                column.tofile(f)
+            f.write(columns["uuids"])
+            f.write(paths_bytes)
+            f.write(irregular_bytes)
+        os.replace(temporary_path, path)
+
+    @property
+    def loaded(self) -> bool:
+        """全件の読み込みが完了しているか"""
+        return self._loaded
+
+    @property
+    def max_id(self) -> int:
+        ids = self._store.ids
+        return ids[-1] if ids else 0
+
+    def append_rows(self, rows: Iterable[CatalogRow]) -> int:
+        """IDの昇順に並んだ、既存の最大IDより大きい行を追加する"""
+        appended = 0
+        for id_, path, filename, created_at in rows:
+            if id_ <= self.max_id:
+                raise ValueError(f"rows must be appended in id order: {id_}")
+            position = len(self._store)
+            self._store.append(id_, path, filename)
+            self._created_at.append((created_at - _EPOCH) // _MICROSECOND)
+            self._insert_recent_order(position)
+            appended += 1
+        if appended:
+            self._ids_list = None
+        return appended
+
+    async def refresh(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        """最大IDより大きい行をDBから読み込み、追加した行数を返す"""
+        appended = 0
+        async with session_factory() as session:
+            while True:
+                result = await session.execute(
+                    select(
+                        LgtmImageModel.id,
+                        LgtmImageModel.path,
+                        LgtmImageModel.filename,
+                        LgtmImageModel.created_at,
+                    )
+                    .where(LgtmImageModel.id > self.max_id)
+                    .order_by(LgtmImageModel.id)
+                    .limit(CATALOG_REFRESH_BATCH_SIZE)
+                )
+                rows: list[CatalogRow] = [row.tuple() for row in result]
+                appended += self.append_rows(rows)
+                if len(rows) < CATALOG_REFRESH_BATCH_SIZE:
+                    break
+        self._loaded = True
+        return appended
+
+    async def reload(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        """全件をDBから読み込み直し、削除された画像を取り除く（読み込んだ行数を返す）
+
+        読み込みが完了するまでは現在の内容で応答し、完了した時点でまとめて入れ替える。
+        """
+        reloaded = CatalogSnapshot()
+        await reloaded.refresh(session_factory)
+        self._store = reloaded._store
+        self._created_at = reloaded._created_at
+        self._recent_order = reloaded._recent_order
+        self._ids_list = None
+        self._loaded = True
+        return len(self)
+
+    def all_ids(self) -> list[LgtmImageId]:
+        """すべての画像IDをID順で返す
+
+        リクエストごとに10万件規模のリストを作り直さないように、行が追加されるまで
+        同じリストを返す（呼び出し側で変更しないこと）。
+        """
+        if self._ids_list is None:
+            self._ids_list = self._store.ids.tolist()  # type: ignore[assignment]
+        return self._ids_list  # type: ignore[return-value]
+
+    def find_by_ids(self, ids: Sequence[LgtmImageId]) -> list[LgtmImageObject]:
+        positions = (self._store.position_of(id_) for id_ in dict.fromkeys(ids))
+        return [
+            self._store.object_at(position)
+            for position in positions
+            if position is not None
+        ]
+
+    def find_recently_created(
+        self, limit: int, before: Optional[LgtmImageId] = None
+    ) -> list[LgtmImageObject]:
+        end = len(self._recent_order)
+        if before is not None:
+            position = self._store.position_of(before)
+            if position is None:
+                return []
+            end = bisect.bisect_left(
+                self._recent_order, self._recent_key(position), key=self._recent_key
+            )
+        return [
+            self._store.object_at(self._recent_order[index])
+            for index in range(end - 1, max(end - limit, 0) - 1, -1)
+        ]
+
+    def _recent_key(self, position: int) -> tuple[int, int]:
+        return self._created_at[position], self._store.ids[position]
+
+    def _insert_recent_order(self, position: int) -> None:
+        # 通常は新しい画像ほど created_at が大きいため末尾に追加するだけで済む
+        key = self._recent_key(position)
+        if not self._recent_order or self._recent_key(self._recent_order[-1]) < key:
+            self._recent_order.append(position)
+            return
+        index = bisect.bisect_left(self._recent_order, key, key=self._recent_key)
+        self._recent_order.insert(index, position)
+
+
+def _validate_columns(count: int, ids: list[int], recent_order: array[int]) -> None:
+    # 壊れたファイルを読み込むと、リクエストの処理中に IndexError や誤った結果になるため、
+    # 読み込み時に検出する（ID順の二分探索はIDが狭義単調増加であることに依存する）
+    if not count:
+        return
+    if not all(map(operator.lt, ids, itertools.islice(ids, 1, None))):
+        raise ValueError("catalog snapshot file is corrupted: ids are not sorted")
+    order = recent_order.tolist()
+    if min(order) < 0 or max(order) >= count:
+        raise ValueError("catalog snapshot file is corrupted: invalid recent order")
+
+
+async def refresh_catalog_snapshot_periodically(
+    snapshot: CatalogSnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: float,
+    full_reload_interval_seconds: float = 0,
+) -> None:
+    """新しく追加された画像を一定間隔でスナップショットに読み込む
+
+    ワーカープロセスごとに起動し、キャンセルされるまで更新を続ける。
+    full_reload_interval_seconds が0より大きい場合は、その間隔ごとに差分の代わりに全件を読み込み直し、
+    削除された画像を取り除く。
+    更新に失敗した場合は次の間隔で再試行する（それまでは古いスナップショットで応答する）。
+    """
+    refresh_failures = get_metrics_registry().counter(
+        "catalog_snapshot.refresh_failures"
+    )
+    last_full_reload_at = time.monotonic()
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            if (
+                full_reload_interval_seconds > 0
+                and time.monotonic() - last_full_reload_at
+                >= full_reload_interval_seconds
+            ):
+                size = len(snapshot)
+                await snapshot.reload(session_factory)
+                last_full_reload_at = time.monotonic()
+                logger.info(
+                    "Catalog snapshot reloaded",
+                    extra={"previous_size": size, "size": len(snapshot)},
+                )
+                continue
+            appended = await snapshot.refresh(session_factory)
+            if appended:
+                logger.info(
+                    "Catalog snapshot refreshed",
+                    extra={"appended": appended, "size": len(snapshot)},
+                )
+        except Exception as e:
+            refresh_failures.inc()
+            logger.warning(f"Failed to refresh catalog snapshot: {e}")
@@ -0,0 +1,28 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from typing import Optional
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
+from domain.repository.lgtm_image_repository_interface import (
+    LgtmImageRepositoryInterface,
+)
+from infrastructure.catalog_snapshot import CatalogSnapshot
+
+
+class CatalogSnapshotLgtmImageRepository(LgtmImageRepositoryInterface):
+    """メモリ上のスナップショットから読み取るリポジトリ（DBには問い合わせない）"""
+
+    def __init__(self, snapshot: CatalogSnapshot) -> None:
+        self._snapshot = snapshot
+
+    async def find_all_ids(self) -> list[LgtmImageId]:
+        return self._snapshot.all_ids()
+
+    async def find_by_ids(self, ids: list[LgtmImageId]) -> list[LgtmImageObject]:
+        return self._snapshot.find_by_ids(ids)
+
+    async def find_recently_created(
+        self, limit: int, before: Optional[LgtmImageId] = None
+    ) -> list[LgtmImageObject]:
+        return self._snapshot.find_recently_created(limit, before)
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from typing import Any, cast
 
 import aiohttp
@@ -17,11 +18,19 @@ from domain.lgtm_image_errors import (
 from domain.repository.jwt_token_verifier_repository_interface import (
     JwtTokenVerifierRepositoryInterface,
 )
+from infrastructure.jwt_prevalidation import prevalidate_jwt
+from metrics.registry import get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
 # JWKSキャッシュのTTL（秒）: 24時間
 JWKS_CACHE_TTL = 86400
+# JWKSにないkidによるJWKSの再取得の最小間隔（秒）
+# 不正なkidのトークンが大量に送られても、Cognitoへの取得はこの間隔で1回までに抑える
+JWKS_FORCED_REFRESH_MIN_INTERVAL = 30.0
+# 再取得してもJWKSになかったkidを記録しておく秒数と件数の上限
+UNKNOWN_KID_CACHE_TTL = 300.0
+UNKNOWN_KID_CACHE_MAX_SIZE = 10000
 
 
 def _build_cognito_jwks_url(region: str, user_pool_id: str) -> str:
@@ -33,15 +42,36 @@ def _build_cognito_issuer(region: str, user_pool_id: str) -> str:
 
 
 class CognitoTokenVerifierRepository(JwtTokenVerifierRepositoryInterface):
-    def __init__(self, region: str, user_pool_id: str, app_client_id: str) -> None:
+    def __init__(
+        self,
+        region: str,
+        user_pool_id: str,
+        app_client_id: str,
+        http_session: aiohttp.ClientSession | None = None,
+        jwks_url: str | None = None,
+        issuer: str | None = None,
+    ) -> None:
         self.region = region
         self.user_pool_id = user_pool_id
         self.app_client_id = app_client_id
-        self.keys_url = _build_cognito_jwks_url(region, user_pool_id)
-        self.expected_issuer = _build_cognito_issuer(region, user_pool_id)
+        # 指定された場合はCognito以外（ローカルのJWKSサーバーなど）の鍵と発行者で検証する
+        self.keys_url = jwks_url or _build_cognito_jwks_url(region, user_pool_id)
+        self.expected_issuer = issuer or _build_cognito_issuer(region, user_pool_id)
         self._jwks: dict[str, Any] | None = None
         self._jwks_cached_at: float | None = None
         self._jwks_lock: asyncio.Lock | None = None
+        # 共有HTTPセッション（未指定の場合はJWKS取得のたびにセッションを作成する）
+        self._http_session = http_session
+        # kidが見つからないことによる最後の再取得の時刻（time.monotonic()）
+        self._last_forced_refresh_at: float | None = None
+        # 再取得してもJWKSになかったkidと、記録を破棄する時刻（time.monotonic()）
+        self._unknown_kids: OrderedDict[str, float] = OrderedDict()
+        registry = get_metrics_registry()
+        self._forced_refreshes = registry.counter("jwks.forced_refreshes")
+        self._unknown_kid_rejections = registry.counter("jwks.unknown_kid_rejections")
+        self._prevalidation_rejections = registry.counter(
+            "jwt.prevalidation_rejections"
+        )
 
     def _ensure_lock(self) -> asyncio.Lock:
         """Lockを遅延初期化して取得（実行中のイベントループ内で作成）"""
@@ -60,9 +90,88 @@ class CognitoTokenVerifierRepository(JwtTokenVerifierRepositoryInterface):
         """JWKSを取得してキャッシュを更新"""
         self._jwks = await self._fetch_jwks()
         self._jwks_cached_at = time.time()
+        # 新しいJWKSには以前なかったkidが含まれている可能性がある
+        self._unknown_kids.clear()
         logger.info("JWKS refreshed successfully")
 
+    def _can_force_refresh(self) -> bool:
+        """kidが見つからない場合にJWKSを再取得してよいか（前回の再取得から最小間隔が経過したか）"""
+        return (
+            self._last_forced_refresh_at is None
+            or time.monotonic() - self._last_forced_refresh_at
+            >= JWKS_FORCED_REFRESH_MIN_INTERVAL
+        )
+
+    def _is_unknown_kid(self, kid: str) -> bool:
+        expires_at = self._unknown_kids.get(kid)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            del self._unknown_kids[kid]
+            return False
+        return True
+
+    def _remember_unknown_kid(self, kid: str) -> None:
+        self._unknown_kids[kid] = time.monotonic() + UNKNOWN_KID_CACHE_TTL
+        self._unknown_kids.move_to_end(kid)
+        if len(self._unknown_kids) > UNKNOWN_KID_CACHE_MAX_SIZE:
+            self._unknown_kids.popitem(last=False)
+
+    def _reject_unknown_kid(self, kid: str) -> ErrInvalidToken:
+        self._unknown_kid_rejections.inc()
+        return ErrInvalidToken(f"Unable to find key with kid '{kid}'")
+
+    async def _find_signing_key_with_refresh(self, kid: str) -> dict[str, Any]:
+        """キャッシュにないkidの鍵をJWKSを再取得して探す
+
+        鍵のローテーションに追従するためにJWKSを再取得するが、不正なkidのトークンが大量に送られても
+        Cognitoへの取得とロックの待ちが増えないように、以下の場合は再取得せずに拒否する。
+        - 再取得してもJWKSになかったkid
+        - 前回の再取得から JWKS_FORCED_REFRESH_MIN_INTERVAL 秒が経過していない場合
+          （再取得中の場合は、ローテーション直後の新しいkidを拒否しないように取得を待つ）
+
+        Raises:
+            ErrInvalidToken: kidに対応する鍵が見つからない場合
+        """
+        lock = self._ensure_lock()
+        if self._is_unknown_kid(kid) or (
+            not self._can_force_refresh() and not lock.locked()
+        ):
+            raise self._reject_unknown_kid(kid)
+
+        async with lock:
+            # ロックを待つ間に他のコルーチンが再取得した可能性がある
+            key = self._find_signing_key(kid)
+            if key:
+                return key
+            if self._can_force_refresh():
+                logger.warning(
+                    f"Key with kid '{kid}' not found in cache, refreshing JWKS"
+                )
+                # 取得に失敗した場合も最小間隔を空けるように、取得の前に記録する
+                self._last_forced_refresh_at = time.monotonic()
+                self._forced_refreshes.inc()
+                await self._refresh_jwks()
+                key = self._find_signing_key(kid)
+                if key:
+                    return key
+            self._remember_unknown_kid(kid)
+            raise self._reject_unknown_kid(kid)
+
     async def verify(self, token: str) -> dict[str, Any]:
+        try:
+            # 形式が不正・期限切れ・発行者が異なるトークンはJWKSの取得やRSAの検証の前に拒否する
+            unverified = prevalidate_jwt(
+                token, self.expected_issuer, self.app_client_id
+            )
+        except (ErrInvalidToken, ErrExpiredToken) as e:
+            self._prevalidation_rejections.inc()
+            logger.info(
+                "Token rejected before signature verification",
+                extra={"reason": str(e)},
+            )
+            raise
+
         try:
             # JWKSを取得またはリフレッシュ（TTL期限切れまたは初回）
             if self._is_jwks_expired():
@@ -71,31 +180,13 @@ class CognitoTokenVerifierRepository(JwtTokenVerifierRepositoryInterface):
                     if self._is_jwks_expired():
                         await self._refresh_jwks()
 
-            # トークンのヘッダーを取得してkidを確認
-            unverified_header = jose_jwt.get_unverified_header(token)
-            kid = unverified_header.get("kid")
-
-            if not kid:
-                raise ErrInvalidToken("Token header missing 'kid'")
-
-            # kidに対応する公開鍵を取得
+            # kidに対応する公開鍵を取得（kidの有無は事前の検証で確認済み）
+            kid = unverified["header"]["kid"]
             key = self._find_signing_key(kid)
 
             # フォールバック機構: kidが見つからない場合はJWKSを再取得
             if not key:
-                logger.warning(
-                    f"Key with kid '{kid}' not found in cache, refreshing JWKS"
-                )
-                async with self._ensure_lock():
-                    # 他のコルーチンが既に更新していないか確認
-                    key = self._find_signing_key(kid)
-                    if not key:
-                        await self._refresh_jwks()
-                        key = self._find_signing_key(kid)
-                        if not key:
-                            raise ErrInvalidToken(
-                                f"Unable to find key with kid '{kid}' even after refresh"
-                            )
+                key = await self._find_signing_key_with_refresh(kid)
 
             # トークンを検証
             payload = jose_jwt.decode(
@@ -110,6 +201,8 @@ class CognitoTokenVerifierRepository(JwtTokenVerifierRepositoryInterface):
             logger.info("Token verified successfully")
             return payload
 
+        except (ErrInvalidToken, ErrExpiredToken, ErrJwksFetchFailed):
+            raise
         except ExpiredSignatureError:
             logger.warning("Token has expired")
             raise ErrExpiredToken("Token has expired")
@@ -123,10 +216,10 @@ class CognitoTokenVerifierRepository(JwtTokenVerifierRepositoryInterface):
     async def _fetch_jwks(self) -> dict[str, Any]:
         try:
             timeout = aiohttp.ClientTimeout(total=10.0)
+            if self._http_session is not None:
+                return await self._get_jwks(self._http_session, timeout)
             async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(self.keys_url) as response:
-                    response.raise_for_status()
-                    return cast(dict[str, Any], await response.json())
+                return await self._get_jwks(session, timeout)
         except aiohttp.ClientError as e:
             logger.error(f"Failed to fetch JWKS: {e}")
             raise ErrJwksFetchFailed("Failed to fetch JWKS")
@@ -134,6 +227,13 @@ class CognitoTokenVerifierRepository(JwtTokenVerifierRepositoryInterface):
             logger.error(f"Failed to fetch JWKS: {e}")
             raise ErrJwksFetchFailed("Failed to fetch JWKS")
 
+    async def _get_jwks(
+        self, session: aiohttp.ClientSession, timeout: aiohttp.ClientTimeout
+    ) -> dict[str, Any]:
+        async with session.get(self.keys_url, timeout=timeout) as response:
+            response.raise_for_status()
+            return cast(dict[str, Any], await response.json())
+
     def _find_signing_key(self, kid: str) -> dict[str, Any] | None:
         if not self._jwks:
             return None
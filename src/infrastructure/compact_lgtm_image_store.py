@@ -0,0 +1,137 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import bisect
+import uuid
+from array import array
+from typing import Final, Optional, Required, TypedDict
+
+from domain.lgtm_image import LgtmImage, LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject, get_lgtm_image_url_factory
+
+_UUID_SIZE: Final[int] = 16
+# UUIDの形式でないファイル名の行に格納する値（実際のファイル名は別に保持する）
+_IRREGULAR_UUID: Final[bytes] = bytes(_UUID_SIZE)
+
+
+class CompactLgtmImageColumns(TypedDict):
+    """ファイルへの書き出し・読み込み用の列"""
+
+    ids: Required[array[int]]
+    path_indexes: Required[array[int]]
+    paths: Required[list[str]]
+    uuids: Required[bytes]
+    irregular_filenames: Required[dict[int, str]]
+
+
+class CompactLgtmImageStore:
+    """画像のレコードを少ないメモリで保持するストア
+
+    行ごとの辞書を作らずに、列ごとに次の形式で保持する。
+    - id: array('q')（ID順に追加する）
+    - path: 時間帯ごとのパス（例: 2021/03/16/23）を一覧に1回だけ保持し、行には番号を array('I') で持つ
+    - filename: UUIDを16バイトのバイナリとして1つの bytearray に連結する
+      （UUIDの形式でないファイル名だけは辞書に文字列のまま保持する）
+    LgtmImageObject や LgtmImage は参照されたときにO(1)で作成する。
+    """
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self._path_indexes = array("I")
+        self._paths: list[str] = []
+        self._path_numbers: dict[str, int] = {}
+        self._uuids = bytearray()
+        self._irregular_filenames: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_columns(cls, columns: CompactLgtmImageColumns) -> "CompactLgtmImageStore":
+        """columns で取り出した列からストアを作成する
+
+        Raises:
+            ValueError: 列の長さや番号が整合していない場合
+        """
+        count = len(columns["ids"])
+        if (
+            len(columns["path_indexes"]) != count
+            or len(columns["uuids"]) != count * _UUID_SIZE
+            or max(columns["path_indexes"], default=-1) >= len(columns["paths"])
+            or any(not 0 <= pos < count for pos in columns["irregular_filenames"])
+        ):
+            raise ValueError("inconsistent compact image store columns")
+
+        store = cls()
+        store.ids = columns["ids"]
+        store._path_indexes = columns["path_indexes"]
+        store._paths = columns["paths"]
+        store._path_numbers = {path: number for number, path in enumerate(store._paths)}
+        store._uuids = bytearray(columns["uuids"])
+        store._irregular_filenames = columns["irregular_filenames"]
+        return store
+
+    def columns(self) -> CompactLgtmImageColumns:
+        return CompactLgtmImageColumns(
+            ids=self.ids,
+            path_indexes=self._path_indexes,
+            paths=self._paths,
+            uuids=bytes(self._uuids),
+            irregular_filenames=self._irregular_filenames,
+        )
+
+    def append(self, id_: int, path: str, filename: str) -> None:
+        if self.ids and id_ <= self.ids[-1]:
+            raise ValueError(f"rows must be appended in id order: {id_}")
+
+        path_number = self._path_numbers.get(path)
+        if path_number is None:
+            path_number = len(self._paths)
+            self._paths.append(path)
+            self._path_numbers[path] = path_number
+
+        position = len(self.ids)
+        uuid_bytes = _to_uuid_bytes(filename)
+        if uuid_bytes is None:
+            self._irregular_filenames[position] = filename
+            uuid_bytes = _IRREGULAR_UUID
+
+        self.ids.append(id_)
+        self._path_indexes.append(path_number)
+        self._uuids += uuid_bytes
+
+    def position_of(self, id_: LgtmImageId) -> Optional[int]:
+        position = bisect.bisect_left(self.ids, id_)
+        if position < len(self.ids) and self.ids[position] == id_:
+            return position
+        return None
+
+    def path_at(self, position: int) -> str:
+        return self._paths[self._path_indexes[position]]
+
+    def filename_at(self, position: int) -> str:
+        filename = self._irregular_filenames.get(position)
+        if filename is not None:
+            return filename
+        start = position * _UUID_SIZE
+        # uuid.UUID を経由するより速いため、16進文字列から直接組み立てる
+        h = self._uuids[start : start + _UUID_SIZE].hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def object_at(self, position: int) -> LgtmImageObject:
+        return LgtmImageObject(
+            LgtmImageId(self.ids[position]),
+            self.path_at(position),
+            self.filename_at(position),
+        )
+
+    def image_at(self, position: int, base_url: str) -> LgtmImage:
+        return get_lgtm_image_url_factory(base_url).create(self.object_at(position))
+
+
+def _to_uuid_bytes(filename: str) -> Optional[bytes]:
+    # 文字列に戻したときに元のファイル名と一致する場合だけバイナリで保持する
+    try:
+        value = uuid.UUID(filename)
+    except ValueError:
+        return None
+    return value.bytes if str(value) == filename else None
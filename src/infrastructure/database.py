@@ -1,11 +1,109 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
+import asyncio
 import os
 import ssl
-from collections.abc import AsyncGenerator
-
-from sqlalchemy import URL
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import URL, exc, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from domain.lgtm_image_errors import ErrDatabaseBusy
+from metrics.registry import Counter, Histogram, MetricsRegistry
+
+
+@dataclass(frozen=True)
+class DatabasePoolSettings:
+    """コネクションプールの設定
+
+    checkout_budget_seconds が0より大きい場合はfast-failモードとなり、
+    コネクションの取得待ちがこの秒数を超えた時点で ErrDatabaseBusy を送出する。
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 5
+    pool_timeout: float = 30
+    pool_recycle: int = 1800
+    checkout_budget_seconds: float = 0
+
+    @property
+    def checkout_timeout(self) -> float:
+        if self.checkout_budget_seconds > 0:
+            return min(self.checkout_budget_seconds, self.pool_timeout)
+        return self.pool_timeout
+
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    """コネクションプールのメトリクス"""
+
+    checkout_wait_seconds: Histogram
+    overflow_checkouts: Counter
+    checkout_timeouts: Counter
+
+    @classmethod
+    def create(cls, registry: MetricsRegistry, name: str) -> "PoolMetrics":
+        prefix = f"db_pool.{name}"
+        return cls(
+            checkout_wait_seconds=registry.histogram(f"{prefix}.checkout_wait_seconds"),
+            overflow_checkouts=registry.counter(f"{prefix}.overflow_checkouts"),
+            checkout_timeouts=registry.counter(f"{prefix}.checkout_timeouts"),
+        )
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """コネクションの取得待ち時間・オーバーフロー・タイムアウトを計測するプール
+
+    取得待ちのタイムアウトは ErrDatabaseBusy に変換する。
+    """
+
+    def __init__(
+        self,
+        creator: Any,
+        pool_metrics: Optional[PoolMetrics] = None,
+        **kw: Any,
+    ) -> None:
+        super().__init__(creator, **kw)
+        self._pool_metrics = pool_metrics
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        overflow_before = self._overflow
+        try:
+            connection = super().connect()
+        except exc.TimeoutError as e:
+            if self._pool_metrics is not None:
+                self._pool_metrics.checkout_timeouts.inc()
+            raise ErrDatabaseBusy(str(e)) from e
+        finally:
+            if self._pool_metrics is not None:
+                self._pool_metrics.checkout_wait_seconds.observe(
+                    time.perf_counter() - started_at
+                )
+
+        # プールの上限を超えてコネクションを新規作成した場合
+        if (
+            self._pool_metrics is not None
+            and self._overflow > overflow_before
+            and self._overflow > 0
+        ):
+            self._pool_metrics.overflow_checkouts.inc()
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        # dispose時に作り直されるプールにもメトリクスを引き継ぐ
+        pool = super().recreate()
+        assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+        pool._pool_metrics = self._pool_metrics
+        return pool
 
 
 def get_database_url() -> URL:
@@ -35,6 +133,25 @@ def get_database_url() -> URL:
     )
 
 
+def get_replica_database_url() -> Optional[URL]:
+    """リードレプリカの接続URLを返す（未設定の場合はNone）
+
+    DATABASE_REPLICA_HOST・DATABASE_REPLICA_NAME のどちらかが設定されている場合に、
+    プライマリの接続情報を上書きして構築する。
+    PlanetScaleのレプリカに接続する場合は DATABASE_REPLICA_NAME に "<database>@replica" を指定する。
+    """
+    replica_host = os.getenv("DATABASE_REPLICA_HOST")
+    replica_name = os.getenv("DATABASE_REPLICA_NAME")
+    if not replica_host and not replica_name:
+        return None
+
+    primary_url = get_database_url()
+    return primary_url.set(
+        host=replica_host or primary_url.host,
+        database=replica_name or primary_url.database,
+    )
+
+
 def get_ssl_context() -> ssl.SSLContext:
     ssl_context = ssl.create_default_context()
     ssl_context.check_hostname = True
@@ -42,29 +159,46 @@ def get_ssl_context() -> ssl.SSLContext:
     return ssl_context
 
 
-# 非同期エンジンの作成
-engine = create_async_engine(
-    get_database_url(),
-    echo=False,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=5,
-    pool_recycle=1800,
-    pool_timeout=30,
-    connect_args={
-        "ssl": get_ssl_context(),
-    },
-)
+def create_database_engine(
+    database_url: URL,
+    pool_settings: DatabasePoolSettings,
+    pool_metrics: Optional[PoolMetrics] = None,
+    ssl: bool = True,
+) -> AsyncEngine:
+    """非同期エンジンを作成する（接続はこの時点では確立されない）
+
+    ssl に False を指定した場合はTLSを使わずに接続する（ローカルのMySQLに接続する場合）。
+    """
+    return create_async_engine(
+        database_url,
+        echo=False,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_metrics=pool_metrics,
+        pool_pre_ping=True,
+        pool_size=pool_settings.pool_size,
+        max_overflow=pool_settings.max_overflow,
+        pool_recycle=pool_settings.pool_recycle,
+        pool_timeout=pool_settings.checkout_timeout,
+        connect_args={"ssl": get_ssl_context()} if ssl else {},
+    )
 
-# セッションファクトリーの作成
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
 
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+async def warm_up_connection_pool(engine: AsyncEngine, connections: int) -> None:
+    """コネクションを同時に確立してプールに保持させる
+
+    デプロイ直後の最初のリクエストが接続確立のコストを負担しないように、起動時に呼び出す。
+    """
+
+    async def _ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
 
-async def create_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """データベースセッションを取得する依存性注入用の関数."""
-    async with AsyncSessionLocal() as session:
-        yield session
+    await asyncio.gather(*(_ping() for _ in range(connections)))
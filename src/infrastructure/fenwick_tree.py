@@ -0,0 +1,69 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from collections.abc import Iterable
+
+
+class FenwickTree:
+    """重みの累積和を保持するFenwick木（Binary Indexed Tree）
+
+    末尾への追加・重みの加算・累積和からの位置の検索をいずれもO(log n)で行う。
+    位置は0始まり。
+    """
+
+    def __init__(self, weights: Iterable[float] = ()) -> None:
+        # _tree[i] は (i - (i & -i), i] の区間の重みの合計（1始まり、_tree[0]は未使用）
+        self._tree: list[float] = [0.0, *weights]
+        # 初期の重みからO(n)で構築する
+        for index in range(1, len(self._tree)):
+            parent = index + (index & -index)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[index]
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    @property
+    def total(self) -> float:
+        return self.prefix_sum(len(self))
+
+    def append(self, weight: float) -> None:
+        """末尾に重みを追加する"""
+        index = len(self._tree)
+        lowest_bit = index & -index
+        self._tree.append(
+            weight + self.prefix_sum(index - 1) - self.prefix_sum(index - lowest_bit)
+        )
+
+    def add(self, position: int, delta: float) -> None:
+        """指定した位置の重みに delta を加える"""
+        if not 0 <= position < len(self):
+            raise IndexError(f"position out of range: {position}")
+        index = position + 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def weight(self, position: int) -> float:
+        """指定した位置の重みを返す"""
+        return self.prefix_sum(position + 1) - self.prefix_sum(position)
+
+    def prefix_sum(self, count: int) -> float:
+        """先頭から count 件の重みの合計を返す"""
+        total = 0.0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def find(self, value: float) -> int:
+        """累積和が value を超える最初の位置を返す（0 <= value < total であること）"""
+        position = 0
+        step = 1 << len(self).bit_length()
+        while step > 0:
+            next_position = position + step
+            if next_position <= len(self) and self._tree[next_position] <= value:
+                position = next_position
+                value -= self._tree[next_position]
+            step >>= 1
+        # 浮動小数点の誤差で末尾を超えた場合は最後の位置を返す
+        return min(position, len(self) - 1)
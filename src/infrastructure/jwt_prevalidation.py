@@ -0,0 +1,94 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import base64
+import binascii
+import json
+import re
+import time
+from typing import Any, Final, Optional, TypedDict
+
+from domain.lgtm_image_errors import ErrExpiredToken, ErrInvalidToken
+
+# トークンの長さの上限（Cognitoのアクセストークンは1KB前後）
+MAX_TOKEN_LENGTH: Final[int] = 8192
+# 署名の検証に使うアルゴリズム（"none" やHMACによるアルゴリズムの置き換えを拒否する）
+ALLOWED_ALGORITHMS: Final[frozenset[str]] = frozenset({"RS256"})
+
+_BASE64URL_SEGMENT = re.compile(r"[A-Za-z0-9_-]+")
+
+
+class UnverifiedJwt(TypedDict):
+    """署名を検証する前のトークンのヘッダーとクレーム"""
+
+    header: dict[str, Any]
+    claims: dict[str, Any]
+
+
+def _decode_segment(segment: str) -> dict[str, Any]:
+    try:
+        padded = segment + "=" * (-len(segment) % 4)
+        decoded = json.loads(base64.urlsafe_b64decode(padded).decode())
+    except (binascii.Error, UnicodeError, ValueError, RecursionError) as e:
+        raise ErrInvalidToken("Invalid token: malformed segment") from e
+    if not isinstance(decoded, dict):
+        raise ErrInvalidToken("Invalid token: malformed segment")
+    return decoded
+
+
+def _is_issued_for_client(claims: dict[str, Any], app_client_id: str) -> bool:
+    # アクセストークンは client_id、IDトークンは aud にアプリクライアントIDが入る
+    client_id = claims.get("client_id")
+    if client_id is not None and client_id != app_client_id:
+        return False
+    audience = claims.get("aud")
+    if audience is None:
+        return True
+    if isinstance(audience, str):
+        return audience == app_client_id
+    return isinstance(audience, list) and app_client_id in audience
+
+
+def prevalidate_jwt(
+    token: str,
+    expected_issuer: str,
+    app_client_id: str,
+    now: Optional[float] = None,
+) -> UnverifiedJwt:
+    """RSAの署名を検証する前に、署名を検証しなくても受け付けられないとわかるトークンを拒否する
+
+    形式（3つのbase64urlのセグメント）・長さ・alg・kid と、署名を検証していない exp・iss・
+    client_id（aud）を確認する。ここを通過したトークンも、署名とクレームは改めて検証すること。
+
+    Raises:
+        ErrInvalidToken: トークンの形式やクレームが不正な場合
+        ErrExpiredToken: トークンの有効期限が切れている場合
+    """
+    if len(token) > MAX_TOKEN_LENGTH:
+        raise ErrInvalidToken("Invalid token: token is too large")
+
+    segments = token.split(".")
+    if len(segments) != 3 or not all(
+        _BASE64URL_SEGMENT.fullmatch(segment) for segment in segments
+    ):
+        raise ErrInvalidToken("Invalid token: malformed token")
+
+    header = _decode_segment(segments[0])
+    if header.get("alg") not in ALLOWED_ALGORITHMS:
+        raise ErrInvalidToken("Invalid token: unsupported algorithm")
+    kid = header.get("kid")
+    if not kid or not isinstance(kid, str):
+        raise ErrInvalidToken("Token header missing 'kid'")
+
+    claims = _decode_segment(segments[1])
+    exp = claims.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+            raise ErrInvalidToken("Invalid token: malformed 'exp' claim")
+        if exp < (time.time() if now is None else now):
+            raise ErrExpiredToken("Token has expired")
+    if claims.get("iss") != expected_issuer:
+        raise ErrInvalidToken("Invalid token: unexpected issuer")
+    if not _is_issued_for_client(claims, app_client_id):
+        raise ErrInvalidToken("Invalid token: unexpected client")
+
+    return UnverifiedJwt(header=header, claims=claims)
@@ -0,0 +1,88 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Optional
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
+from metrics.registry import MetricsRegistry, get_metrics_registry
+
+
+class LgtmImageObjectCache:
+    """画像IDをキーとしてLgtmImageObjectを保持するLRUキャッシュ
+
+    ワーカープロセスごとに保持し、リクエストをまたいで共有する。件数の上限を超えた場合は最も長く
+    使われていない画像から追い出す。DBで削除・変更された画像は無効化されないため、ttl_seconds
+    が0より大きい場合は追加してからその秒数が経過した画像をキャッシュにないものとして扱う
+    （0の場合は追い出されるまで保持する）。
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        registry: Optional[MetricsRegistry] = None,
+        ttl_seconds: float = 0,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+        if ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds must not be negative: {ttl_seconds}")
+        self._capacity = capacity
+        self._ttl_seconds = ttl_seconds
+        # 画像IDごとに、有効期限の時刻（time.monotonic()、期限がない場合はinf）と画像を保持する
+        self._entries: OrderedDict[LgtmImageId, tuple[float, LgtmImageObject]] = (
+            OrderedDict()
+        )
+        registry = registry or get_metrics_registry()
+        self._hits = registry.counter("lgtm_image_cache.hits")
+        self._misses = registry.counter("lgtm_image_cache.misses")
+        self._evictions = registry.counter("lgtm_image_cache.evictions")
+        self._expirations = registry.counter("lgtm_image_cache.expirations")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self, ids: Iterable[LgtmImageId]
+    ) -> tuple[list[LgtmImageObject], list[LgtmImageId]]:
+        """キャッシュにある画像と、キャッシュにないIDを返す"""
+        found: list[LgtmImageObject] = []
+        misses: list[LgtmImageId] = []
+        expired = 0
+        now = time.monotonic() if self._ttl_seconds > 0 else 0.0
+        for id_ in ids:
+            entry = self._entries.get(id_)
+            if entry is None:
+                misses.append(id_)
+                continue
+            expires_at, lgtm_image_object = entry
+            if expires_at <= now:
+                del self._entries[id_]
+                expired += 1
+                misses.append(id_)
+                continue
+            self._entries.move_to_end(id_)
+            found.append(lgtm_image_object)
+
+        self._hits.inc(len(found))
+        self._misses.inc(len(misses))
+        self._expirations.inc(expired)
+        return found, misses
+
+    def put_many(self, lgtm_image_objects: Iterable[LgtmImageObject]) -> None:
+        expires_at = (
+            time.monotonic() + self._ttl_seconds
+            if self._ttl_seconds > 0
+            else float("inf")
+        )
+        for lgtm_image_object in lgtm_image_objects:
+            self._entries[lgtm_image_object.id] = (expires_at, lgtm_image_object)
+            self._entries.move_to_end(lgtm_image_object.id)
+
+        evicted = 0
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+            evicted += 1
+        self._evictions.inc(evicted)
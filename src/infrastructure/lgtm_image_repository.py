@@ -1,6 +1,9 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from sqlalchemy import select
+from collections.abc import Iterable
+from typing import Final, Optional
+
+from sqlalchemy import Row, and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.lgtm_image import LgtmImageId
@@ -13,6 +16,25 @@ from log.logger import get_logger
 
 logger = get_logger(__name__)
 
+# find_by_idsで1回のクエリのIN句に渡すIDの最大数
+FIND_BY_IDS_CHUNK_SIZE: Final[int] = 500
+
+# LgtmImageObjectに必要なカラムだけを取得する（ORMエンティティの生成とidentity mapへの登録を避ける）
+_LGTM_IMAGE_OBJECT_COLUMNS = (
+    LgtmImageModel.id,
+    LgtmImageModel.path,
+    LgtmImageModel.filename,
+)
+
+
+def _to_lgtm_image_objects(
+    rows: Iterable[Row[tuple[int, str, str]]],
+) -> list[LgtmImageObject]:
+    return [
+        LgtmImageObject(LgtmImageId(id_), path, filename)
+        for id_, path, filename in rows
+    ]
+
 
 class LgtmImageRepository(LgtmImageRepositoryInterface):
     def __init__(self, session: AsyncSession) -> None:
@@ -20,7 +42,10 @@ class LgtmImageRepository(LgtmImageRepositoryInterface):
 
     async def find_all_ids(self) -> list[LgtmImageId]:
         logger.info("Finding all LGTM image IDs")
-        result = await self._session.execute(select(LgtmImageModel.id))
+        # 抽選側でIDの一覧の変化を検知できるようにID順で返す（主キー順のため追加コストはない）
+        result = await self._session.execute(
+            select(LgtmImageModel.id).order_by(LgtmImageModel.id)
+        )
         ids = result.scalars().all()
         lgtm_image_ids = [LgtmImageId(id_) for id_ in ids]
         logger.info("Found LGTM image IDs", extra={"count": len(lgtm_image_ids)})
@@ -34,45 +59,54 @@ class LgtmImageRepository(LgtmImageRepositoryInterface):
             logger.info("Found LGTM images", extra={"count": 0})
             return []
 
-        # int型に変換してクエリ実行
-        int_ids = [int(id_) for id_ in ids]
-        result = await self._session.execute(
-            select(LgtmImageModel).where(LgtmImageModel.id.in_(int_ids))
-        )
-        models = result.scalars().all()
-
-        # DBモデルをドメインエンティティに変換
-        image_objects = [
-            LgtmImageObject(
-                id=LgtmImageId(model.id),
-                path=model.path,
-                filename=model.filename,
+        # int型に変換し、IN句が大きくなりすぎないように分割してクエリ実行
+        int_ids = list(dict.fromkeys(int(id_) for id_ in ids))
+        image_objects: list[LgtmImageObject] = []
+        for start in range(0, len(int_ids), FIND_BY_IDS_CHUNK_SIZE):
+            chunk = int_ids[start : start + FIND_BY_IDS_CHUNK_SIZE]
+            result = await self._session.execute(
+                select(*_LGTM_IMAGE_OBJECT_COLUMNS).where(LgtmImageModel.id.in_(chunk))
             )
-            for model in models
-        ]
+            image_objects.extend(_to_lgtm_image_objects(result))
 
         logger.info("Found LGTM images", extra={"count": len(image_objects)})
         return image_objects
 
-    async def find_recently_created(self, limit: int) -> list[LgtmImageObject]:
-        logger.info("Finding recently created LGTM images", extra={"limit": limit})
+    async def find_recently_created(
+        self, limit: int, before: Optional[LgtmImageId] = None
+    ) -> list[LgtmImageObject]:
+        logger.info(
+            "Finding recently created LGTM images",
+            extra={"limit": limit, "before": before},
+        )
+
+        query = select(*_LGTM_IMAGE_OBJECT_COLUMNS)
+        if before is not None:
+            # キーセットページネーション: (created_at, id) が指定した画像より前の行を取得する
+            # OFFSETを使わないため、深いページでも (created_at, id) インデックスで limit 件だけ読む
+            before_created_at = await self._session.scalar(
+                select(LgtmImageModel.created_at).where(LgtmImageModel.id == before)
+            )
+            if before_created_at is None:
+                logger.info("Cursor image not found", extra={"before": before})
+                return []
+
+            query = query.where(
+                or_(
+                    LgtmImageModel.created_at < before_created_at,
+                    and_(
+                        LgtmImageModel.created_at == before_created_at,
+                        LgtmImageModel.id < before,
+                    ),
+                )
+            )
 
         result = await self._session.execute(
-            select(LgtmImageModel)
-            .order_by(LgtmImageModel.created_at.desc())
-            .limit(limit)
+            query.order_by(
+                LgtmImageModel.created_at.desc(), LgtmImageModel.id.desc()
+            ).limit(limit)
         )
-        models = result.scalars().all()
-
-        # DBモデルをドメインエンティティに変換
-        image_objects = [
-            LgtmImageObject(
-                id=LgtmImageId(model.id),
-                path=model.path,
-                filename=model.filename,
-            )
-            for model in models
-        ]
+        image_objects = _to_lgtm_image_objects(result)
 
         logger.info(
             "Found recently created LGTM images", extra={"count": len(image_objects)}
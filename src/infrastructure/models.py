@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, Index, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -12,6 +12,9 @@ class Base(DeclarativeBase):
 
 class LgtmImageModel(Base):
     __tablename__ = "lgtm_images"
+    # 最近作成された画像の一覧（created_at DESC, id DESC）のキーセットページネーション用
+    # migrations/20261019000000_add_created_at_id_index_to_lgtm_images.sql で作成する
+    __table_args__ = (Index("idx_lgtm_images_created_at_id", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(
         primary_key=True, autoincrement=True, nullable=False
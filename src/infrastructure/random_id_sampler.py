@@ -0,0 +1,166 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import bisect
+import random
+from collections.abc import Sequence
+from typing import Final, Optional
+
+from domain.lgtm_image import LgtmImageId
+from domain.repository.random_id_sampler_interface import RandomIdSamplerInterface
+from infrastructure.fenwick_tree import FenwickTree
+
+RANDOM_SAMPLER_MODE_UNIFORM: Final[str] = "uniform"
+RANDOM_SAMPLER_MODE_DECK: Final[str] = "deck"
+RANDOM_SAMPLER_MODE_RECENCY: Final[str] = "recency"
+
+DEFAULT_RECENCY_HALF_LIFE: Final[int] = 5000
+
+# 重みの指数がこの値を超えたら基準を取り直す（floatの上限 2**1024 に達しないようにする）
+_MAX_WEIGHT_EXPONENT: Final[float] = 512
+# 残りの重みの合計がこの割合を下回ったら、浮動小数点の誤差とみなす
+_NEGLIGIBLE_WEIGHT_RATIO: Final[float] = 1e-12
+
+
+class UniformRandomIdSampler(RandomIdSamplerInterface):
+    """リクエストごとに独立して抽選する"""
+
+    def sample(self, ids: Sequence[LgtmImageId], limit: int) -> list[LgtmImageId]:
+        return random.sample(ids, limit)
+
+
+class DeckRandomIdSampler(RandomIdSamplerInterface):
+    """シャッフルしたIDの山札から、重ならない区間を順番に配る
+
+    連続したリクエストで同じ画像が出にくくなる。山札を配り切った場合と、
+    IDの一覧が変わった（新しい画像が追加された）場合にシャッフルし直す。
+    1回の抽選はシャッフル時を除きO(limit)。ワーカープロセスごとに山札を持つ。
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self._rng = rng or random.Random()
+        self._deck: list[LgtmImageId] = []
+        self._position = 0
+        # IDはID順に並んでいるため、件数と最大IDでIDの一覧の変化を検知する
+        self._pool_fingerprint: Optional[tuple[int, LgtmImageId]] = None
+
+    def sample(self, ids: Sequence[LgtmImageId], limit: int) -> list[LgtmImageId]:
+        if not ids:
+            return []
+
+        fingerprint = (len(ids), ids[-1])
+        if fingerprint != self._pool_fingerprint:
+            self._pool_fingerprint = fingerprint
+            self._shuffle(ids)
+
+        dealt = self._deck[self._position : self._position + limit]
+        self._position += len(dealt)
+        if len(dealt) == limit:
+            return dealt
+
+        # 山札の残りが足りない場合はシャッフルし直し、今回配ったID以外から補充する
+        dealt_ids = set(dealt)
+        self._shuffle(ids)
+        while len(dealt) < limit and self._position < len(self._deck):
+            id_ = self._deck[self._position]
+            self._position += 1
+            if id_ not in dealt_ids:
+                dealt.append(id_)
+        return dealt
+
+    def _shuffle(self, ids: Sequence[LgtmImageId]) -> None:
+        self._deck = list(ids)
+        self._rng.shuffle(self._deck)
+        self._position = 0
+
+
+class RecencyWeightedRandomIdSampler(RandomIdSamplerInterface):
+    """新しい画像ほど選ばれやすくなるように重み付けして抽選する
+
+    ID順で half_life 件古くなるごとに重みが半分になる。重みはFenwick木で保持し、
+    新しい画像が追加された場合は末尾に重みを追加するだけで済む（リクエストごとに作り直さない）。
+    抽選ではFenwick木を更新しないため、長時間動かしても重みに浮動小数点の誤差が蓄積しない。
+    1回の抽選はO(limit (log n + limit))。ワーカープロセスごとに重みを持つ。
+    """
+
+    def __init__(
+        self,
+        half_life: int = DEFAULT_RECENCY_HALF_LIFE,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if half_life <= 0:
+            raise ValueError(f"half_life must be positive: {half_life}")
+        self._half_life = half_life
+        self._rng = rng or random.Random()
+        self._ids: list[LgtmImageId] = []
+        self._weights = FenwickTree()
+        # 重みは 2 ** ((位置 - _base) / half_life)。全体を定数倍しても確率は変わらないため、
+        # 古い画像の重みを更新せずに新しい画像を追加できる
+        self._base = 0
+
+    def sample(self, ids: Sequence[LgtmImageId], limit: int) -> list[LgtmImageId]:
+        self._sync(ids)
+        limit = min(limit, len(self._ids))
+
+        # 選んだ画像の累積和の区間 [start, start + weight) を除いた残りの重みから選ぶ
+        # （Fenwick木の重みを一時的に0にすると、加減算の誤差が蓄積するため木は更新しない）
+        total = self._weights.total
+        chosen: dict[int, None] = {}
+        excluded: list[tuple[float, float]] = []
+        remaining = total
+        while len(chosen) < limit:
+            if remaining <= total * _NEGLIGIBLE_WEIGHT_RATIO:
+                # 重みが残っていない（古すぎて0になった）画像からは一様に選ぶ
+                chosen.setdefault(self._rng.randrange(len(self._ids)))
+                continue
+            value = self._rng.random() * remaining
+            # 選んだ区間はstartの昇順に並んでいるため、手前にある区間の重みだけ後ろにずらす
+            for start, weight in excluded:
+                if start > value:
+                    break
+                value += weight
+            position = self._weights.find(value)
+            if position in chosen:
+                # 区間の境界での浮動小数点の誤差で選んだ画像に当たった場合は選び直す
+                continue
+            weight = self._weights.weight(position)
+            chosen[position] = None
+            bisect.insort(excluded, (self._weights.prefix_sum(position), weight))
+            remaining -= weight
+
+        return [self._ids[position] for position in chosen]
+
+    def _sync(self, ids: Sequence[LgtmImageId]) -> None:
+        # IDはID順に並んでいるため、既存の末尾が一致すれば新しい画像の追加とみなす
+        known = len(self._ids)
+        if not (known and len(ids) >= known and ids[known - 1] == self._ids[-1]):
+            self._rebuild(ids)
+            return
+
+        for position in range(known, len(ids)):
+            exponent = (position - self._base) / self._half_life
+            if exponent > _MAX_WEIGHT_EXPONENT:
+                self._rebuild(ids)
+                return
+            self._ids.append(ids[position])
+            self._weights.append(2.0**exponent)
+
+    def _rebuild(self, ids: Sequence[LgtmImageId]) -> None:
+        # 最新の画像を基準に重みを作り直す
+        self._ids = list(ids)
+        self._base = max(len(ids) - 1, 0)
+        self._weights = FenwickTree(
+            2.0 ** ((position - self._base) / self._half_life)
+            for position in range(len(ids))
+        )
+
+
+def create_random_id_sampler(
+    mode: str, recency_half_life: int = DEFAULT_RECENCY_HALF_LIFE
+) -> RandomIdSamplerInterface:
+    if mode == RANDOM_SAMPLER_MODE_DECK:
+        return DeckRandomIdSampler()
+    if mode == RANDOM_SAMPLER_MODE_RECENCY:
+        return RecencyWeightedRandomIdSampler(recency_half_life)
+    if mode == RANDOM_SAMPLER_MODE_UNIFORM:
+        return UniformRandomIdSampler()
+    raise ValueError(f"Unknown random sampler mode: {mode}")
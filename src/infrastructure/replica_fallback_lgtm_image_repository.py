@@ -0,0 +1,63 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from collections.abc import Awaitable, Callable
+from typing import Optional, TypeVar
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_errors import ErrDatabaseBusy
+from domain.lgtm_image_object import LgtmImageObject
+from domain.repository.lgtm_image_repository_interface import (
+    LgtmImageRepositoryInterface,
+)
+from log.logger import get_logger
+from metrics.registry import get_metrics_registry
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ReplicaFallbackLgtmImageRepository(LgtmImageRepositoryInterface):
+    """リードレプリカから読み取り、失敗した場合はプライマリから読み取るリポジトリ
+
+    一度レプリカへの問い合わせに失敗した後は、同じリクエスト内ではプライマリのみを使う。
+    """
+
+    def __init__(
+        self,
+        replica: LgtmImageRepositoryInterface,
+        primary: LgtmImageRepositoryInterface,
+    ) -> None:
+        self._replica = replica
+        self._primary = primary
+        self._use_primary = False
+        self._fallbacks = get_metrics_registry().counter("db.replica_fallbacks")
+
+    async def _read(
+        self, query: Callable[[LgtmImageRepositoryInterface], Awaitable[T]]
+    ) -> T:
+        if self._use_primary:
+            return await query(self._primary)
+
+        try:
+            return await query(self._replica)
+        except (SQLAlchemyError, ErrDatabaseBusy, OSError) as e:
+            logger.warning(f"Replica query failed, falling back to primary: {e}")
+            self._fallbacks.inc()
+            self._use_primary = True
+            return await query(self._primary)
+
+    async def find_all_ids(self) -> list[LgtmImageId]:
+        return await self._read(lambda repository: repository.find_all_ids())
+
+    async def find_by_ids(self, ids: list[LgtmImageId]) -> list[LgtmImageObject]:
+        return await self._read(lambda repository: repository.find_by_ids(ids))
+
+    async def find_recently_created(
+        self, limit: int, before: Optional[LgtmImageId] = None
+    ) -> list[LgtmImageObject]:
+        return await self._read(
+            lambda repository: repository.find_recently_created(limit, before)
+        )
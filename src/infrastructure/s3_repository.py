@@ -1,8 +1,6 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from typing import Any
-
-import aioboto3
+from typing import TYPE_CHECKING, Any
 
 from domain.repository.object_storage_repository_interface import (
     ObjectStorageRepositoryInterface,
@@ -10,31 +8,34 @@ from domain.repository.object_storage_repository_interface import (
 from domain.create_lgtm_image import UploadObjectStorageDto
 from log.logger import get_logger
 
+if TYPE_CHECKING:
+    from types_aiobotocore_s3 import S3Client
+
 logger = get_logger(__name__)
 
 
 class S3Repository(ObjectStorageRepositoryInterface):
-    def __init__(self, bucket_name: str) -> None:
+    def __init__(self, bucket_name: str, s3_client: "S3Client") -> None:
         self.bucket_name = bucket_name
-        self.session = aioboto3.Session()
+        # アプリケーション起動時に作成した共有クライアント（接続を使い回す）
+        self.s3_client = s3_client
 
     async def upload(self, param: UploadObjectStorageDto) -> None:
         try:
-            async with self.session.client("s3") as s3_client:
-                extra_args: dict[str, Any] = {
-                    "ContentType": self._get_content_type(param["image_extension"])
-                }
-
-                await s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=param["key"],
-                    Body=param["body"],
-                    **extra_args,
-                )
-
-                logger.info(
-                    f"Successfully uploaded to S3: bucket={self.bucket_name}, key={param['key']}"
-                )
+            extra_args: dict[str, Any] = {
+                "ContentType": self._get_content_type(param.image_extension)
+            }
+
+            await self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=param.key,
+                Body=param.body,
+                **extra_args,
+            )
+
+            logger.info(
+                f"Successfully uploaded to S3: bucket={self.bucket_name}, key={param.key}"
+            )
         except Exception as e:
             logger.error(f"Failed to upload to S3: {e}")
             raise
@@ -2,52 +2,121 @@
 
 import json
 import logging
+import time
 import traceback
+from collections.abc import Callable
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Final, Optional
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - orjsonは任意依存
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# JSONエンコーダーの型（ログデータを受け取りJSON文字列を返す）
+JsonEncoder = Callable[[dict[str, Any]], str]
+
+# LogRecordの標準属性（追加のカスタムフィールドとして出力しないキー）
+_RESERVED_RECORD_ATTRS: Final[frozenset[str]] = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "request_id",
+    }
+)
+
+
+def _encode_with_json(log_data: dict[str, Any]) -> str:
+    return json.dumps(log_data, ensure_ascii=False, default=str)
+
+
+def _encode_with_orjson(log_data: dict[str, Any]) -> str:
+    encoded: bytes = orjson.dumps(log_data, default=str)
+    return encoded.decode("utf-8")
+
+
+def get_json_encoder(name: str) -> JsonEncoder:
+    """名前に対応するJSONエンコーダーを返す
+
+    "orjson" が指定されてもorjsonがインストールされていない場合は標準のjsonを使う。
+    """
+    if name == "orjson" and orjson is not None:
+        return _encode_with_orjson
+    return _encode_with_json
+
+
+class _UtcTimestampFormatter:
+    """LogRecord.createdをISO 8601（UTC）文字列に変換する
+
+    秒単位の部分を直前の値とともにキャッシュし、同一秒内のログでは
+    datetimeの生成を省略する。出力は datetime.isoformat() と同一。
+    """
+
+    def __init__(self) -> None:
+        self._cached_second: int | None = None
+        self._cached_prefix = ""
+
+    def format(self, created: float) -> str:
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime(
+                "%Y-%m-%dT%H:%M:%S", time.gmtime(second)
+            )
+            self._cached_second = second
+
+        microsecond = round((created - second) * 1_000_000)
+        if microsecond >= 1_000_000:
+            # 丸めで次の秒に繰り上がる場合はキャッシュを使わない
+            return self._format_uncached(created)
+        if microsecond == 0:
+            return f"{self._cached_prefix}+00:00"
+        return f"{self._cached_prefix}.{microsecond:06d}+00:00"
+
+    def _format_uncached(self, created: float) -> str:
+        return datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
 
 
 class JsonFormatter(logging.Formatter):
+    def __init__(self, encoder: Optional[JsonEncoder] = None) -> None:
+        super().__init__()
+        self._encoder: JsonEncoder = encoder or _encode_with_json
+        self._timestamp_formatter = _UtcTimestampFormatter()
+
     def format(self, record: logging.LogRecord) -> str:
         log_data: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(
-                record.created, tz=timezone.utc
-            ).isoformat(),
+            "timestamp": self._timestamp_formatter.format(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
         # リクエストIDがあれば追加
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
+        record_dict = record.__dict__
+        if "request_id" in record_dict:
+            log_data["request_id"] = record_dict["request_id"]
 
         # 追加のカスタムフィールドを含める
-        for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "request_id",
-            ]:
+        for key, value in record_dict.items():
+            if key not in _RESERVED_RECORD_ATTRS:
                 log_data[key] = value
 
         # 例外情報があれば追加
@@ -56,4 +125,4 @@ class JsonFormatter(logging.Formatter):
                 traceback.format_exception(*record.exc_info)
             )
 
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+        return self._encoder(log_data)
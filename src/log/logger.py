@@ -5,7 +5,8 @@ import os
 from typing import Optional
 
 from log.request_id import get_request_id
-from log.formatter import JsonFormatter
+from log.formatter import JsonFormatter, get_json_encoder
+from log.sampling import is_log_sampled
 
 
 class RequestIdFilter(logging.Filter):
@@ -18,10 +19,25 @@ class RequestIdFilter(logging.Filter):
         return True
 
 
-def setup_logging(log_level: Optional[str] = None) -> None:
+class SamplingFilter(logging.Filter):
+    """サンプリング対象外のリクエストのINFO以下のログを除外するフィルター
+
+    WARNING以上のログはサンプリングに関わらず常に出力する。
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or is_log_sampled()
+
+
+def setup_logging(
+    log_level: Optional[str] = None, json_encoder: Optional[str] = None
+) -> None:
     if log_level is None:
         log_level = os.getenv("LOG_LEVEL", "INFO")
 
+    if json_encoder is None:
+        json_encoder = os.getenv("LOG_JSON_ENCODER", "json")
+
     # ルートロガーの設定
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -34,12 +50,15 @@ def setup_logging(log_level: Optional[str] = None) -> None:
     handler.setLevel(log_level)
 
     # JSONフォーマッターの設定
-    formatter = JsonFormatter()
+    formatter = JsonFormatter(encoder=get_json_encoder(json_encoder))
     handler.setFormatter(formatter)
 
     # リクエストIDフィルターの追加
     handler.addFilter(RequestIdFilter())
 
+    # ログサンプリングフィルターの追加
+    handler.addFilter(SamplingFilter())
+
     # ハンドラーをルートロガーに追加
     root_logger.addHandler(handler)
 
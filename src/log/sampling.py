@@ -0,0 +1,33 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import random
+from collections.abc import Iterable
+from contextvars import ContextVar
+
+# 現在のリクエストのINFO以下のログを出力するかどうかを保持するContextVar
+_log_sampled_var: ContextVar[bool] = ContextVar("log_sampled", default=True)
+
+
+def set_log_sampled(sampled: bool) -> None:
+    _log_sampled_var.set(sampled)
+
+
+def is_log_sampled() -> bool:
+    return _log_sampled_var.get()
+
+
+class LogSampler:
+    """リクエスト単位でログを出力するかどうかを決定する
+
+    対象パスへのリクエストは rate 件に1件の割合でのみINFO以下のログを出力する。
+    rate が1以下の場合、または対象パス以外へのリクエストは常に出力する。
+    """
+
+    def __init__(self, rate: int, paths: Iterable[str]) -> None:
+        self._rate = rate
+        self._paths = frozenset(paths)
+
+    def should_log(self, path: str) -> bool:
+        if self._rate <= 1 or path not in self._paths:
+            return True
+        return random.random() * self._rate < 1
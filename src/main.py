@@ -1,6 +1,10 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
+import asyncio
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
@@ -9,14 +13,45 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from presentation.router import health_check_router
 from config import (
+    get_cognito_app_client_id,
+    get_cognito_issuer,
+    get_cognito_jwks_url,
+    get_cognito_region,
+    get_cognito_user_pool_id,
+    get_database_max_overflow,
+    get_database_pool_checkout_budget,
+    get_database_pool_recycle,
+    get_database_pool_size,
+    get_database_pool_timeout,
+    get_database_ssl,
+    get_log_json_encoder,
     get_log_level,
+    get_log_sampling_paths,
+    get_log_sampling_rate,
+    get_metrics_log_interval,
+    get_catalog_snapshot_file,
+    get_catalog_snapshot_full_reload_interval,
+    get_catalog_snapshot_refresh_interval,
+    get_lgtm_image_cache_size,
+    get_lgtm_image_cache_ttl,
+    get_random_sampler_mode,
+    get_random_sampler_recency_half_life,
     get_sentry_dsn,
     get_sentry_environment,
     validate_required_config,
 )
+from infrastructure.app_resources import create_app_resources
+from infrastructure.database import (
+    DatabasePoolSettings,
+    get_database_url,
+    get_replica_database_url,
+)
 from sentry.initializer import capture_exception, init_sentry
 from log.logger import setup_logging
+from log.sampling import LogSampler
 from log.request_id import get_request_id
+from metrics.registry import get_metrics_registry
+from metrics.reporter import report_metrics_periodically
 from presentation.middleware.logging_middleware import LoggingMiddleware
 from presentation.middleware.request_id_middleware import RequestIdMiddleware
 from presentation.router import lgtm_image_router
@@ -29,7 +64,7 @@ except RuntimeError as e:
     sys.exit(1)
 
 # ロギング設定の初期化
-setup_logging(log_level=get_log_level())
+setup_logging(log_level=get_log_level(), json_encoder=get_log_json_encoder())
 
 # Sentryの初期化
 # Sentryはエラー監視機能なので、初期化に失敗してもアプリケーションは継続起動する
@@ -42,7 +77,52 @@ except Exception as e:
     print(f"WARNING: Failed to initialize Sentry: {e}", file=sys.stderr)
     print("Application will continue without Sentry error monitoring.", file=sys.stderr)
 
-app = FastAPI(title="LGTM Cat API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """DBエンジン・S3クライアント・HTTPクライアント・トークン検証を起動時に作成し、終了時に解放する"""
+    async with create_app_resources(
+        database_url=get_database_url(),
+        pool_settings=DatabasePoolSettings(
+            pool_size=get_database_pool_size(),
+            max_overflow=get_database_max_overflow(),
+            pool_timeout=get_database_pool_timeout(),
+            pool_recycle=get_database_pool_recycle(),
+            checkout_budget_seconds=get_database_pool_checkout_budget(),
+        ),
+        cognito_region=get_cognito_region(),
+        cognito_user_pool_id=get_cognito_user_pool_id(),
+        cognito_app_client_id=get_cognito_app_client_id(),
+        replica_database_url=get_replica_database_url(),
+        database_ssl=get_database_ssl(),
+        cognito_jwks_url=get_cognito_jwks_url(),
+        cognito_issuer=get_cognito_issuer(),
+        random_sampler_mode=get_random_sampler_mode(),
+        random_sampler_recency_half_life=get_random_sampler_recency_half_life(),
+        lgtm_image_cache_size=get_lgtm_image_cache_size(),
+        lgtm_image_cache_ttl=get_lgtm_image_cache_ttl(),
+        catalog_snapshot_refresh_interval=get_catalog_snapshot_refresh_interval(),
+        catalog_snapshot_file=get_catalog_snapshot_file(),
+        catalog_snapshot_full_reload_interval=get_catalog_snapshot_full_reload_interval(),
+    ) as resources:
+        app.state.resources = resources
+
+        # ワーカープロセスごとのメトリクスを定期的にログ出力する
+        metrics_task = None
+        if get_metrics_log_interval() > 0:
+            metrics_task = asyncio.create_task(
+                report_metrics_periodically(
+                    get_metrics_registry(), get_metrics_log_interval()
+                )
+            )
+        try:
+            yield
+        finally:
+            if metrics_task is not None:
+                metrics_task.cancel()
+
+
+app = FastAPI(title="LGTM Cat API", lifespan=lifespan)
 
 
 # 例外ハンドラの登録（X-Request-Idヘッダーを追加）
@@ -98,7 +178,13 @@ async def general_exception_handler(request: Request, exc: Exception) -> Respons
 
 
 # ミドルウェアの登録（後に登録したものが先に実行される）
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(
+    LoggingMiddleware,
+    sampler=LogSampler(
+        rate=get_log_sampling_rate(),
+        paths=get_log_sampling_paths(),
+    ),
+)
 app.add_middleware(RequestIdMiddleware)
 
 # ルーターの登録
@@ -0,0 +1,123 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import bisect
+import os
+import threading
+from collections.abc import Sequence
+from typing import Any, Final, TypedDict
+
+# 待ち時間などの秒数を計測するヒストグラムのデフォルトのバケット（上限値、秒）
+DEFAULT_SECONDS_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class HistogramSnapshot(TypedDict):
+    # バケットの上限値ごとの累積件数（"+Inf" は全件）
+    buckets: dict[str, int]
+    count: int
+    sum: float
+
+
+class Counter:
+    """単調増加するカウンター"""
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class Histogram:
+    """観測値をバケットごとに集計するヒストグラム"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_SECONDS_BUCKETS) -> None:
+        self._bounds = tuple(sorted(buckets))
+        # 最後の要素は最大のバケットを超えた観測値の件数
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            total = self._sum
+
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound, bucket_count in zip(self._bounds, counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = count
+        return HistogramSnapshot(buckets=buckets, count=count, sum=total)
+
+
+class MetricsRegistry:
+    """プロセス（ワーカー）単位でメトリクスを保持するレジストリ"""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, Counter] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str) -> Counter:
+        with self._lock:
+            if name not in self._counters:
+                self._counters[name] = Counter()
+            return self._counters[name]
+
+    def histogram(
+        self, name: str, buckets: Sequence[float] = DEFAULT_SECONDS_BUCKETS
+    ) -> Histogram:
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(buckets)
+            return self._histograms[name]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+
+        return {
+            "pid": os.getpid(),
+            "counters": {name: c.value for name, c in sorted(counters.items())},
+            "histograms": {
+                name: h.snapshot() for name, h in sorted(histograms.items())
+            },
+        }
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
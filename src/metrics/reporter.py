@@ -0,0 +1,20 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import asyncio
+
+from log.logger import get_logger
+from metrics.registry import MetricsRegistry
+
+logger = get_logger(__name__)
+
+
+async def report_metrics_periodically(
+    registry: MetricsRegistry, interval_seconds: float
+) -> None:
+    """メトリクスのスナップショットを一定間隔でログに出力する
+
+    ワーカープロセスごとに起動し、キャンセルされるまで出力を続ける。
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        logger.info("Metrics snapshot", extra={"metrics": registry.snapshot()})
@@ -1,11 +1,17 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
-from domain.lgtm_image import LgtmImage
-from domain.lgtm_image_errors import ErrInvalidImageExtension, ErrRecordCount
+from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT, LgtmImage, LgtmImagePage
+from domain.lgtm_image_errors import (
+    ErrDatabaseBusy,
+    ErrInvalidCursor,
+    ErrInvalidImageExtension,
+    ErrInvalidImageIds,
+    ErrRecordCount,
+)
 from domain.repository.lgtm_image_repository_interface import (
     LgtmImageRepositoryInterface,
 )
@@ -13,18 +19,28 @@ from log.logger import get_logger
 from presentation.controller.lgtm_image_request import LgtmImageCreateRequest
 from presentation.controller.lgtm_image_response import (
     LgtmImageCreateResponse,
-    LgtmImageItem,
-    LgtmImageRandomListResponse,
-    LgtmImageRecentlyCreatedListResponse,
+    create_lgtm_image_list_content,
 )
 from presentation.controller.response_helper import (
     create_json_response,
     create_error_response,
+    create_not_modified_response,
+    create_service_unavailable_response,
+    parse_if_none_match,
 )
 from usecase.create_lgtm_image_usecase import CreateLgtmImageUsecase
 from usecase.extract_random_lgtm_images_usecase import (
     ExtractRandomLgtmImagesUsecase,
 )
+from usecase.extract_seeded_random_lgtm_images_usecase import (
+    ExtractSeededRandomLgtmImagesUsecase,
+)
+from usecase.extract_unseen_random_lgtm_images_usecase import (
+    ExtractUnseenRandomLgtmImagesUsecase,
+)
+from usecase.retrieve_lgtm_images_by_ids_usecase import (
+    RetrieveLgtmImagesByIdsUsecase,
+)
 from usecase.retrieve_recently_created_lgtm_images_usecase import (
     RetrieveRecentlyCreatedLgtmImagesUsecase,
 )
@@ -33,6 +49,9 @@ if TYPE_CHECKING:
     from domain.repository.object_storage_repository_interface import (
         ObjectStorageRepositoryInterface,
     )
+    from domain.repository.random_id_sampler_interface import (
+        RandomIdSamplerInterface,
+    )
 
 logger = get_logger(__name__)
 
@@ -53,7 +72,7 @@ class LgtmImageController:
                 image=request_body.image,
                 image_extension=request_body.image_extension,
             )
-            response = LgtmImageCreateResponse(imageUrl=uploaded_image["url"])  # type: ignore[arg-type]
+            response = LgtmImageCreateResponse(imageUrl=uploaded_image.url)
             return create_json_response(response, status_code=202)
         except ErrInvalidImageExtension as e:
             logger.error(f"Invalid image extension: {e}")
@@ -69,54 +88,154 @@ class LgtmImageController:
     async def exec(
         repository: LgtmImageRepositoryInterface,
         base_url: str,
+        limit: int = DEFAULT_RANDOM_IMAGES_LIMIT,
+        sampler: Optional["RandomIdSamplerInterface"] = None,
+        cursor: Optional[str] = None,
     ) -> JSONResponse:
-        logger.info("Extracting random LGTM images")
+        logger.info("Extracting random LGTM images", extra={"limit": limit})
 
         try:
-            images: list[LgtmImage] = await ExtractRandomLgtmImagesUsecase.execute(
-                repository, base_url
+            # カーソルが指定された場合は、クライアントがまだ見ていない画像だけを返す
+            images: list[LgtmImage]
+            next_cursor: Optional[str] = None
+            if cursor is not None:
+                page: LgtmImagePage = (
+                    await ExtractUnseenRandomLgtmImagesUsecase.execute(
+                        repository, base_url, limit, cursor
+                    )
+                )
+                images = page["images"]
+                next_cursor = page["next_cursor"]
+            else:
+                images = await ExtractRandomLgtmImagesUsecase.execute(
+                    repository, base_url, limit, sampler
+                )
+            return JSONResponse(
+                content=create_lgtm_image_list_content(images, next_cursor)
+            )
+        except ErrInvalidCursor as e:
+            logger.warning(f"Invalid cursor: {e}")
+            return JSONResponse(
+                status_code=422,
+                content={"error": "Invalid cursor provided"},
             )
-            image_items = [
-                LgtmImageItem(id=image["id"], url=image["url"])  # type: ignore[arg-type]
-                for image in images
-            ]
-            response = LgtmImageRandomListResponse(lgtmImages=image_items)
-            return create_json_response(response)
         except ErrRecordCount:
             logger.error("Insufficient LGTM images available")
             return JSONResponse(
                 status_code=404,
                 content={"error": "Insufficient LGTM images available"},
             )
+        except ErrDatabaseBusy as e:
+            logger.warning(f"Database connection pool is busy: {e}")
+            return create_service_unavailable_response()
         except Exception as e:
             logger.error(f"Error extracting random LGTM images: {e}")
             return create_error_response(e)
 
+    @staticmethod
+    async def exec_seeded(
+        repository: LgtmImageRepositoryInterface,
+        base_url: str,
+        seed: int,
+        limit: int = DEFAULT_RANDOM_IMAGES_LIMIT,
+        if_none_match: Optional[str] = None,
+        cache_max_age: int = 0,
+    ) -> Response:
+        logger.info(
+            "Extracting seeded random LGTM images",
+            extra={"seed": seed, "limit": limit},
+        )
+
+        try:
+            result = await ExtractSeededRandomLgtmImagesUsecase.execute(
+                repository, base_url, seed, limit, parse_if_none_match(if_none_match)
+            )
+            # 同じseed・件数のレスポンスは画像が追加されるまで変わらないため、クライアントにキャッシュさせる
+            # 認証が必要なエンドポイントのため、トークンを送らない利用者に返されないように共有キャッシュには保存させない
+            headers = {
+                "ETag": f'"{result["tag"]}"',
+                "Cache-Control": f"private, max-age={cache_max_age}",
+            }
+            if result["images"] is None:
+                return create_not_modified_response(headers)
+            return JSONResponse(
+                content=create_lgtm_image_list_content(result["images"]),
+                headers=headers,
+            )
+        except ErrRecordCount:
+            logger.error("Insufficient LGTM images available")
+            return JSONResponse(
+                status_code=404,
+                content={"error": "Insufficient LGTM images available"},
+            )
+        except ErrDatabaseBusy as e:
+            logger.warning(f"Database connection pool is busy: {e}")
+            return create_service_unavailable_response()
+        except Exception as e:
+            logger.error(f"Error extracting seeded random LGTM images: {e}")
+            return create_error_response(e)
+
     @staticmethod
     async def exec_recently_created(
         repository: LgtmImageRepositoryInterface,
         base_url: str,
+        limit: int = DEFAULT_RANDOM_IMAGES_LIMIT,
+        before: Optional[str] = None,
     ) -> JSONResponse:
-        logger.info("Retrieving recently created LGTM images")
+        logger.info("Retrieving recently created LGTM images", extra={"limit": limit})
 
         try:
-            images: list[
-                LgtmImage
-            ] = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
-                repository, base_url
+            page: LgtmImagePage = (
+                await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+                    repository, base_url, limit, before
+                )
+            )
+            return JSONResponse(
+                content=create_lgtm_image_list_content(
+                    page["images"], page["next_cursor"]
+                )
+            )
+        except ErrInvalidCursor as e:
+            logger.warning(f"Invalid cursor: {e}")
+            return JSONResponse(
+                status_code=422,
+                content={"error": "Invalid cursor provided"},
             )
-            image_items = [
-                LgtmImageItem(id=image["id"], url=image["url"])  # type: ignore[arg-type]
-                for image in images
-            ]
-            response = LgtmImageRecentlyCreatedListResponse(lgtmImages=image_items)
-            return create_json_response(response)
         except ErrRecordCount:
             logger.error("Insufficient LGTM images available")
             return JSONResponse(
                 status_code=404,
                 content={"error": "Insufficient LGTM images available"},
             )
+        except ErrDatabaseBusy as e:
+            logger.warning(f"Database connection pool is busy: {e}")
+            return create_service_unavailable_response()
         except Exception as e:
             logger.error(f"Error retrieving recently created LGTM images: {e}")
             return create_error_response(e)
+
+    @staticmethod
+    async def exec_batch(
+        repository: LgtmImageRepositoryInterface,
+        base_url: str,
+        ids: str,
+    ) -> JSONResponse:
+        logger.info("Retrieving LGTM images by IDs", extra={"ids": ids})
+
+        try:
+            images = await RetrieveLgtmImagesByIdsUsecase.execute(
+                repository, base_url, ids
+            )
+            return JSONResponse(content=create_lgtm_image_list_content(images))
+        except ErrInvalidImageIds as e:
+            logger.warning(f"Invalid image ids: {e}")
+            return JSONResponse(
+                status_code=422,
+                content={"error": "Invalid image ids provided"},
+            )
+        except ErrDatabaseBusy as e:
+            logger.warning(f"Database connection pool is busy: {e}")
+            return create_service_unavailable_response()
+        except Exception as e:
+            logger.error(f"Error retrieving LGTM images by IDs: {e}")
+            return create_error_response(e)
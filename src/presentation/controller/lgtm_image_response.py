@@ -1,11 +1,26 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from collections.abc import Iterable
+from typing import Annotated, Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, WithJsonSchema
+
+from domain.lgtm_image import LgtmImage
+
+# サーバーで組み立てたURL
+# ベースURLとDBの値から作成した信頼できる文字列のため、HttpUrlとして解析・検証し直さない
+# （OpenAPIのスキーマはHttpUrlと同じものを出力する）
+ServerGeneratedUrl = Annotated[
+    str,
+    WithJsonSchema(
+        {"type": "string", "format": "uri", "minLength": 1, "maxLength": 2083}
+    ),
+]
 
 
 class LgtmImageItem(BaseModel):
     id: str = Field(..., description="LGTM画像の一意識別子", examples=["1"])
-    url: HttpUrl = Field(
+    url: ServerGeneratedUrl = Field(
         ...,
         description="LGTM画像のURL",
     )
@@ -17,6 +32,11 @@ class LgtmImageRandomListResponse(BaseModel):
     lgtm_images: list[LgtmImageItem] = Field(
         ..., alias="lgtmImages", description="LGTM画像のリスト"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        alias="nextCursor",
+        description="まだ見ていない画像を取得するためのカーソル（cursor指定時のみ含まれる）",
+    )
 
 
 class LgtmImageRecentlyCreatedListResponse(BaseModel):
@@ -25,11 +45,42 @@ class LgtmImageRecentlyCreatedListResponse(BaseModel):
     lgtm_images: list[LgtmImageItem] = Field(
         ..., alias="lgtmImages", description="最近作成されたLGTM画像のリスト"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        alias="nextCursor",
+        description="次のページを取得するためのカーソル（最後のページの場合は含まれない）",
+    )
+
+
+class LgtmImageBatchListResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    lgtm_images: list[LgtmImageItem] = Field(
+        ...,
+        alias="lgtmImages",
+        description="指定したIDのLGTM画像のリスト（存在しないIDは含まれない）",
+    )
 
 
 class LgtmImageCreateResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
-    image_url: HttpUrl = Field(
+    image_url: ServerGeneratedUrl = Field(
         ..., alias="imageUrl", description="アップロードされた画像のURL"
     )
+
+
+def create_lgtm_image_list_content(
+    images: Iterable[LgtmImage], next_cursor: Optional[str] = None
+) -> dict[str, Any]:
+    """LgtmImageの一覧からLGTM画像の一覧レスポンスの本文を作成する
+
+    LgtmImageRandomListResponse などと同じ形の辞書を直接組み立て、画像ごとのモデルの作成と
+    変換を省略する。create_json_response と同じく、nextCursor はNoneの場合は含めない。
+    """
+    content: dict[str, Any] = {
+        "lgtmImages": [{"id": image.id, "url": image.url} for image in images]
+    }
+    if next_cursor is not None:
+        content["nextCursor"] = next_cursor
+    return content
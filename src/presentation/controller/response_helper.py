@@ -2,7 +2,7 @@
 from typing import Optional
 
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from sentry.initializer import capture_exception
@@ -12,9 +12,11 @@ from log.request_id import get_request_id
 def create_json_response(
     response_body: BaseModel,
     status_code: int = status.HTTP_200_OK,
+    headers: Optional[dict[str, str]] = None,
 ) -> JSONResponse:
     return JSONResponse(
         status_code=status_code,
+        headers=headers,
         content=response_body.model_dump(
             mode="json",
             by_alias=True,
@@ -39,3 +41,29 @@ def create_error_response(
         status_code=500,
         content={"error": "Internal server error"},
     )
+
+
+def create_service_unavailable_response(retry_after_seconds: int = 1) -> JSONResponse:
+    """一時的に処理できない場合の503レスポンスを作成する"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"error": "Service temporarily unavailable"},
+        headers={"Retry-After": str(retry_after_seconds)},
+    )
+
+
+def parse_if_none_match(header: Optional[str]) -> list[str]:
+    """If-None-Matchヘッダーから引用符とW/を除いたエンティティタグの一覧を取り出す"""
+    if not header:
+        return []
+    tags = []
+    for tag in header.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if len(tag) >= 2 and tag.startswith('"') and tag.endswith('"'):
+            tags.append(tag[1:-1])
+    return tags
+
+
+def create_not_modified_response(headers: dict[str, str]) -> Response:
+    """クライアントが保持しているレスポンスを使わせる304レスポンスを作成する"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -4,11 +4,6 @@ from typing import Annotated, Any
 
 from fastapi import Depends, Header, HTTPException
 
-from config import (
-    get_cognito_app_client_id,
-    get_cognito_region,
-    get_cognito_user_pool_id,
-)
 from domain.lgtm_image_errors import (
     ErrExpiredToken,
     ErrInvalidToken,
@@ -17,17 +12,15 @@ from domain.lgtm_image_errors import (
 from domain.repository.jwt_token_verifier_repository_interface import (
     JwtTokenVerifierRepositoryInterface,
 )
-from infrastructure.cognito_token_verifier_repository import (
-    CognitoTokenVerifierRepository,
-)
+from infrastructure.app_resources import AppResources
+from presentation.dependencies.resources import get_app_resources
 
 
 def create_token_verifier_repository(
-    region: str = Depends(get_cognito_region),
-    user_pool_id: str = Depends(get_cognito_user_pool_id),
-    app_client_id: str = Depends(get_cognito_app_client_id),
+    resources: Annotated[AppResources, Depends(get_app_resources)],
 ) -> JwtTokenVerifierRepositoryInterface:
-    return CognitoTokenVerifierRepository(region, user_pool_id, app_client_id)
+    # JWKSキャッシュを共有するため、起動時に作成したインスタンスを使い回す
+    return resources.token_verifier
 
 
 async def verify_token(
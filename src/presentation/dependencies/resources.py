@@ -0,0 +1,34 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from collections.abc import AsyncGenerator
+from typing import Annotated, Optional, cast
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.app_resources import AppResources
+
+
+def get_app_resources(request: Request) -> AppResources:
+    """lifespanで作成した共有リソースを取得する"""
+    return cast(AppResources, request.app.state.resources)
+
+
+async def create_db_session(
+    resources: Annotated[AppResources, Depends(get_app_resources)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """データベースセッションを取得する依存性注入用の関数."""
+    async with resources.session_factory() as session:
+        yield session
+
+
+async def create_read_db_session(
+    resources: Annotated[AppResources, Depends(get_app_resources)],
+) -> AsyncGenerator[Optional[AsyncSession], None]:
+    """リードレプリカのセッションを取得する（レプリカ未設定の場合はNone）"""
+    if resources.read_session_factory is None:
+        yield None
+        return
+
+    async with resources.read_session_factory() as session:
+        yield session
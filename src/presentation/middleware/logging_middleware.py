@@ -5,16 +5,27 @@ import time
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import Response
+from starlette.types import ASGIApp
 
 from log.logger import get_logger
+from log.sampling import LogSampler, set_log_sampled
 
 logger = get_logger(__name__)
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp, sampler: LogSampler | None = None) -> None:
+        super().__init__(app)
+        self._sampler = sampler
+
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
+        # ログを出力するかどうかをリクエスト単位で1回だけ決定する
+        # （ContextVarで後続のコントローラー・ユースケース・リポジトリのログにも適用される）
+        if self._sampler is not None:
+            set_log_sampled(self._sampler.should_log(request.url.path))
+
         # リクエスト受信ログ
         logger.info(
             "Request received",
@@ -54,6 +65,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         finally:
             # レスポンスが正常に返された場合のみ完了ログを出力
             if response is not None:
+                # エラーレスポンスの場合はサンプリング対象外でも完了ログを出力する
+                if response.status_code >= 400:
+                    set_log_sampled(True)
+
                 # 処理時間計算
                 duration_ms = (time.time() - start_time) * 1000
 
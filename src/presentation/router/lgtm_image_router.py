@@ -1,41 +1,88 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import (
     get_lgtm_images_base_url,
+    get_seeded_random_cache_max_age,
     get_upload_s3_bucket_name,
 )
+from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT, MAX_IMAGES_LIMIT
 from domain.repository.lgtm_image_repository_interface import (
     LgtmImageRepositoryInterface,
 )
 from domain.repository.object_storage_repository_interface import (
     ObjectStorageRepositoryInterface,
 )
-from infrastructure.database import create_db_session
+from domain.random_permutation import MAX_SEED
+from domain.repository.random_id_sampler_interface import RandomIdSamplerInterface
+from infrastructure.app_resources import AppResources
+from infrastructure.cached_lgtm_image_repository import CachedLgtmImageRepository
+from infrastructure.catalog_snapshot_lgtm_image_repository import (
+    CatalogSnapshotLgtmImageRepository,
+)
 from infrastructure.lgtm_image_repository import LgtmImageRepository
+from infrastructure.replica_fallback_lgtm_image_repository import (
+    ReplicaFallbackLgtmImageRepository,
+)
 from infrastructure.s3_repository import S3Repository
 from presentation.controller.lgtm_image_controller import LgtmImageController
 from presentation.controller.lgtm_image_request import LgtmImageCreateRequest
+from presentation.controller.lgtm_image_response import (
+    LgtmImageBatchListResponse,
+    LgtmImageRandomListResponse,
+    LgtmImageRecentlyCreatedListResponse,
+)
 from presentation.dependencies.auth import verify_token
+from presentation.dependencies.resources import (
+    create_db_session,
+    create_read_db_session,
+    get_app_resources,
+)
 
 router = APIRouter()
 
 
 def create_lgtm_image_repository(
     session: Annotated[AsyncSession, Depends(create_db_session)],
+    read_session: Annotated[Optional[AsyncSession], Depends(create_read_db_session)],
+    resources: Annotated[AppResources, Depends(get_app_resources)],
 ) -> LgtmImageRepositoryInterface:
-    return LgtmImageRepository(session)
+    # スナップショットを読み込み済みの場合はDBに問い合わせずにメモリ上から読み取る
+    snapshot = resources.catalog_snapshot
+    if snapshot is not None and snapshot.loaded:
+        return CatalogSnapshotLgtmImageRepository(snapshot)
+
+    # レプリカが設定されている場合は読み取りをレプリカに振り分ける
+    repository: LgtmImageRepositoryInterface = LgtmImageRepository(session)
+    if read_session is not None:
+        repository = ReplicaFallbackLgtmImageRepository(
+            replica=LgtmImageRepository(read_session), primary=repository
+        )
+    # キャッシュにない画像だけをDBから取得する
+    if resources.lgtm_image_object_cache is not None:
+        repository = CachedLgtmImageRepository(
+            repository, resources.lgtm_image_object_cache
+        )
+    return repository
 
 
 def create_object_storage_repository(
+    resources: Annotated[AppResources, Depends(get_app_resources)],
     bucket_name: str = Depends(get_upload_s3_bucket_name),
 ) -> ObjectStorageRepositoryInterface:
-    return S3Repository(bucket_name)
+    return S3Repository(bucket_name, resources.s3_client)
+
+
+def get_random_id_sampler(
+    resources: Annotated[AppResources, Depends(get_app_resources)],
+) -> RandomIdSamplerInterface:
+    # 山札方式の状態をリクエスト間で共有するため、起動時に作成したインスタンスを使い回す
+    return resources.random_id_sampler
 
 
 @router.post(
@@ -96,8 +143,16 @@ async def create_lgtm_image(
 @router.get(
     "/lgtm-images",
     summary="ランダムなLGTM画像を取得",
-    description="ランダムに選択されたLGTM画像のリストを返します。",
+    description=(
+        "ランダムに選択されたLGTM画像のリストを返します。"
+        "limitで取得件数（最大100件）を指定できます。"
+        "cursorを指定すると、これまでに返した画像を除いて返します"
+        "（最初は空文字列を指定し、以降はレスポンスのnextCursorを指定する）。"
+        "seedを指定すると、画像が追加されるまで同じ画像を返し、ETagとCache-Controlを付与します"
+        "（If-None-Matchが一致する場合は304を返す。cursorは無視される）。"
+    ),
     response_description="ランダムに選択されたLGTM画像のリスト",
+    response_model=LgtmImageRandomListResponse,
     tags=["LGTM Images"],
     responses={
         200: {
@@ -119,6 +174,9 @@ async def create_lgtm_image(
                 }
             },
         },
+        304: {
+            "description": "seed指定時、If-None-Matchに一致するレスポンスを保持している"
+        },
         401: {
             "description": "認証エラー",
             "content": {
@@ -127,6 +185,20 @@ async def create_lgtm_image(
                 }
             },
         },
+        422: {
+            "description": "無効なカーソル",
+            "content": {
+                "application/json": {"example": {"error": "Invalid cursor provided"}}
+            },
+        },
+        503: {
+            "description": "DBコネクションの取得待ちが上限を超えた",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Service temporarily unavailable"}
+                }
+            },
+        },
     },
 )
 async def extract_random_lgtm_images(
@@ -135,15 +207,42 @@ async def extract_random_lgtm_images(
     ],
     base_url: str = Depends(get_lgtm_images_base_url),
     token_payload: dict[str, Any] = Depends(verify_token),
-) -> JSONResponse:
-    return await LgtmImageController.exec(repository, base_url)
+    limit: int = Query(
+        DEFAULT_RANDOM_IMAGES_LIMIT,
+        ge=1,
+        le=MAX_IMAGES_LIMIT,
+        description="取得する件数",
+    ),
+    sampler: RandomIdSamplerInterface = Depends(get_random_id_sampler),
+    cursor: Optional[str] = Query(
+        None,
+        description="前のレスポンスのnextCursor（空文字列で重複なし取得を開始）",
+    ),
+    seed: Optional[int] = Query(
+        None,
+        ge=0,
+        le=MAX_SEED,
+        description="指定すると、画像が追加されるまで同じ画像を返す（キャッシュ可能）",
+    ),
+    if_none_match: Optional[str] = Header(None),
+    cache_max_age: int = Depends(get_seeded_random_cache_max_age),
+) -> Response:
+    if seed is not None:
+        return await LgtmImageController.exec_seeded(
+            repository, base_url, seed, limit, if_none_match, cache_max_age
+        )
+    return await LgtmImageController.exec(repository, base_url, limit, sampler, cursor)
 
 
 @router.get(
     "/lgtm-images/recently-created",
     summary="最近作成されたLGTM画像を取得",
-    description="最近作成されたLGTM画像のリストを返します。",
+    description=(
+        "最近作成されたLGTM画像のリストを新しい順に返します。"
+        "レスポンスのnextCursorをbeforeに指定すると、続きのページを取得できます。"
+    ),
     response_description="最近作成されたLGTM画像のリスト",
+    response_model=LgtmImageRecentlyCreatedListResponse,
     tags=["LGTM Images"],
     responses={
         200: {
@@ -160,7 +259,8 @@ async def extract_random_lgtm_images(
                                 "id": "2",
                                 "url": "https://example.com/2021/03/16/23/6947f291-a46e-453c-a230-0d756d7174cb.webp",
                             },
-                        ]
+                        ],
+                        "nextCursor": "djE6Mg",
                     }
                 }
             },
@@ -173,6 +273,20 @@ async def extract_random_lgtm_images(
                 }
             },
         },
+        422: {
+            "description": "無効なカーソル",
+            "content": {
+                "application/json": {"example": {"error": "Invalid cursor provided"}}
+            },
+        },
+        503: {
+            "description": "DBコネクションの取得待ちが上限を超えた",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Service temporarily unavailable"}
+                }
+            },
+        },
     },
 )
 async def retrieve_recently_created_lgtm_images(
@@ -181,5 +295,77 @@ async def retrieve_recently_created_lgtm_images(
     ],
     base_url: str = Depends(get_lgtm_images_base_url),
     token_payload: dict[str, Any] = Depends(verify_token),
+    limit: int = Query(
+        DEFAULT_RANDOM_IMAGES_LIMIT,
+        ge=1,
+        le=MAX_IMAGES_LIMIT,
+        description="取得する件数",
+    ),
+    before: Optional[str] = Query(
+        None, description="前のレスポンスのnextCursor（指定した画像より前を取得）"
+    ),
+) -> JSONResponse:
+    return await LgtmImageController.exec_recently_created(
+        repository, base_url, limit, before
+    )
+
+
+@router.get(
+    "/lgtm-images/batch",
+    summary="指定したIDのLGTM画像をまとめて取得",
+    description=(
+        "カンマ区切りで指定したIDのLGTM画像を、指定した順序で返します（最大100件）。"
+        "存在しないIDは結果に含まれません。"
+    ),
+    response_description="指定したIDのLGTM画像のリスト",
+    response_model=LgtmImageBatchListResponse,
+    tags=["LGTM Images"],
+    responses={
+        200: {
+            "description": "成功時のレスポンス",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "lgtmImages": [
+                            {
+                                "id": "1",
+                                "url": "https://example.com/2021/03/16/23/5947f291-a46e-453c-a230-0d756d7174cb.webp",
+                            },
+                        ]
+                    }
+                }
+            },
+        },
+        401: {
+            "description": "認証エラー",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid authorization header"}
+                }
+            },
+        },
+        422: {
+            "description": "無効なID（形式が不正、または件数が上限を超える）",
+            "content": {
+                "application/json": {"example": {"error": "Invalid image ids provided"}}
+            },
+        },
+        503: {
+            "description": "DBコネクションの取得待ちが上限を超えた",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Service temporarily unavailable"}
+                }
+            },
+        },
+    },
+)
+async def retrieve_lgtm_images_by_ids(
+    repository: Annotated[
+        LgtmImageRepositoryInterface, Depends(create_lgtm_image_repository)
+    ],
+    base_url: str = Depends(get_lgtm_images_base_url),
+    token_payload: dict[str, Any] = Depends(verify_token),
+    ids: str = Query(..., description="カンマ区切りのLGTM画像のID（例: 1,2,3）"),
 ) -> JSONResponse:
-    return await LgtmImageController.exec_recently_created(repository, base_url)
+    return await LgtmImageController.exec_batch(repository, base_url, ids)
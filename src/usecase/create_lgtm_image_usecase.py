@@ -63,7 +63,7 @@ class CreateLgtmImageUsecase:
 
         logger.info(
             "CreateLgtmImageUsecase completed successfully",
-            extra={"image_url": uploaded_image["url"]},
+            extra={"image_url": uploaded_image.url},
         )
 
         return uploaded_image
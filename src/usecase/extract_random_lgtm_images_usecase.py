@@ -1,13 +1,15 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
 import random
+from typing import Optional
 
 from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT, LgtmImage
 from domain.lgtm_image_errors import ErrRecordCount
-from domain.lgtm_image_object import create_lgtm_image
+from domain.lgtm_image_object import create_lgtm_images_in_order
 from domain.repository.lgtm_image_repository_interface import (
     LgtmImageRepositoryInterface,
 )
+from domain.repository.random_id_sampler_interface import RandomIdSamplerInterface
 from log.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,6 +21,7 @@ class ExtractRandomLgtmImagesUsecase:
         repository: LgtmImageRepositoryInterface,
         base_url: str,
         limit: int = DEFAULT_RANDOM_IMAGES_LIMIT,
+        sampler: Optional[RandomIdSamplerInterface] = None,
     ) -> list[LgtmImage]:
         logger.info("Executing ExtractRandomLgtmImagesUsecase", extra={"limit": limit})
 
@@ -27,11 +30,16 @@ class ExtractRandomLgtmImagesUsecase:
         if len(ids) < limit:
             raise ErrRecordCount()
 
-        random_ids = random.sample(ids, limit)
+        random_ids = (
+            sampler.sample(ids, limit)
+            if sampler is not None
+            else random.sample(ids, limit)
+        )
 
         image_objects = await repository.find_by_ids(random_ids)
 
-        images = [create_lgtm_image(obj, base_url) for obj in image_objects]
+        # find_by_idsの結果はID順などDB依存の順序になるため、抽選した順序に並べ直す
+        images = create_lgtm_images_in_order(image_objects, random_ids, base_url)
 
         logger.info(
             "ExtractRandomLgtmImagesUsecase completed successfully",
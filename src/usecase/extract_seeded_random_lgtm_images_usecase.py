@@ -0,0 +1,71 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import hashlib
+from collections.abc import Collection, Sequence
+
+from domain.lgtm_image import (
+    DEFAULT_RANDOM_IMAGES_LIMIT,
+    LgtmImageId,
+    SeededLgtmImages,
+)
+from domain.lgtm_image_errors import ErrRecordCount
+from domain.lgtm_image_object import create_lgtm_images_in_order
+from domain.random_permutation import RandomPermutation
+from domain.repository.lgtm_image_repository_interface import (
+    LgtmImageRepositoryInterface,
+)
+from log.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExtractSeededRandomLgtmImagesUsecase:
+    """seedから決定的に選んだ画像を返す
+
+    同じseed・件数であれば、画像が追加されるまで同じ画像を同じ順序で返すため、
+    レスポンスをCDNなどでキャッシュできる。known_tags にタグが含まれる場合は
+    画像を取得せずにタグだけを返す。
+    """
+
+    @staticmethod
+    async def execute(
+        repository: LgtmImageRepositoryInterface,
+        base_url: str,
+        seed: int,
+        limit: int = DEFAULT_RANDOM_IMAGES_LIMIT,
+        known_tags: Collection[str] = (),
+    ) -> SeededLgtmImages:
+        logger.info(
+            "Executing ExtractSeededRandomLgtmImagesUsecase",
+            extra={"seed": seed, "limit": limit},
+        )
+
+        ids = await repository.find_all_ids()
+
+        if len(ids) < limit:
+            raise ErrRecordCount()
+
+        tag = _create_tag(ids, base_url, seed, limit)
+        if tag in known_tags:
+            return SeededLgtmImages(tag=tag, images=None)
+
+        permutation = RandomPermutation(len(ids), seed)
+        selected = [ids[permutation[position]] for position in range(limit)]
+
+        image_objects = await repository.find_by_ids(selected)
+        images = create_lgtm_images_in_order(image_objects, selected, base_url)
+
+        logger.info(
+            "ExtractSeededRandomLgtmImagesUsecase completed successfully",
+            extra={"images_count": len(images)},
+        )
+
+        return SeededLgtmImages(tag=tag, images=images)
+
+
+def _create_tag(
+    ids: Sequence[LgtmImageId], base_url: str, seed: int, limit: int
+) -> str:
+    # IDはID順に並んでいるため、件数と最大IDを画像の一覧のバージョンとみなす
+    source = f"{seed}:{limit}:{len(ids)}:{ids[-1]}:{base_url}"
+    return hashlib.sha256(source.encode()).hexdigest()[:32]
@@ -0,0 +1,90 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import random
+
+from domain.lgtm_image import (
+    DEFAULT_RANDOM_IMAGES_LIMIT,
+    LgtmImageId,
+    LgtmImagePage,
+)
+from domain.lgtm_image_cursor import (
+    RandomLgtmImageCursor,
+    decode_random_lgtm_image_cursor,
+    encode_random_lgtm_image_cursor,
+)
+from domain.lgtm_image_errors import ErrRecordCount
+from domain.lgtm_image_object import create_lgtm_images_in_order
+from domain.random_permutation import RandomPermutation, next_seed
+from domain.repository.lgtm_image_repository_interface import (
+    LgtmImageRepositoryInterface,
+)
+from log.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExtractUnseenRandomLgtmImagesUsecase:
+    """クライアントがまだ見ていない画像だけをランダムに返す
+
+    見た画像の情報はサーバーに保持せず、カーソル（seed・画像数・位置）としてクライアントに渡す。
+    ID順に並べた画像をseedで並べ替えた順に返し、全件を返し終えたら新しいseedで次の周に入る。
+    前の周の途中で追加された画像は次の周から返される。
+    """
+
+    @staticmethod
+    async def execute(
+        repository: LgtmImageRepositoryInterface,
+        base_url: str,
+        limit: int = DEFAULT_RANDOM_IMAGES_LIMIT,
+        cursor: str = "",
+    ) -> LgtmImagePage:
+        logger.info(
+            "Executing ExtractUnseenRandomLgtmImagesUsecase",
+            extra={"limit": limit, "has_cursor": bool(cursor)},
+        )
+
+        ids = await repository.find_all_ids()
+
+        if len(ids) < limit:
+            raise ErrRecordCount()
+
+        # 空のカーソルは新しい周を開始する
+        state = (
+            decode_random_lgtm_image_cursor(cursor)
+            if cursor
+            else _start_cycle(random.getrandbits(64), len(ids))
+        )
+        # 画像が削除されて並べ替えの範囲が画像数を超えた場合は新しい周を開始する
+        if state["pool_size"] > len(ids):
+            state = _start_cycle(next_seed(state["seed"]), len(ids))
+
+        selected: list[LgtmImageId] = []
+        selected_set: set[LgtmImageId] = set()
+        permutation = RandomPermutation(state["pool_size"], state["seed"])
+        while len(selected) < limit:
+            if state["position"] >= state["pool_size"]:
+                state = _start_cycle(next_seed(state["seed"]), len(ids))
+                permutation = RandomPermutation(state["pool_size"], state["seed"])
+
+            id_ = ids[permutation[state["position"]]]
+            state["position"] += 1
+            # 周をまたいだ場合に同じレスポンスに同じ画像を含めない
+            if id_ not in selected_set:
+                selected.append(id_)
+                selected_set.add(id_)
+
+        image_objects = await repository.find_by_ids(selected)
+        images = create_lgtm_images_in_order(image_objects, selected, base_url)
+
+        logger.info(
+            "ExtractUnseenRandomLgtmImagesUsecase completed successfully",
+            extra={"images_count": len(images)},
+        )
+
+        return LgtmImagePage(
+            images=images, next_cursor=encode_random_lgtm_image_cursor(state)
+        )
+
+
+def _start_cycle(seed: int, pool_size: int) -> RandomLgtmImageCursor:
+    return RandomLgtmImageCursor(seed=seed, pool_size=pool_size, position=0)
@@ -0,0 +1,34 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from domain.lgtm_image import LgtmImage, parse_lgtm_image_ids
+from domain.lgtm_image_object import create_lgtm_images_in_order
+from domain.repository.lgtm_image_repository_interface import (
+    LgtmImageRepositoryInterface,
+)
+from log.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RetrieveLgtmImagesByIdsUsecase:
+    """指定したIDの画像をまとめて返す（存在しないIDは除き、指定した順序で返す）"""
+
+    @staticmethod
+    async def execute(
+        repository: LgtmImageRepositoryInterface,
+        base_url: str,
+        ids: str,
+    ) -> list[LgtmImage]:
+        logger.info("Executing RetrieveLgtmImagesByIdsUsecase", extra={"ids": ids})
+
+        image_ids = parse_lgtm_image_ids(ids)
+
+        image_objects = await repository.find_by_ids(image_ids)
+        images = create_lgtm_images_in_order(image_objects, image_ids, base_url)
+
+        logger.info(
+            "RetrieveLgtmImagesByIdsUsecase completed successfully",
+            extra={"requested_count": len(image_ids), "images_count": len(images)},
+        )
+
+        return images
@@ -1,8 +1,14 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT, LgtmImage
+from typing import Optional
+
+from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT, LgtmImagePage
+from domain.lgtm_image_cursor import (
+    decode_lgtm_image_cursor,
+    encode_lgtm_image_cursor,
+)
 from domain.lgtm_image_errors import ErrRecordCount
-from domain.lgtm_image_object import create_lgtm_image
+from domain.lgtm_image_object import get_lgtm_image_url_factory
 from domain.repository.lgtm_image_repository_interface import (
     LgtmImageRepositoryInterface,
 )
@@ -17,22 +23,33 @@ class RetrieveRecentlyCreatedLgtmImagesUsecase:
         repository: LgtmImageRepositoryInterface,
         base_url: str,
         limit: int = DEFAULT_RANDOM_IMAGES_LIMIT,
-    ) -> list[LgtmImage]:
+        before: Optional[str] = None,
+    ) -> LgtmImagePage:
         logger.info(
             "Executing RetrieveRecentlyCreatedLgtmImagesUsecase",
-            extra={"limit": limit},
+            extra={"limit": limit, "before": before},
         )
 
-        image_objects = await repository.find_recently_created(limit)
+        before_id = decode_lgtm_image_cursor(before) if before is not None else None
 
-        if len(image_objects) < limit:
+        # 次のページの有無を判定するため1件多く取得する
+        image_objects = await repository.find_recently_created(limit + 1, before_id)
+        has_next = len(image_objects) > limit
+        image_objects = image_objects[:limit]
+
+        # 最初のページは件数が足りない場合にエラーとする（2ページ目以降は最後のページが短くなる）
+        if before is None and len(image_objects) < limit:
             raise ErrRecordCount()
 
-        images = [create_lgtm_image(obj, base_url) for obj in image_objects]
+        create = get_lgtm_image_url_factory(base_url).create
+        images = [create(obj) for obj in image_objects]
+        next_cursor = (
+            encode_lgtm_image_cursor(image_objects[-1].id) if has_next else None
+        )
 
         logger.info(
             "RetrieveRecentlyCreatedLgtmImagesUsecase completed successfully",
-            extra={"images_count": len(images)},
+            extra={"images_count": len(images), "has_next": has_next},
         )
 
-        return images
+        return LgtmImagePage(images=images, next_cursor=next_cursor)
@@ -2,10 +2,13 @@
 
 import logging
 from collections.abc import AsyncGenerator
+from typing import cast
 
+import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from tests.fixtures.sqlite_database import create_sqlite_db_session
 from tests.fixtures.test_database import (
     create_test_database,
     drop_test_database,
@@ -40,3 +43,17 @@ async def test_db_session() -> AsyncGenerator[AsyncSession, None]:
             except Exception as e:
                 # 削除失敗をログに記録するが、元のエラーをマスクしないため再送出しない
                 logger.warning(f"Failed to drop test database '{db_name}': {e}")
+
+
+@pytest_asyncio.fixture
+async def sqlite_db_session() -> AsyncGenerator[AsyncSession, None]:
+    # MySQLに接続せずにインメモリのSQLiteで実行する
+    async for session in create_sqlite_db_session():
+        yield session
+
+
+@pytest.fixture(params=["sqlite", "mysql"])
+def repository_db_session(request: pytest.FixtureRequest) -> AsyncSession:
+    # リポジトリのテストをSQLite（オフライン）とMySQLの両方で実行する
+    fixture_name = {"sqlite": "sqlite_db_session", "mysql": "test_db_session"}
+    return cast(AsyncSession, request.getfixturevalue(fixture_name[request.param]))
@@ -66,9 +66,9 @@ def test_create_upload_object_strage_dto() -> None:
     result = create_upload_object_storage_dto(body, prefix, image_name, image_extension)
 
     # Assert
-    assert result["body"] == body
-    assert result["image_extension"] == image_extension
-    assert result["key"] == "2024/01/15/14/test-uuid-123.png"
+    assert result.body == body
+    assert result.image_extension == image_extension
+    assert result.key == "2024/01/15/14/test-uuid-123.png"
 
 
 def test_create_uploaded_lgtm_image() -> None:
@@ -83,8 +83,7 @@ def test_create_uploaded_lgtm_image() -> None:
 
     # Assert
     assert (
-        result["url"]
-        == "https://lgtm-images.lgtmeow.com/2024/01/15/14/test-uuid-123.webp"
+        result.url == "https://lgtm-images.lgtmeow.com/2024/01/15/14/test-uuid-123.webp"
     )
 
 
@@ -96,7 +95,7 @@ def test_uploaded_lgtm_image_type() -> None:
     )
 
     # Assert
-    assert image["url"] == "https://lgtm-images.lgtmeow.com/test.webp"
+    assert image.url == "https://lgtm-images.lgtmeow.com/test.webp"
 
 
 def test_upload_object_strage_dto_type() -> None:
@@ -107,6 +106,6 @@ def test_upload_object_strage_dto_type() -> None:
     )
 
     # Assert
-    assert param["body"] == b"test data"
-    assert param["image_extension"] == ".png"
-    assert param["key"] == "test/path/image.png"
+    assert param.body == b"test data"
+    assert param.image_extension == ".png"
+    assert param.key == "test/path/image.png"
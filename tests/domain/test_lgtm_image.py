@@ -1,7 +1,15 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from domain.lgtm_image import LgtmImage
+import pytest
+
+from domain.lgtm_image import (
+    LgtmImage,
+    LgtmImageId,
+    is_ascii_decimal,
+    parse_lgtm_image_ids,
+)
 from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT
+from domain.lgtm_image_errors import ErrInvalidImageIds
 
 
 def test_default_random_images_limit_value() -> None:
@@ -25,8 +33,8 @@ def test_lgtm_image_creation() -> None:
     )
 
     # Assert
-    assert image["id"] == "test-id-123"
-    assert image["url"] == "https://lgtm-images.lgtmeow.com/test.webp"
+    assert image.id == "test-id-123"
+    assert image.url == "https://lgtm-images.lgtmeow.com/test.webp"
 
 
 def test_lgtm_image_equality() -> None:
@@ -48,3 +56,47 @@ def test_lgtm_image_equality() -> None:
     # Act & Assert
     assert image1 == image2
     assert image1 != image3
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("0", True),
+        ("123", True),
+        ("", False),
+        ("-1", False),
+        ("²", False),
+        ("１", False),
+    ],
+)
+def test_is_ascii_decimal(value: str, expected: bool) -> None:
+    """ASCIIの10進数字だけからなる文字列の場合にTrueを返すことを確認."""
+    # Act & Assert
+    assert is_ascii_decimal(value) is expected
+
+
+def test_parse_lgtm_image_ids_keeps_order_without_duplicates() -> None:
+    """指定した順序のまま重複を除いて画像IDを取り出すことを確認."""
+    # Act
+    ids = parse_lgtm_image_ids("3, 1,3,2")
+
+    # Assert
+    assert ids == [LgtmImageId(3), LgtmImageId(1), LgtmImageId(2)]
+
+
+@pytest.mark.parametrize("raw", ["", "1,,2", "1,a", "0", "-1", "1.5", "1,²", "１"])
+def test_parse_lgtm_image_ids_rejects_invalid_format(raw: str) -> None:
+    """形式が不正な場合はErrInvalidImageIdsを送出することを確認."""
+    # Act & Assert
+    with pytest.raises(ErrInvalidImageIds):
+        parse_lgtm_image_ids(raw)
+
+
+def test_parse_lgtm_image_ids_rejects_too_many_ids() -> None:
+    """上限を超えるIDを指定した場合はErrInvalidImageIdsを送出することを確認."""
+    # Arrange
+    raw = ",".join(str(i) for i in range(1, 102))
+
+    # Act & Assert
+    with pytest.raises(ErrInvalidImageIds):
+        parse_lgtm_image_ids(raw)
@@ -0,0 +1,89 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import base64
+
+import pytest
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_cursor import (
+    RandomLgtmImageCursor,
+    decode_lgtm_image_cursor,
+    decode_random_lgtm_image_cursor,
+    encode_lgtm_image_cursor,
+    encode_random_lgtm_image_cursor,
+)
+from domain.lgtm_image_errors import ErrInvalidCursor
+
+
+def test_cursor_round_trip() -> None:
+    """エンコードしたカーソルから元の画像IDを取り出せることを確認."""
+    # Arrange
+    last_id = LgtmImageId(12345)
+
+    # Act
+    cursor = encode_lgtm_image_cursor(last_id)
+
+    # Assert
+    assert decode_lgtm_image_cursor(cursor) == last_id
+
+
+def test_cursor_is_url_safe() -> None:
+    """カーソルがクエリパラメータにそのまま使える文字だけで構成されることを確認."""
+    # Act
+    cursor = encode_lgtm_image_cursor(LgtmImageId(999999999))
+
+    # Assert
+    assert cursor.replace("-", "").replace("_", "").isalnum()
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "invalid!",
+        "MTIz",  # バージョンなし（"123"）
+        "djI6MTIz",  # 未知のバージョン（"v2:123"）
+        "djE6YWJj",  # IDが数値でない（"v1:abc"）
+        "djE6MA",  # IDが0（"v1:0"）
+        "djE6wrI",  # IDがASCII以外の数字（"v1:²"）
+    ],
+)
+def test_decode_invalid_cursor(cursor: str) -> None:
+    """不正なカーソルの場合はErrInvalidCursorを送出することを確認."""
+    # Act & Assert
+    with pytest.raises(ErrInvalidCursor):
+        decode_lgtm_image_cursor(cursor)
+
+
+def test_random_cursor_round_trip() -> None:
+    """ランダム画像のカーソルから元の進み具合を取り出せることを確認."""
+    # Arrange
+    state = RandomLgtmImageCursor(seed=(1 << 64) - 1, pool_size=100_000, position=99)
+
+    # Act
+    cursor = encode_random_lgtm_image_cursor(state)
+
+    # Assert
+    assert decode_random_lgtm_image_cursor(cursor) == state
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "v1:1",  # 最近作成された画像のカーソル
+        "r1:1:10",  # 項目が足りない
+        "r1:1:0:0",  # 画像数が0
+        "r1:1:10:11",  # 位置が画像数を超える
+        "r1:-1:10:0",  # seedが負
+        f"r1:{1 << 64}:10:0",  # seedが64ビットを超える
+        "r1:1:10:²",  # 位置がASCII以外の数字
+    ],
+)
+def test_decode_invalid_random_cursor(raw: str) -> None:
+    """不正なランダム画像のカーソルの場合はErrInvalidCursorを送出することを確認."""
+    # Arrange
+    cursor = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    # Act & Assert
+    with pytest.raises(ErrInvalidCursor):
+        decode_random_lgtm_image_cursor(cursor)
@@ -1,7 +1,14 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
-from domain.lgtm_image import LgtmImageId
-from domain.lgtm_image_object import LgtmImageObject, create_lgtm_image
+import pytest
+
+from domain.lgtm_image import LgtmImage, LgtmImageId
+from domain.lgtm_image_object import (
+    LgtmImageObject,
+    LgtmImageUrlFactory,
+    create_lgtm_image,
+    get_lgtm_image_url_factory,
+)
 
 
 def test_lgtm_image_object_creation() -> None:
@@ -14,9 +21,9 @@ def test_lgtm_image_object_creation() -> None:
     )
 
     # Assert
-    assert image_obj["id"] == LgtmImageId(1)
-    assert image_obj["path"] == "2021/03/16/23"
-    assert image_obj["filename"] == "5947f291-a46e-453c-a230-0d756d7174cb"
+    assert image_obj.id == LgtmImageId(1)
+    assert image_obj.path == "2021/03/16/23"
+    assert image_obj.filename == "5947f291-a46e-453c-a230-0d756d7174cb"
 
 
 def test_lgtm_image_object_equality() -> None:
@@ -57,9 +64,9 @@ def test_to_lgtm_image_conversion() -> None:
     lgtm_image = create_lgtm_image(image_obj, base_url)
 
     # Assert
-    assert lgtm_image["id"] == "1"
+    assert lgtm_image.id == "1"
     assert (
-        lgtm_image["url"]
+        lgtm_image.url
         == "https://lgtm-images.lgtmeow.com/2021/03/16/23/5947f291-a46e-453c-a230-0d756d7174cb.webp"
     )
 
@@ -79,6 +86,48 @@ def test_to_lgtm_image_url_format() -> None:
 
     # Assert
     assert (
-        lgtm_image["url"]
+        lgtm_image.url
         == "https://lgtm-images.lgtmeow.com/2024/12/31/10/test-image.webp"
     )
+
+
+def test_url_factory_creates_lgtm_image() -> None:
+    """ベースURLを束縛したファクトリーでcreate_lgtm_imageと同じLgtmImageを作成すること."""
+    # Arrange
+    image_obj = LgtmImageObject(
+        id=LgtmImageId(1),
+        path="2021/03/16/23",
+        filename="5947f291-a46e-453c-a230-0d756d7174cb",
+    )
+    factory = LgtmImageUrlFactory("lgtm-images.lgtmeow.com")
+
+    # Act
+    lgtm_image = factory.create(image_obj)
+
+    # Assert
+    assert lgtm_image == create_lgtm_image(image_obj, "lgtm-images.lgtmeow.com")
+
+
+def test_url_factory_is_shared_per_base_url() -> None:
+    """同じベースURLのファクトリーを使い回すこと."""
+    # Act & Assert
+    assert get_lgtm_image_url_factory("a.example.com") is get_lgtm_image_url_factory(
+        "a.example.com"
+    )
+    assert get_lgtm_image_url_factory(
+        "a.example.com"
+    ) is not get_lgtm_image_url_factory("b.example.com")
+
+
+@pytest.mark.parametrize(
+    "image, field",
+    [
+        (LgtmImageObject(LgtmImageId(1), "2021/03/16/23", "a"), "path"),
+        (LgtmImage("1", "https://lgtm-images.lgtmeow.com/a.webp"), "url"),
+    ],
+)
+def test_image_is_immutable(image: LgtmImageObject | LgtmImage, field: str) -> None:
+    """LgtmImageObject・LgtmImageは作成後に属性へ代入できないこと."""
+    # Act & Assert
+    with pytest.raises(AttributeError):
+        setattr(image, field, "changed")
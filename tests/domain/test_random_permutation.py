@@ -0,0 +1,64 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import pytest
+
+from domain.random_permutation import RandomPermutation, next_seed
+
+
+@pytest.mark.parametrize("size", [1, 2, 9, 255, 256, 1000, 4097])
+def test_permutation_covers_all_positions(size: int) -> None:
+    """0からsize-1までの値を重複なく1回ずつ返すことを確認."""
+    # Arrange
+    permutation = RandomPermutation(size, seed=42)
+
+    # Act
+    values = [permutation[position] for position in range(size)]
+
+    # Assert
+    assert sorted(values) == list(range(size))
+
+
+def test_permutation_is_deterministic() -> None:
+    """同じsizeとseedであれば同じ並べ替えになることを確認."""
+    # Act
+    first = [RandomPermutation(100, seed=7)[i] for i in range(100)]
+    second = [RandomPermutation(100, seed=7)[i] for i in range(100)]
+
+    # Assert
+    assert first == second
+
+
+def test_permutation_depends_on_seed() -> None:
+    """seedが異なれば並べ替えも異なることを確認."""
+    # Act
+    first = [RandomPermutation(100, seed=1)[i] for i in range(100)]
+    second = [RandomPermutation(100, seed=2)[i] for i in range(100)]
+
+    # Assert
+    assert first != second
+
+
+def test_permutation_rejects_out_of_range_position() -> None:
+    """範囲外の位置を指定した場合はIndexErrorを送出することを確認."""
+    # Arrange
+    permutation = RandomPermutation(10, seed=0)
+
+    # Act & Assert
+    with pytest.raises(IndexError):
+        permutation[10]
+
+
+def test_permutation_rejects_empty_size() -> None:
+    """sizeが0の場合はValueErrorを送出することを確認."""
+    # Act & Assert
+    with pytest.raises(ValueError):
+        RandomPermutation(0, seed=0)
+
+
+def test_next_seed_stays_within_64_bits() -> None:
+    """次のseedが64ビットの範囲に収まることを確認."""
+    # Act
+    seed = next_seed((1 << 64) - 1)
+
+    # Assert
+    assert 0 <= seed < 1 << 64
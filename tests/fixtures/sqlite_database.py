@@ -0,0 +1,78 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+"""インメモリのSQLiteに画像のテーブルを作成する（テスト・ベンチマーク用）."""
+
+import uuid
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from infrastructure.models import Base, LgtmImageModel
+
+# 1回のINSERTで登録する行数（SQLiteのバインド変数の上限を超えないようにする）
+_INSERT_BATCH_SIZE = 5000
+
+
+async def create_sqlite_database_engine() -> AsyncEngine:
+    """インメモリのSQLiteにモデルからテーブルを作成したエンジンを返す.
+
+    MySQLやPlanetScaleのスキーマを使わずにリポジトリのテストやベンチマークを実行するために使う。
+    すべてのセッションで同じデータベースを使うように、コネクションは1つだけ作成する。
+
+    Returns:
+        テーブル作成済みのエンジン（呼び出し側で dispose すること）
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+
+async def insert_lgtm_image_rows(engine: AsyncEngine, count: int) -> None:
+    """1時間あたり20件ずつ作成された画像のレコードをIDの昇順に登録する.
+
+    ベンチマークで10万件規模の行を登録するために、ORMを経由せずにまとめてINSERTする。
+    """
+    started_at = datetime(2021, 3, 16)
+    async with engine.begin() as conn:
+        for start in range(1, count + 1, _INSERT_BATCH_SIZE):
+            rows = []
+            for id_ in range(start, min(start + _INSERT_BATCH_SIZE, count + 1)):
+                created_at = started_at + timedelta(hours=id_ // 20)
+                rows.append(
+                    {
+                        "id": id_,
+                        "path": created_at.strftime("%Y/%m/%d/%H"),
+                        "filename": str(uuid.UUID(int=id_, version=4)),
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+            await conn.execute(insert(LgtmImageModel), rows)
+
+
+async def create_sqlite_db_session() -> AsyncGenerator[AsyncSession, None]:
+    engine = await create_sqlite_database_engine()
+    try:
+        async_session_maker = async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        async with async_session_maker() as session:
+            yield session
+    finally:
+        await engine.dispose()
@@ -1,9 +1,12 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
 from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
 from infrastructure.models import LgtmImageModel
 
 
@@ -26,3 +29,27 @@ async def insert_test_lgtm_images(
     session.add_all(test_images)
     await session.commit()
     return test_images
+
+
+def create_lgtm_image_object(id_: int) -> LgtmImageObject:
+    return LgtmImageObject(
+        id=LgtmImageId(id_), path="2024/01/15/14", filename=f"image{id_}"
+    )
+
+
+def create_mock_lgtm_image_repository(count: int) -> Mock:
+    """ID 1〜count の画像を返すリポジトリのモックを作成する
+
+    find_by_ids は指定されたIDの画像をIDの昇順で返す。
+    """
+    repository = Mock()
+    repository.find_all_ids = AsyncMock(
+        return_value=[LgtmImageId(i) for i in range(1, count + 1)]
+    )
+    repository.find_by_ids = AsyncMock(
+        side_effect=lambda ids: [
+            LgtmImageObject(id=id_, path="2024/01/15/14", filename=f"{id_}")
+            for id_ in sorted(ids)
+        ]
+    )
+    return repository
@@ -0,0 +1,56 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domain.lgtm_image import LgtmImageId
+from infrastructure.cached_lgtm_image_repository import CachedLgtmImageRepository
+from infrastructure.lgtm_image_object_cache import LgtmImageObjectCache
+from metrics.registry import MetricsRegistry
+from tests.fixtures.test_data_helpers import create_lgtm_image_object
+
+
+class TestCachedLgtmImageRepository:
+    @pytest.mark.asyncio
+    async def test_fetches_only_misses(self) -> None:
+        """キャッシュにない画像だけを元のリポジトリから取得すること."""
+        # Arrange
+        inner = MagicMock()
+        inner.find_by_ids = AsyncMock(
+            side_effect=lambda ids: [create_lgtm_image_object(id_) for id_ in ids]
+        )
+        repository = CachedLgtmImageRepository(
+            inner, LgtmImageObjectCache(10, MetricsRegistry())
+        )
+        await repository.find_by_ids([LgtmImageId(1), LgtmImageId(2)])
+
+        # Act
+        result = await repository.find_by_ids(
+            [LgtmImageId(2), LgtmImageId(3), LgtmImageId(3)]
+        )
+
+        # Assert
+        assert sorted(obj.id for obj in result) == [2, 3]
+        inner.find_by_ids.assert_awaited_with([3])
+
+    @pytest.mark.asyncio
+    async def test_skips_repository_when_all_cached(self) -> None:
+        """すべてキャッシュにある場合はDBに問い合わせないこと."""
+        # Arrange
+        inner = MagicMock()
+        inner.find_recently_created = AsyncMock(
+            return_value=[create_lgtm_image_object(1), create_lgtm_image_object(2)]
+        )
+        inner.find_by_ids = AsyncMock()
+        repository = CachedLgtmImageRepository(
+            inner, LgtmImageObjectCache(10, MetricsRegistry())
+        )
+        await repository.find_recently_created(2)
+
+        # Act
+        result = await repository.find_by_ids([LgtmImageId(2), LgtmImageId(1)])
+
+        # Assert
+        assert result == [create_lgtm_image_object(2), create_lgtm_image_object(1)]
+        inner.find_by_ids.assert_not_awaited()
@@ -0,0 +1,334 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
+from infrastructure.catalog_snapshot import (
+    _FILE_HEADER,
+    CatalogRow,
+    CatalogSnapshot,
+    refresh_catalog_snapshot_periodically,
+)
+from infrastructure.catalog_snapshot_lgtm_image_repository import (
+    CatalogSnapshotLgtmImageRepository,
+)
+
+
+def _row(id_: int, created_at: datetime) -> CatalogRow:
+    return (id_, "2024/01/15/14", f"image{id_}", created_at)
+
+
+def _create_snapshot() -> CatalogSnapshot:
+    snapshot = CatalogSnapshot()
+    snapshot.append_rows(
+        [
+            _row(1, datetime(2024, 1, 1)),
+            _row(2, datetime(2024, 1, 3)),
+            # created_atが同じ場合はIDの降順
+            _row(3, datetime(2024, 1, 2)),
+            _row(4, datetime(2024, 1, 2)),
+            _row(5, datetime(2024, 1, 4)),
+        ]
+    )
+    return snapshot
+
+
+def _session_factory(batches: list[list[CatalogRow]]) -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            [MagicMock(tuple=MagicMock(return_value=row)) for row in rows]
+            for rows in batches
+        ]
+    )
+    session_cm = MagicMock()
+
+    async def enter(*args: Any) -> MagicMock:
+        return session
+
+    async def exit_(*args: Any) -> None:
+        return None
+
+    session_cm.__aenter__ = enter
+    session_cm.__aexit__ = exit_
+    return MagicMock(return_value=session_cm)
+
+
+class TestCatalogSnapshot:
+    def test_find_by_ids_skips_missing_ids(self) -> None:
+        """指定したIDの画像を返し、存在しないIDは除くこと."""
+        # Arrange
+        snapshot = _create_snapshot()
+
+        # Act
+        objects = snapshot.find_by_ids([LgtmImageId(4), LgtmImageId(9), LgtmImageId(1)])
+
+        # Assert
+        assert [obj.id for obj in objects] == [4, 1]
+        assert objects[0] == LgtmImageObject(
+            id=LgtmImageId(4), path="2024/01/15/14", filename="image4"
+        )
+
+    def test_find_recently_created_orders_by_created_at_and_id(self) -> None:
+        """created_atの降順、同じ場合はIDの降順で返すこと."""
+        # Arrange
+        snapshot = _create_snapshot()
+
+        # Act
+        objects = snapshot.find_recently_created(10)
+
+        # Assert
+        assert [obj.id for obj in objects] == [5, 2, 4, 3, 1]
+
+    def test_find_recently_created_before_cursor(self) -> None:
+        """指定した画像より前の画像を返すこと."""
+        # Arrange
+        snapshot = _create_snapshot()
+
+        # Act
+        objects = snapshot.find_recently_created(2, before=LgtmImageId(4))
+
+        # Assert
+        assert [obj.id for obj in objects] == [3, 1]
+
+    def test_find_recently_created_with_unknown_cursor(self) -> None:
+        """カーソルの画像が存在しない場合は空のリストを返すこと."""
+        # Act & Assert
+        assert _create_snapshot().find_recently_created(2, LgtmImageId(9)) == []
+
+    def test_all_ids_reflects_appended_rows(self) -> None:
+        """行が追加されるまでは同じリストを返し、追加後は新しいIDを含めること."""
+        # Arrange
+        snapshot = _create_snapshot()
+        ids = snapshot.all_ids()
+
+        # Act
+        unchanged = snapshot.all_ids()
+        snapshot.append_rows([_row(6, datetime(2024, 1, 5))])
+
+        # Assert
+        assert unchanged is ids
+        assert snapshot.all_ids() == [1, 2, 3, 4, 5, 6]
+
+    def test_append_rows_rejects_out_of_order_ids(self) -> None:
+        """最大ID以下の行を追加した場合はValueErrorを送出すること."""
+        # Arrange
+        snapshot = _create_snapshot()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            snapshot.append_rows([_row(5, datetime(2024, 1, 5))])
+
+    @pytest.mark.asyncio
+    async def test_refresh_loads_rows_in_batches(self) -> None:
+        """最大IDより大きい行を分割して読み込むこと."""
+        # Arrange
+        snapshot = CatalogSnapshot()
+        session_factory = _session_factory(
+            [
+                [_row(1, datetime(2024, 1, 1)), _row(2, datetime(2024, 1, 2))],
+                [_row(3, datetime(2024, 1, 3))],
+            ]
+        )
+
+        # Act
+        with patch("infrastructure.catalog_snapshot.CATALOG_REFRESH_BATCH_SIZE", 2):
+            appended = await snapshot.refresh(session_factory)
+
+        # Assert
+        assert appended == 3
+        assert snapshot.loaded
+        assert snapshot.all_ids() == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_reload_removes_deleted_rows(self) -> None:
+        """全件を読み込み直した場合は削除された画像を取り除くこと."""
+        # Arrange
+        snapshot = _create_snapshot()
+        snapshot.all_ids()
+        session_factory = _session_factory(
+            [
+                [
+                    _row(1, datetime(2024, 1, 1)),
+                    _row(2, datetime(2024, 1, 3)),
+                    _row(4, datetime(2024, 1, 2)),
+                    _row(5, datetime(2024, 1, 4)),
+                ]
+            ]
+        )
+
+        # Act
+        reloaded = await snapshot.reload(session_factory)
+
+        # Assert
+        assert reloaded == 4
+        assert snapshot.all_ids() == [1, 2, 4, 5]
+        assert snapshot.find_by_ids([LgtmImageId(3)]) == []
+        assert [obj.id for obj in snapshot.find_recently_created(10)] == [5, 2, 4, 1]
+
+    @pytest.mark.asyncio
+    async def test_refresh_periodically_reloads_after_full_reload_interval(
+        self,
+    ) -> None:
+        """全件の読み込み直しの間隔が経過した場合は差分の代わりに全件を読み込み直すこと."""
+        # Arrange
+        snapshot = _create_snapshot()
+        snapshot.refresh = AsyncMock(return_value=0)  # type: ignore[method-assign]
+        snapshot.reload = AsyncMock(return_value=5)  # type: ignore[method-assign]
+        # 待つたびに40秒進め、3回目で止める（1回目は間隔内、2回目は間隔の経過後）
+        now = 0.0
+
+        async def sleep(seconds: float) -> None:
+            nonlocal now
+            now += 40
+            if now > 80:
+                raise asyncio.CancelledError()
+
+        # Act
+        with (
+            patch("infrastructure.catalog_snapshot.asyncio.sleep", sleep),
+            patch("infrastructure.catalog_snapshot.time.monotonic", lambda: now),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await refresh_catalog_snapshot_periodically(
+                snapshot, MagicMock(), 5, full_reload_interval_seconds=60
+            )
+
+        # Assert
+        snapshot.refresh.assert_awaited_once()
+        snapshot.reload.assert_awaited_once()
+
+
+class TestCatalogSnapshotFile:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """書き出したファイルから同じスナップショットを読み込めること."""
+        # Arrange
+        snapshot = _create_snapshot()
+        path = str(tmp_path / "catalog.bin")
+
+        # Act
+        snapshot.dump(path)
+        loaded = CatalogSnapshot.load(path)
+
+        # Assert
+        assert loaded.loaded
+        assert loaded.all_ids() == snapshot.all_ids()
+        assert loaded.find_recently_created(10) == snapshot.find_recently_created(10)
+        assert loaded.find_by_ids([LgtmImageId(3)]) == snapshot.find_by_ids(
+            [LgtmImageId(3)]
+        )
+
+    def test_appends_delta_after_load(self, tmp_path: Path) -> None:
+        """読み込んだスナップショットに差分を追加できること."""
+        # Arrange
+        path = str(tmp_path / "catalog.bin")
+        _create_snapshot().dump(path)
+        loaded = CatalogSnapshot.load(path)
+
+        # Act
+        loaded.append_rows([_row(6, datetime(2024, 1, 5))])
+
+        # Assert
+        assert loaded.max_id == 6
+        assert [obj.id for obj in loaded.find_recently_created(2)] == [6, 5]
+
+    def test_round_trip_empty_snapshot(self, tmp_path: Path) -> None:
+        """画像がない場合も読み込めること."""
+        # Arrange
+        path = str(tmp_path / "catalog.bin")
+
+        # Act
+        CatalogSnapshot().dump(path)
+
+        # Assert
+        assert len(CatalogSnapshot.load(path)) == 0
+
+    @pytest.mark.parametrize("content", [b"", b"NOTCATAL" + bytes(28)])
+    def test_rejects_invalid_file(self, tmp_path: Path, content: bytes) -> None:
+        """形式が不正なファイルの場合はValueErrorを送出すること."""
+        # Arrange
+        path = tmp_path / "catalog.bin"
+        path.write_bytes(content)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            CatalogSnapshot.load(str(path))
+
+    def test_rejects_truncated_file(self, tmp_path: Path) -> None:
+        """途中で切れたファイルの場合はValueErrorを送出すること."""
+        # Arrange
+        path = tmp_path / "catalog.bin"
+        _create_snapshot().dump(str(path))
+        path.write_bytes(path.read_bytes()[:-1])
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            CatalogSnapshot.load(str(path))
+
+    @pytest.mark.parametrize(
+        "column, value",
+        [
+            # IDの列の2件目を1件目と同じIDにする（ID順でない）
+            (0, 1),
+            # (created_at, id) 順の位置の列の1件目を行数以上にする
+            (2, 5),
+        ],
+    )
+    def test_rejects_corrupted_file(
+        self, tmp_path: Path, column: int, value: int
+    ) -> None:
+        """長さが正しくても内容が壊れているファイルの場合はValueErrorを送出すること."""
+        # Arrange
+        path = tmp_path / "catalog.bin"
+        snapshot = _create_snapshot()
+        snapshot.dump(str(path))
+        content = bytearray(path.read_bytes())
+        index = 1 if column == 0 else 0
+        offset = _FILE_HEADER.size + column * len(snapshot) * 8 + index * 8
+        content[offset : offset + 8] = value.to_bytes(8, "little")
+        path.write_bytes(bytes(content))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="corrupted"):
+            CatalogSnapshot.load(str(path))
+
+    def test_rejects_invalid_path_index(self, tmp_path: Path) -> None:
+        """パスの番号がパスの一覧の範囲外のファイルの場合はValueErrorを送出すること."""
+        # Arrange
+        path = tmp_path / "catalog.bin"
+        snapshot = _create_snapshot()
+        snapshot.dump(str(path))
+        content = bytearray(path.read_bytes())
+        # パスの番号の列（id・created_at・位置の列の後）の1件目を、パスの一覧（1件）の範囲外にする
+        offset = _FILE_HEADER.size + 3 * len(snapshot) * 8
+        content[offset : offset + 4] = (1).to_bytes(4, "little")
+        path.write_bytes(bytes(content))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            CatalogSnapshot.load(str(path))
+
+
+class TestCatalogSnapshotLgtmImageRepository:
+    @pytest.mark.asyncio
+    async def test_reads_from_snapshot(self) -> None:
+        """スナップショットからIDの一覧と画像を返すこと."""
+        # Arrange
+        repository = CatalogSnapshotLgtmImageRepository(_create_snapshot())
+
+        # Act
+        ids = await repository.find_all_ids()
+        objects = await repository.find_by_ids([LgtmImageId(2)])
+        recent = await repository.find_recently_created(1)
+
+        # Assert
+        assert ids == [1, 2, 3, 4, 5]
+        assert [obj.id for obj in objects] == [2]
+        assert [obj.id for obj in recent] == [5]
@@ -1,5 +1,8 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
+import asyncio
+import base64
+import json
 import time
 from typing import Any
 from unittest.mock import AsyncMock, patch
@@ -9,8 +12,30 @@ import pytest
 from domain.lgtm_image_errors import ErrInvalidToken, ErrJwksFetchFailed
 from infrastructure.cognito_token_verifier_repository import (
     JWKS_CACHE_TTL,
+    JWKS_FORCED_REFRESH_MIN_INTERVAL,
     CognitoTokenVerifierRepository,
 )
+from metrics.registry import MetricsRegistry
+
+TEST_ISSUER = "https://cognito-idp.ap-northeast-1.amazonaws.com/test-pool-id"
+
+
+def _create_token(kid: str | None, issuer: str = TEST_ISSUER) -> str:
+    """署名の検証の前の確認を通過する形式のトークンを返す（署名の検証はモックする）."""
+    header = {"alg": "RS256", **({"kid": kid} if kid else {})}
+    claims = {
+        "iss": issuer,
+        "client_id": "test-client-id",
+        "exp": int(time.time()) + 3600,
+    }
+    return ".".join(
+        base64.urlsafe_b64encode(segment).rstrip(b"=").decode()
+        for segment in (
+            json.dumps(header).encode(),
+            json.dumps(claims).encode(),
+            b"signature",
+        )
+    )
 
 
 class TestCognitoTokenVerifierRepository:
@@ -55,15 +80,13 @@ class TestCognitoTokenVerifierRepository:
             patch.object(
                 repository, "_fetch_jwks", new_callable=AsyncMock
             ) as mock_fetch,
-            patch("jose.jwt.get_unverified_header") as mock_get_header,
             patch("jose.jwt.decode") as mock_decode,
         ):
             mock_fetch.return_value = mock_jwks
-            mock_get_header.return_value = {"kid": "test-key-id-1"}
             mock_decode.return_value = {"sub": "user123"}
 
             # Act
-            await repository.verify("test-token")
+            await repository.verify(_create_token("test-key-id-1"))
 
             # Assert
             mock_fetch.assert_called_once()
@@ -80,17 +103,15 @@ class TestCognitoTokenVerifierRepository:
             patch.object(
                 repository, "_fetch_jwks", new_callable=AsyncMock
             ) as mock_fetch,
-            patch("jose.jwt.get_unverified_header") as mock_get_header,
             patch("jose.jwt.decode") as mock_decode,
         ):
             mock_fetch.return_value = mock_jwks
-            mock_get_header.return_value = {"kid": "test-key-id-1"}
             mock_decode.return_value = {"sub": "user123"}
 
             # Act - 初回検証
-            await repository.verify("test-token-1")
+            await repository.verify(_create_token("test-key-id-1"))
             # Act - 2回目の検証（TTL内）
-            await repository.verify("test-token-2")
+            await repository.verify(_create_token("test-key-id-1"))
 
             # Assert - 初回のみJWKS取得が呼ばれる
             assert mock_fetch.call_count == 1
@@ -105,21 +126,19 @@ class TestCognitoTokenVerifierRepository:
             patch.object(
                 repository, "_fetch_jwks", new_callable=AsyncMock
             ) as mock_fetch,
-            patch("jose.jwt.get_unverified_header") as mock_get_header,
             patch("jose.jwt.decode") as mock_decode,
         ):
             mock_fetch.return_value = mock_jwks
-            mock_get_header.return_value = {"kid": "test-key-id-1"}
             mock_decode.return_value = {"sub": "user123"}
 
             # Act - 初回検証
-            await repository.verify("test-token-1")
+            await repository.verify(_create_token("test-key-id-1"))
 
             # TTL期限切れをシミュレート
             repository._jwks_cached_at = time.time() - (JWKS_CACHE_TTL + 1)
 
             # Act - 2回目の検証（TTL期限切れ後）
-            await repository.verify("test-token-2")
+            await repository.verify(_create_token("test-key-id-1"))
 
             # Assert - 2回JWKSが取得される
             assert mock_fetch.call_count == 2
@@ -146,12 +165,10 @@ class TestCognitoTokenVerifierRepository:
             patch.object(
                 repository, "_fetch_jwks", new_callable=AsyncMock
             ) as mock_fetch,
-            patch("jose.jwt.get_unverified_header") as mock_get_header,
             patch("jose.jwt.decode") as mock_decode,
         ):
             # 再取得時に新しいキーを返す
             mock_fetch.side_effect = [new_jwks]
-            mock_get_header.return_value = {"kid": "new-key-id"}
             mock_decode.return_value = {"sub": "user123"}
 
             # Act - 初回検証（古いJWKSをキャッシュ）
@@ -159,7 +176,7 @@ class TestCognitoTokenVerifierRepository:
             repository._jwks_cached_at = time.time()
 
             # Act - 新しいkidで検証
-            await repository.verify("test-token-with-new-kid")
+            await repository.verify(_create_token("new-key-id"))
 
             # Assert - JWKSが再取得される
             assert mock_fetch.call_count == 1
@@ -175,14 +192,12 @@ class TestCognitoTokenVerifierRepository:
             patch.object(
                 repository, "_fetch_jwks", new_callable=AsyncMock
             ) as mock_fetch,
-            patch("jose.jwt.get_unverified_header") as mock_get_header,
         ):
             mock_fetch.return_value = mock_jwks
-            mock_get_header.return_value = {"kid": "non-existent-kid"}
 
             # Act & Assert
             with pytest.raises(ErrInvalidToken) as exc_info:
-                await repository.verify("test-token")
+                await repository.verify(_create_token("non-existent-kid"))
 
             assert "Unable to find key with kid 'non-existent-kid'" in str(
                 exc_info.value
@@ -198,14 +213,12 @@ class TestCognitoTokenVerifierRepository:
             patch.object(
                 repository, "_fetch_jwks", new_callable=AsyncMock
             ) as mock_fetch,
-            patch("jose.jwt.get_unverified_header") as mock_get_header,
         ):
             mock_fetch.return_value = mock_jwks
-            mock_get_header.return_value = {}  # kidなし
 
             # Act & Assert
             with pytest.raises(ErrInvalidToken) as exc_info:
-                await repository.verify("test-token")
+                await repository.verify(_create_token(None))
 
             assert "Token header missing 'kid'" in str(exc_info.value)
 
@@ -242,6 +255,40 @@ class TestCognitoTokenVerifierRepository:
             with pytest.raises(ErrJwksFetchFailed):
                 await repository._fetch_jwks()
 
+    @pytest.mark.asyncio
+    async def test_verify_propagates_jwks_fetch_failure(
+        self, repository: CognitoTokenVerifierRepository
+    ) -> None:
+        """JWKSの取得に失敗した場合はErrInvalidTokenに変換せずErrJwksFetchFailedを発生させること."""
+        # Arrange
+        with patch.object(
+            repository, "_fetch_jwks", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.side_effect = ErrJwksFetchFailed("Failed to fetch JWKS")
+
+            # Act & Assert
+            with pytest.raises(ErrJwksFetchFailed):
+                await repository.verify(_create_token("test-key-id-1"))
+
+    @pytest.mark.asyncio
+    async def test_verify_rejects_malformed_token_before_fetching_jwks(
+        self, repository: CognitoTokenVerifierRepository
+    ) -> None:
+        """形式が不正なトークンはJWKSを取得せず、署名も検証せずに拒否すること."""
+        # Arrange
+        with (
+            patch.object(
+                repository, "_fetch_jwks", new_callable=AsyncMock
+            ) as mock_fetch,
+            patch("jose.jwt.decode") as mock_decode,
+        ):
+            # Act & Assert
+            with pytest.raises(ErrInvalidToken):
+                await repository.verify("test-token")
+
+        mock_fetch.assert_not_called()
+        mock_decode.assert_not_called()
+
     def test_is_jwks_expired_returns_true_when_jwks_is_none(
         self, repository: CognitoTokenVerifierRepository
     ) -> None:
@@ -325,3 +372,204 @@ class TestCognitoTokenVerifierRepository:
 
         # Assert
         assert key is None
+
+    def test_uses_cognito_urls_by_default(
+        self, repository: CognitoTokenVerifierRepository
+    ) -> None:
+        """JWKSのURLと発行者はユーザープールから組み立てること."""
+        # Act & Assert
+        assert repository.keys_url == (
+            "https://cognito-idp.ap-northeast-1.amazonaws.com/"
+            "test-pool-id/.well-known/jwks.json"
+        )
+        assert repository.expected_issuer == (
+            "https://cognito-idp.ap-northeast-1.amazonaws.com/test-pool-id"
+        )
+
+    @pytest.mark.asyncio
+    async def test_overrides_jwks_url_and_issuer(
+        self, mock_jwks: dict[str, Any]
+    ) -> None:
+        """JWKSのURLと発行者を指定した場合はそれを使って検証すること."""
+        # Arrange
+        repository = CognitoTokenVerifierRepository(
+            region="ap-northeast-1",
+            user_pool_id="test-pool-id",
+            app_client_id="test-client-id",
+            jwks_url="http://jwks:8080/jwks.json",
+            issuer="http://jwks:8080",
+        )
+
+        with (
+            patch.object(
+                repository, "_fetch_jwks", new_callable=AsyncMock
+            ) as mock_fetch,
+            patch("jose.jwt.decode") as mock_decode,
+        ):
+            mock_fetch.return_value = mock_jwks
+            mock_decode.return_value = {"sub": "user123"}
+
+            # Act
+            await repository.verify(
+                _create_token("test-key-id-1", issuer="http://jwks:8080")
+            )
+
+        # Assert
+        assert repository.keys_url == "http://jwks:8080/jwks.json"
+        assert mock_decode.call_args.kwargs["issuer"] == "http://jwks:8080"
+
+
+class TestUnknownKidRefreshThrottling:
+    @pytest.fixture
+    def repository(self) -> CognitoTokenVerifierRepository:
+        """JWKSをキャッシュ済みのリポジトリを返すフィクスチャ."""
+        repository = CognitoTokenVerifierRepository(
+            region="ap-northeast-1",
+            user_pool_id="test-pool-id",
+            app_client_id="test-client-id",
+        )
+        repository._jwks = {"keys": [{"kid": "test-key-id-1", "kty": "RSA"}]}
+        repository._jwks_cached_at = time.time()
+        return repository
+
+    async def _verify_with_kid(
+        self, repository: CognitoTokenVerifierRepository, kid: str
+    ) -> None:
+        await repository.verify(_create_token(kid))
+
+    @pytest.mark.asyncio
+    async def test_does_not_refresh_again_within_min_interval(
+        self, repository: CognitoTokenVerifierRepository
+    ) -> None:
+        """最小間隔内は別の不明なkidでもJWKSを再取得しないこと."""
+        # Arrange
+        with patch.object(
+            repository, "_fetch_jwks", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = repository._jwks
+
+            # Act
+            for kid in ("unknown-kid-1", "unknown-kid-2", "unknown-kid-3"):
+                with pytest.raises(ErrInvalidToken):
+                    await self._verify_with_kid(repository, kid)
+
+        # Assert
+        assert mock_fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_remembered_unknown_kid_without_refresh(
+        self, repository: CognitoTokenVerifierRepository
+    ) -> None:
+        """再取得してもなかったkidは、最小間隔が経過してもJWKSを再取得せずに拒否すること."""
+        # Arrange
+        with patch.object(
+            repository, "_fetch_jwks", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = repository._jwks
+            with pytest.raises(ErrInvalidToken):
+                await self._verify_with_kid(repository, "unknown-kid")
+            repository._last_forced_refresh_at = (
+                time.monotonic() - JWKS_FORCED_REFRESH_MIN_INTERVAL
+            )
+
+            # Act
+            with pytest.raises(ErrInvalidToken):
+                await self._verify_with_kid(repository, "unknown-kid")
+
+        # Assert
+        assert mock_fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshes_again_after_min_interval(
+        self, repository: CognitoTokenVerifierRepository
+    ) -> None:
+        """最小間隔が経過した後はローテーションされた鍵をJWKSから取得すること."""
+        # Arrange
+        rotated_jwks = {
+            "keys": [
+                {"kid": "test-key-id-1", "kty": "RSA"},
+                {"kid": "rotated-key-id", "kty": "RSA"},
+            ]
+        }
+        repository._last_forced_refresh_at = (
+            time.monotonic() - JWKS_FORCED_REFRESH_MIN_INTERVAL
+        )
+
+        with (
+            patch.object(
+                repository, "_fetch_jwks", new_callable=AsyncMock
+            ) as mock_fetch,
+            patch("jose.jwt.decode") as mock_decode,
+        ):
+            mock_fetch.return_value = rotated_jwks
+            mock_decode.return_value = {"sub": "user123"}
+
+            # Act
+            await self._verify_with_kid(repository, "rotated-key-id")
+
+        # Assert
+        assert mock_fetch.call_count == 1
+        assert repository._find_signing_key("rotated-key-id") is not None
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refresh_in_progress(
+        self, repository: CognitoTokenVerifierRepository
+    ) -> None:
+        """再取得中に届いた同じkidのトークンは拒否せずに再取得を待つこと."""
+        # Arrange
+        rotated_jwks = {"keys": [{"kid": "rotated-key-id", "kty": "RSA"}]}
+
+        async def fetch_slowly() -> dict[str, Any]:
+            await asyncio.sleep(0.01)
+            return rotated_jwks
+
+        with (
+            patch.object(
+                repository, "_fetch_jwks", new_callable=AsyncMock
+            ) as mock_fetch,
+            patch("jose.jwt.decode") as mock_decode,
+        ):
+            mock_fetch.side_effect = fetch_slowly
+            mock_decode.return_value = {"sub": "user123"}
+
+            # Act
+            await asyncio.gather(
+                *(repository.verify(_create_token("rotated-key-id")) for _ in range(5))
+            )
+
+        # Assert
+        assert mock_fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_counts_refreshes_and_rejections(
+        self, repository: CognitoTokenVerifierRepository
+    ) -> None:
+        """再取得の回数と不明なkidで拒否した回数をメトリクスに記録すること."""
+        # Arrange
+        registry = MetricsRegistry()
+        with patch(
+            "infrastructure.cognito_token_verifier_repository.get_metrics_registry",
+            return_value=registry,
+        ):
+            repository = CognitoTokenVerifierRepository(
+                region="ap-northeast-1",
+                user_pool_id="test-pool-id",
+                app_client_id="test-client-id",
+            )
+        repository._jwks = {"keys": []}
+        repository._jwks_cached_at = time.time()
+
+        with patch.object(
+            repository, "_fetch_jwks", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = {"keys": []}
+
+            # Act
+            for kid in ("unknown-kid-1", "unknown-kid-2"):
+                with pytest.raises(ErrInvalidToken):
+                    await self._verify_with_kid(repository, kid)
+
+        # Assert
+        snapshot = registry.snapshot()
+        assert snapshot["counters"]["jwks.forced_refreshes"] == 1
+        assert snapshot["counters"]["jwks.unknown_kid_rejections"] == 2
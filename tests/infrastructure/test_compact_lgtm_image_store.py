@@ -0,0 +1,91 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import pytest
+
+from domain.lgtm_image import LgtmImage, LgtmImageId
+from domain.lgtm_image_object import LgtmImageObject
+from infrastructure.compact_lgtm_image_store import CompactLgtmImageStore
+
+_UUID = "5947f291-a46e-453c-a230-0d756d7174cb"
+
+
+class TestCompactLgtmImageStore:
+    def test_restores_uuid_filename_and_path(self) -> None:
+        """UUIDのファイル名とパスを元の文字列に戻せること."""
+        # Arrange
+        store = CompactLgtmImageStore()
+
+        # Act
+        store.append(1, "2021/03/16/23", _UUID)
+
+        # Assert
+        assert store.object_at(0) == LgtmImageObject(
+            id=LgtmImageId(1), path="2021/03/16/23", filename=_UUID
+        )
+        assert store.image_at(0, "example.com") == LgtmImage(
+            id="1", url=f"https://example.com/2021/03/16/23/{_UUID}.webp"
+        )
+
+    def test_keeps_irregular_filenames(self) -> None:
+        """UUIDの形式でないファイル名（大文字を含むものなど）はそのまま保持すること."""
+        # Arrange
+        store = CompactLgtmImageStore()
+
+        # Act
+        store.append(1, "2021/03/16/23", "legacy-image")
+        store.append(2, "2021/03/16/23", _UUID.upper())
+
+        # Assert
+        assert store.filename_at(0) == "legacy-image"
+        assert store.filename_at(1) == _UUID.upper()
+
+    def test_shares_paths_between_rows(self) -> None:
+        """同じ時間帯のパスは1回だけ保持すること."""
+        # Arrange
+        store = CompactLgtmImageStore()
+
+        # Act
+        store.append(1, "2021/03/16/23", _UUID)
+        store.append(2, "2021/03/16/23", _UUID)
+        store.append(3, "2021/03/17/00", _UUID)
+
+        # Assert
+        assert store.columns()["paths"] == ["2021/03/16/23", "2021/03/17/00"]
+        assert store.path_at(1) == "2021/03/16/23"
+        assert store.path_at(2) == "2021/03/17/00"
+
+    def test_position_of(self) -> None:
+        """IDから位置を求め、存在しないIDの場合はNoneを返すこと."""
+        # Arrange
+        store = CompactLgtmImageStore()
+        store.append(10, "2021/03/16/23", _UUID)
+        store.append(20, "2021/03/16/23", _UUID)
+
+        # Act & Assert
+        assert store.position_of(LgtmImageId(20)) == 1
+        assert store.position_of(LgtmImageId(15)) is None
+
+    def test_rejects_out_of_order_ids(self) -> None:
+        """ID順でない行を追加した場合はValueErrorを送出すること."""
+        # Arrange
+        store = CompactLgtmImageStore()
+        store.append(10, "2021/03/16/23", _UUID)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            store.append(10, "2021/03/16/23", _UUID)
+
+    def test_round_trip_columns(self) -> None:
+        """取り出した列から同じストアを作成できること."""
+        # Arrange
+        store = CompactLgtmImageStore()
+        store.append(1, "2021/03/16/23", _UUID)
+        store.append(2, "2021/03/17/00", "legacy-image")
+
+        # Act
+        restored = CompactLgtmImageStore.from_columns(store.columns())
+
+        # Assert
+        assert [restored.object_at(i) for i in range(2)] == [
+            store.object_at(i) for i in range(2)
+        ]
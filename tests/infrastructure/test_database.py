@@ -0,0 +1,239 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import asyncio
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.util import greenlet_spawn
+
+from domain.lgtm_image_errors import ErrDatabaseBusy
+from infrastructure.database import (
+    DatabasePoolSettings,
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolMetrics,
+    create_database_engine,
+    get_replica_database_url,
+    warm_up_connection_pool,
+)
+from metrics.registry import MetricsRegistry
+
+
+def _create_pool(
+    metrics: PoolMetrics, pool_size: int, max_overflow: int
+) -> InstrumentedAsyncAdaptedQueuePool:
+    return InstrumentedAsyncAdaptedQueuePool(
+        lambda: sqlite3.connect(":memory:", check_same_thread=False),
+        pool_metrics=metrics,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        timeout=0.01,
+    )
+
+
+class TestWarmUpConnectionPool:
+    @pytest.mark.asyncio
+    async def test_opens_connections_concurrently(self) -> None:
+        """指定した数のコネクションを同時に確立すること."""
+        # Arrange
+        active = 0
+        max_active = 0
+
+        async def enter(*args: object) -> AsyncMock:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            # 他のコルーチンに切り替えて同時に確立されることを確認する
+            await asyncio.sleep(0)
+            return AsyncMock()
+
+        async def exit_(*args: object) -> None:
+            nonlocal active
+            active -= 1
+
+        connection_cm = MagicMock()
+        connection_cm.__aenter__ = AsyncMock(side_effect=enter)
+        connection_cm.__aexit__ = AsyncMock(side_effect=exit_)
+        engine = MagicMock(spec=AsyncEngine)
+        engine.connect.return_value = connection_cm
+
+        # Act
+        await warm_up_connection_pool(engine, connections=5)
+
+        # Assert
+        assert engine.connect.call_count == 5
+        assert max_active == 5
+
+    @pytest.mark.asyncio
+    async def test_propagates_connection_errors(self) -> None:
+        """接続に失敗した場合は例外を送出すること."""
+        # Arrange
+        connection_cm = MagicMock()
+        connection_cm.__aenter__ = AsyncMock(side_effect=ConnectionError("refused"))
+        connection_cm.__aexit__ = AsyncMock(return_value=None)
+        engine = MagicMock(spec=AsyncEngine)
+        engine.connect.return_value = connection_cm
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await warm_up_connection_pool(engine, connections=2)
+
+
+class TestGetReplicaDatabaseUrl:
+    @pytest.fixture(autouse=True)
+    def primary_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DATABASE_USER", "user")
+        monkeypatch.setenv("DATABASE_PASSWORD", "password")
+        monkeypatch.setenv("DATABASE_HOST", "primary.example.com")
+        monkeypatch.setenv("DATABASE_NAME", "lgtm")
+        monkeypatch.delenv("DATABASE_REPLICA_HOST", raising=False)
+        monkeypatch.delenv("DATABASE_REPLICA_NAME", raising=False)
+
+    def test_returns_none_when_replica_is_not_configured(self) -> None:
+        """レプリカが未設定の場合はNoneを返すこと."""
+        # Act & Assert
+        assert get_replica_database_url() is None
+
+    def test_overrides_host(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """レプリカのホストでプライマリの接続情報を上書きすること."""
+        # Arrange
+        monkeypatch.setenv("DATABASE_REPLICA_HOST", "replica.example.com")
+
+        # Act
+        url = get_replica_database_url()
+
+        # Assert
+        assert url is not None
+        assert url.host == "replica.example.com"
+        assert url.database == "lgtm"
+        assert url.username == "user"
+
+    def test_supports_planetscale_replica_name(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """PlanetScaleのレプリカ指定（database@replica）を使えること."""
+        # Arrange
+        monkeypatch.setenv("DATABASE_REPLICA_NAME", "lgtm@replica")
+
+        # Act
+        url = get_replica_database_url()
+
+        # Assert
+        assert url is not None
+        assert url.host == "primary.example.com"
+        assert url.database == "lgtm@replica"
+
+
+class TestDatabasePoolSettings:
+    def test_checkout_timeout_defaults_to_pool_timeout(self) -> None:
+        """fast-failモードでない場合はpool_timeoutまで待つこと."""
+        # Arrange
+        settings = DatabasePoolSettings(pool_timeout=30)
+
+        # Act & Assert
+        assert settings.checkout_timeout == 30
+
+    def test_checkout_timeout_uses_budget_in_fast_fail_mode(self) -> None:
+        """fast-failモードの場合は取得待ちの上限秒数まで待つこと."""
+        # Arrange
+        settings = DatabasePoolSettings(pool_timeout=30, checkout_budget_seconds=0.5)
+
+        # Act & Assert
+        assert settings.checkout_timeout == 0.5
+
+
+class TestCreateDatabaseEngine:
+    def test_applies_pool_settings(self) -> None:
+        """プールの設定とメトリクスをエンジンのプールに反映すること."""
+        # Arrange
+        metrics = PoolMetrics.create(MetricsRegistry(), "primary")
+        settings = DatabasePoolSettings(
+            pool_size=3, max_overflow=2, checkout_budget_seconds=0.25
+        )
+
+        # Act
+        engine = create_database_engine(
+            URL.create("mysql+asyncmy", host="localhost"), settings, metrics
+        )
+
+        # Assert
+        pool = engine.pool
+        assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+        assert pool.size() == 3
+        assert pool.timeout() == 0.25
+        # dispose時に作り直されたプールにもメトリクスが引き継がれること
+        assert pool.recreate()._pool_metrics is metrics
+
+    def test_connects_with_tls_by_default(self) -> None:
+        """デフォルトではTLSで接続すること."""
+        # Act
+        with patch("infrastructure.database.create_async_engine") as create_engine:
+            create_database_engine(
+                URL.create("mysql+asyncmy", host="localhost"), DatabasePoolSettings()
+            )
+
+        # Assert
+        assert "ssl" in create_engine.call_args.kwargs["connect_args"]
+
+    def test_connects_without_tls_when_disabled(self) -> None:
+        """sslにFalseを指定した場合はTLSを使わずに接続すること."""
+        # Act
+        with patch("infrastructure.database.create_async_engine") as create_engine:
+            create_database_engine(
+                URL.create("mysql+asyncmy", host="localhost"),
+                DatabasePoolSettings(),
+                ssl=False,
+            )
+
+        # Assert
+        assert create_engine.call_args.kwargs["connect_args"] == {}
+
+
+class TestInstrumentedAsyncAdaptedQueuePool:
+    @pytest.mark.asyncio
+    async def test_records_checkout_wait_and_overflow(self) -> None:
+        """コネクションの取得待ち時間とオーバーフローを記録すること."""
+        # Arrange
+        registry = MetricsRegistry()
+        pool = _create_pool(
+            PoolMetrics.create(registry, "primary"), pool_size=1, max_overflow=1
+        )
+
+        def checkout() -> None:
+            first = pool.connect()
+            second = pool.connect()
+            second.close()
+            first.close()
+
+        # Act
+        await greenlet_spawn(checkout)
+
+        # Assert
+        snapshot = registry.snapshot()
+        histogram = snapshot["histograms"]["db_pool.primary.checkout_wait_seconds"]
+        assert histogram["count"] == 2
+        assert snapshot["counters"]["db_pool.primary.overflow_checkouts"] == 1
+        assert snapshot["counters"]["db_pool.primary.checkout_timeouts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_raises_database_busy_on_checkout_timeout(self) -> None:
+        """取得待ちがタイムアウトした場合はErrDatabaseBusyを送出すること."""
+        # Arrange
+        registry = MetricsRegistry()
+        pool = _create_pool(
+            PoolMetrics.create(registry, "primary"), pool_size=1, max_overflow=0
+        )
+
+        def checkout() -> None:
+            first = pool.connect()
+            try:
+                pool.connect()
+            finally:
+                first.close()
+
+        # Act & Assert
+        with pytest.raises(ErrDatabaseBusy):
+            await greenlet_spawn(checkout)
+        assert registry.counter("db_pool.primary.checkout_timeouts").value == 1
@@ -0,0 +1,71 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import pytest
+
+from infrastructure.fenwick_tree import FenwickTree
+
+
+class TestFenwickTree:
+    def test_builds_prefix_sums_from_weights(self) -> None:
+        """初期の重みから累積和を構築すること."""
+        # Arrange
+        weights = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        # Act
+        tree = FenwickTree(weights)
+
+        # Assert
+        assert len(tree) == 5
+        assert [tree.prefix_sum(i) for i in range(6)] == [0, 1, 3, 6, 10, 15]
+        assert tree.total == 15
+
+    def test_append_matches_initial_build(self) -> None:
+        """末尾への追加と一括構築で同じ累積和になること."""
+        # Arrange
+        weights = [float(i % 7) for i in range(100)]
+        tree = FenwickTree()
+
+        # Act
+        for weight in weights:
+            tree.append(weight)
+
+        # Assert
+        built = FenwickTree(weights)
+        assert [tree.prefix_sum(i) for i in range(101)] == [
+            built.prefix_sum(i) for i in range(101)
+        ]
+
+    def test_add_updates_weight(self) -> None:
+        """指定した位置の重みに加算すること."""
+        # Arrange
+        tree = FenwickTree([1.0, 1.0, 1.0])
+
+        # Act
+        tree.add(1, 2.0)
+
+        # Assert
+        assert tree.weight(1) == 3.0
+        assert tree.total == 5.0
+
+    def test_add_rejects_out_of_range_position(self) -> None:
+        """範囲外の位置を指定した場合はIndexErrorを送出すること."""
+        # Arrange
+        tree = FenwickTree([1.0])
+
+        # Act & Assert
+        with pytest.raises(IndexError):
+            tree.add(1, 1.0)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(0.0, 0), (0.5, 0), (1.0, 2), (2.9, 2), (3.0, 3), (9.9, 3)],
+    )
+    def test_find_returns_position_for_cumulative_value(
+        self, value: float, expected: int
+    ) -> None:
+        """累積和が値を超える最初の位置を返し、重みが0の位置は返さないこと."""
+        # Arrange
+        tree = FenwickTree([1.0, 0.0, 2.0, 7.0])
+
+        # Act & Assert
+        assert tree.find(value) == expected
@@ -0,0 +1,130 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import base64
+import json
+from typing import Any
+
+import pytest
+
+from domain.lgtm_image_errors import ErrExpiredToken, ErrInvalidToken
+from infrastructure.jwt_prevalidation import MAX_TOKEN_LENGTH, prevalidate_jwt
+
+ISSUER = "https://cognito-idp.ap-northeast-1.amazonaws.com/test-pool-id"
+APP_CLIENT_ID = "test-client-id"
+NOW = 1_700_000_000.0
+
+
+def _encode(segment: Any) -> str:
+    return base64.urlsafe_b64encode(json.dumps(segment).encode()).rstrip(b"=").decode()
+
+
+def _create_token(header: dict[str, Any] | None = None, **claims: Any) -> str:
+    return ".".join(
+        (
+            _encode(header or {"alg": "RS256", "kid": "test-key-id"}),
+            _encode(
+                {
+                    "iss": ISSUER,
+                    "client_id": APP_CLIENT_ID,
+                    "exp": NOW + 3600,
+                    **claims,
+                }
+            ),
+            "c2lnbmF0dXJl",
+        )
+    )
+
+
+def _prevalidate(token: str) -> None:
+    prevalidate_jwt(token, ISSUER, APP_CLIENT_ID, now=NOW)
+
+
+class TestPrevalidateJwt:
+    def test_returns_unverified_header_and_claims(self) -> None:
+        """受け付けられるトークンのヘッダーとクレームを返すこと."""
+        # Act
+        unverified = prevalidate_jwt(_create_token(), ISSUER, APP_CLIENT_ID, now=NOW)
+
+        # Assert
+        assert unverified["header"]["kid"] == "test-key-id"
+        assert unverified["claims"]["client_id"] == APP_CLIENT_ID
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "",
+            "test-token",
+            "a.b",
+            "a.b.c.d",
+            "a..c",
+            "a+b.c.d",
+            "a.b.c",
+            f"{_encode([1])}.{_encode({})}.c2ln",
+        ],
+    )
+    def test_rejects_malformed_token(self, token: str) -> None:
+        """3つのbase64urlのセグメントでないトークンを拒否すること."""
+        # Act & Assert
+        with pytest.raises(ErrInvalidToken):
+            _prevalidate(token)
+
+    def test_rejects_too_large_token(self) -> None:
+        """長さの上限を超えるトークンはデコードせずに拒否すること."""
+        # Arrange
+        token = _create_token(padding="x" * MAX_TOKEN_LENGTH)
+
+        # Act & Assert
+        with pytest.raises(ErrInvalidToken, match="too large"):
+            _prevalidate(token)
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            {"alg": "none", "kid": "test-key-id"},
+            {"alg": "HS256", "kid": "test-key-id"},
+            {"kid": "test-key-id"},
+        ],
+    )
+    def test_rejects_unsupported_algorithm(self, header: dict[str, Any]) -> None:
+        """RS256以外のアルゴリズムのトークンを拒否すること."""
+        # Act & Assert
+        with pytest.raises(ErrInvalidToken, match="unsupported algorithm"):
+            _prevalidate(_create_token(header))
+
+    def test_rejects_token_without_kid(self) -> None:
+        """ヘッダーにkidがないトークンを拒否すること."""
+        # Act & Assert
+        with pytest.raises(ErrInvalidToken, match="Token header missing 'kid'"):
+            _prevalidate(_create_token({"alg": "RS256"}))
+
+    def test_rejects_expired_token(self) -> None:
+        """有効期限が切れたトークンをErrExpiredTokenで拒否すること."""
+        # Act & Assert
+        with pytest.raises(ErrExpiredToken):
+            _prevalidate(_create_token(exp=NOW - 1))
+
+    def test_rejects_malformed_exp(self) -> None:
+        """数値でない exp のトークンを拒否すること."""
+        # Act & Assert
+        with pytest.raises(ErrInvalidToken, match="'exp'"):
+            _prevalidate(_create_token(exp="never"))
+
+    def test_rejects_unexpected_issuer(self) -> None:
+        """発行者が異なるトークンを拒否すること."""
+        # Act & Assert
+        with pytest.raises(ErrInvalidToken, match="unexpected issuer"):
+            _prevalidate(_create_token(iss="https://example.com/other-pool"))
+
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"client_id": "other-client-id"},
+            {"aud": "other-client-id"},
+            {"aud": ["other-client-id"]},
+        ],
+    )
+    def test_rejects_token_for_other_client(self, claims: dict[str, Any]) -> None:
+        """別のアプリクライアントに発行されたトークンを拒否すること."""
+        # Act & Assert
+        with pytest.raises(ErrInvalidToken, match="unexpected client"):
+            _prevalidate(_create_token(**claims))
@@ -0,0 +1,81 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from unittest.mock import patch
+
+import pytest
+
+from domain.lgtm_image import LgtmImageId
+from infrastructure.lgtm_image_object_cache import LgtmImageObjectCache
+from metrics.registry import MetricsRegistry
+from tests.fixtures.test_data_helpers import create_lgtm_image_object
+
+
+class TestLgtmImageObjectCache:
+    def test_returns_hits_and_misses(self) -> None:
+        """キャッシュにある画像とないIDを分けて返し、件数を記録すること."""
+        # Arrange
+        registry = MetricsRegistry()
+        cache = LgtmImageObjectCache(10, registry)
+        cache.put_many([create_lgtm_image_object(1), create_lgtm_image_object(2)])
+
+        # Act
+        found, misses = cache.get_many([LgtmImageId(1), LgtmImageId(3)])
+
+        # Assert
+        assert found == [create_lgtm_image_object(1)]
+        assert misses == [3]
+        counters = registry.snapshot()["counters"]
+        assert counters["lgtm_image_cache.hits"] == 1
+        assert counters["lgtm_image_cache.misses"] == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        """上限を超えた場合は最も長く使われていない画像を追い出すこと."""
+        # Arrange
+        registry = MetricsRegistry()
+        cache = LgtmImageObjectCache(2, registry)
+        cache.put_many([create_lgtm_image_object(1), create_lgtm_image_object(2)])
+        cache.get_many([LgtmImageId(1)])
+
+        # Act
+        cache.put_many([create_lgtm_image_object(3)])
+
+        # Assert
+        assert len(cache) == 2
+        _, misses = cache.get_many([LgtmImageId(1), LgtmImageId(2), LgtmImageId(3)])
+        assert misses == [2]
+        assert registry.counter("lgtm_image_cache.evictions").value == 1
+
+    def test_treats_expired_objects_as_misses(self) -> None:
+        """追加してからttl_seconds秒が経過した画像はキャッシュにないものとして扱うこと."""
+        # Arrange
+        registry = MetricsRegistry()
+        cache = LgtmImageObjectCache(10, registry, ttl_seconds=60)
+        now = 0.0
+        with patch(
+            "infrastructure.lgtm_image_object_cache.time.monotonic", lambda: now
+        ):
+            cache.put_many([create_lgtm_image_object(1)])
+            now = 30.0
+            cache.put_many([create_lgtm_image_object(2)])
+
+            # Act
+            now = 60.0
+            found, misses = cache.get_many([LgtmImageId(1), LgtmImageId(2)])
+
+        # Assert
+        assert found == [create_lgtm_image_object(2)]
+        assert misses == [1]
+        assert len(cache) == 1
+        assert registry.counter("lgtm_image_cache.expirations").value == 1
+
+    def test_rejects_non_positive_capacity(self) -> None:
+        """上限が0以下の場合はValueErrorを送出すること."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            LgtmImageObjectCache(0)
+
+    def test_rejects_negative_ttl(self) -> None:
+        """ttl_secondsが負の場合はValueErrorを送出すること."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            LgtmImageObjectCache(10, ttl_seconds=-1)
@@ -35,13 +35,13 @@ async def insert_test_lgtm_images(
 
 
 @pytest.mark.asyncio
-async def test_find_all_ids(test_db_session: AsyncSession) -> None:
+async def test_find_all_ids(repository_db_session: AsyncSession) -> None:
     """find_all_idsメソッドのテスト."""
     # テストデータを挿入
-    await insert_test_lgtm_images(test_db_session, count=2)
+    await insert_test_lgtm_images(repository_db_session, count=2)
 
     # リポジトリを作成してテスト
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     ids = await repository.find_all_ids()
 
     # 検証
@@ -50,28 +50,28 @@ async def test_find_all_ids(test_db_session: AsyncSession) -> None:
 
 
 @pytest.mark.asyncio
-async def test_find_by_ids(test_db_session: AsyncSession) -> None:
+async def test_find_by_ids(repository_db_session: AsyncSession) -> None:
     """find_by_idsメソッドのテスト."""
     # テストデータを挿入
-    images = await insert_test_lgtm_images(test_db_session, count=2)
+    images = await insert_test_lgtm_images(repository_db_session, count=2)
 
     # リポジトリを作成してテスト
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     ids = [LgtmImageId(images[0].id), LgtmImageId(images[1].id)]
     result = await repository.find_by_ids(ids)
 
     # 検証
     assert len(result) == 2
-    assert result[0]["filename"] == "test1.webp"
-    assert result[0]["path"] == "/images/test1.webp"
-    assert result[1]["filename"] == "test2.webp"
-    assert result[1]["path"] == "/images/test2.webp"
+    assert result[0].filename == "test1.webp"
+    assert result[0].path == "/images/test1.webp"
+    assert result[1].filename == "test2.webp"
+    assert result[1].path == "/images/test2.webp"
 
 
 @pytest.mark.asyncio
-async def test_find_by_ids_empty_list(test_db_session: AsyncSession) -> None:
+async def test_find_by_ids_empty_list(repository_db_session: AsyncSession) -> None:
     """find_by_idsメソッドで空のIDリストを渡した場合のテスト."""
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     result = await repository.find_by_ids([])
 
     # 検証
@@ -79,10 +79,10 @@ async def test_find_by_ids_empty_list(test_db_session: AsyncSession) -> None:
 
 
 @pytest.mark.asyncio
-async def test_find_all_ids_no_data(test_db_session: AsyncSession) -> None:
+async def test_find_all_ids_no_data(repository_db_session: AsyncSession) -> None:
     """find_all_idsメソッドでデータが0件の場合のテスト."""
     # リポジトリを作成してテスト
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     ids = await repository.find_all_ids()
 
     # 検証
@@ -90,13 +90,13 @@ async def test_find_all_ids_no_data(test_db_session: AsyncSession) -> None:
 
 
 @pytest.mark.asyncio
-async def test_find_by_ids_nonexistent_ids(test_db_session: AsyncSession) -> None:
+async def test_find_by_ids_nonexistent_ids(repository_db_session: AsyncSession) -> None:
     """find_by_idsメソッドで存在しないIDを指定した場合のテスト."""
     # テストデータを挿入
-    await insert_test_lgtm_images(test_db_session, count=2)
+    await insert_test_lgtm_images(repository_db_session, count=2)
 
     # リポジトリを作成してテスト（存在しないIDを指定）
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     nonexistent_ids = [LgtmImageId(9999), LgtmImageId(10000)]
     result = await repository.find_by_ids(nonexistent_ids)
 
@@ -105,25 +105,43 @@ async def test_find_by_ids_nonexistent_ids(test_db_session: AsyncSession) -> Non
 
 
 @pytest.mark.asyncio
-async def test_find_by_ids_partial_match(test_db_session: AsyncSession) -> None:
+async def test_find_by_ids_partial_match(repository_db_session: AsyncSession) -> None:
     """find_by_idsメソッドで一部のIDのみ存在する場合のテスト."""
     # テストデータを挿入
-    images = await insert_test_lgtm_images(test_db_session, count=2)
+    images = await insert_test_lgtm_images(repository_db_session, count=2)
 
     # リポジトリを作成してテスト（存在するIDと存在しないIDを混在）
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     mixed_ids = [LgtmImageId(images[0].id), LgtmImageId(9999)]
     result = await repository.find_by_ids(mixed_ids)
 
     # 検証（存在するもののみ返される）
     assert len(result) == 1
-    assert result[0]["filename"] == "test1.webp"
-    assert result[0]["path"] == "/images/test1.webp"
+    assert result[0].filename == "test1.webp"
+    assert result[0].path == "/images/test1.webp"
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_splits_large_in_list(
+    repository_db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """find_by_idsメソッドでIDが多い場合にIN句を分割して全件取得できることのテスト."""
+    # チャンクサイズを小さくして分割を発生させる
+    monkeypatch.setattr(
+        "infrastructure.lgtm_image_repository.FIND_BY_IDS_CHUNK_SIZE", 2
+    )
+    images = await insert_test_lgtm_images(repository_db_session, count=5)
+
+    repository = LgtmImageRepository(repository_db_session)
+    result = await repository.find_by_ids([LgtmImageId(image.id) for image in images])
+
+    # 検証：すべての画像が1回ずつ返される
+    assert sorted(image.id for image in result) == sorted(image.id for image in images)
 
 
 @pytest.mark.asyncio
 async def test_find_recently_created_returns_limited_count(
-    test_db_session: AsyncSession,
+    repository_db_session: AsyncSession,
 ) -> None:
     """find_recently_createdメソッドでlimit指定時に指定件数が返されることのテスト."""
     # テストデータを異なるcreated_atで挿入
@@ -139,13 +157,13 @@ async def test_find_recently_created_returns_limited_count(
             created_at=now - timedelta(seconds=i),
             updated_at=now,
         )
-        test_db_session.add(image)
+        repository_db_session.add(image)
         images.append(image)
 
-    await test_db_session.commit()
+    await repository_db_session.commit()
 
     # リポジトリを作成してテスト
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     result = await repository.find_recently_created(limit=3)
 
     # 検証：3件返される
@@ -153,14 +171,14 @@ async def test_find_recently_created_returns_limited_count(
 
     # 検証：created_atの降順（新しい順）でソートされている
     # test1が最新、test2が次、test3が3番目に新しい
-    assert result[0]["filename"] == "test1.webp"
-    assert result[1]["filename"] == "test2.webp"
-    assert result[2]["filename"] == "test3.webp"
+    assert result[0].filename == "test1.webp"
+    assert result[1].filename == "test2.webp"
+    assert result[2].filename == "test3.webp"
 
 
 @pytest.mark.asyncio
 async def test_find_recently_created_returns_all_when_limit_exceeds_total(
-    test_db_session: AsyncSession,
+    repository_db_session: AsyncSession,
 ) -> None:
     """find_recently_createdメソッドでlimitが総数より大きい場合に全件返されることのテスト."""
     # テストデータを異なるcreated_atで挿入
@@ -176,13 +194,13 @@ async def test_find_recently_created_returns_all_when_limit_exceeds_total(
             created_at=now - timedelta(seconds=i),
             updated_at=now,
         )
-        test_db_session.add(image)
+        repository_db_session.add(image)
         images.append(image)
 
-    await test_db_session.commit()
+    await repository_db_session.commit()
 
     # リポジトリを作成してテスト
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     result_all = await repository.find_recently_created(limit=10)
 
     # 検証：存在する5件のみ返される
@@ -190,11 +208,45 @@ async def test_find_recently_created_returns_all_when_limit_exceeds_total(
 
 
 @pytest.mark.asyncio
-async def test_find_recently_created_no_data(test_db_session: AsyncSession) -> None:
+async def test_find_recently_created_no_data(
+    repository_db_session: AsyncSession,
+) -> None:
     """find_recently_createdメソッドでデータが0件の場合のテスト."""
     # リポジトリを作成してテスト
-    repository = LgtmImageRepository(test_db_session)
+    repository = LgtmImageRepository(repository_db_session)
     result = await repository.find_recently_created(limit=5)
 
     # 検証：空のリストが返される
     assert result == []
+
+
+@pytest.mark.asyncio
+async def test_find_recently_created_before_cursor(
+    repository_db_session: AsyncSession,
+) -> None:
+    """find_recently_createdメソッドでbefore指定時に指定した画像より前の画像が返されることのテスト."""
+    # テストデータを挿入（created_atが同じ場合はidの降順で並ぶ）
+    images = await insert_test_lgtm_images(repository_db_session, count=5)
+
+    # リポジトリを作成してテスト
+    repository = LgtmImageRepository(repository_db_session)
+    result = await repository.find_recently_created(
+        limit=2, before=LgtmImageId(images[3].id)
+    )
+
+    # 検証：4件目より前の2件が新しい順に返される
+    assert [image.id for image in result] == [images[2].id, images[1].id]
+
+
+@pytest.mark.asyncio
+async def test_find_recently_created_before_unknown_id(
+    repository_db_session: AsyncSession,
+) -> None:
+    """find_recently_createdメソッドで存在しない画像をbeforeに指定した場合のテスト."""
+    await insert_test_lgtm_images(repository_db_session, count=2)
+
+    repository = LgtmImageRepository(repository_db_session)
+    result = await repository.find_recently_created(limit=5, before=LgtmImageId(9999))
+
+    # 検証：空のリストが返される
+    assert result == []
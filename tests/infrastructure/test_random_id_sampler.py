@@ -0,0 +1,147 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import random
+
+import pytest
+
+from domain.lgtm_image import LgtmImageId
+from infrastructure.random_id_sampler import (
+    DeckRandomIdSampler,
+    RecencyWeightedRandomIdSampler,
+    UniformRandomIdSampler,
+    create_random_id_sampler,
+)
+
+
+def _ids(count: int) -> list[LgtmImageId]:
+    return [LgtmImageId(i) for i in range(1, count + 1)]
+
+
+class TestDeckRandomIdSampler:
+    def test_deals_non_overlapping_windows(self) -> None:
+        """山札を配り切るまで重複しないIDを返すこと."""
+        # Arrange
+        sampler = DeckRandomIdSampler(random.Random(42))
+        ids = _ids(20)
+
+        # Act
+        dealt = [sampler.sample(ids, 5) for _ in range(4)]
+
+        # Assert
+        flattened = [id_ for window in dealt for id_ in window]
+        assert sorted(flattened) == ids
+
+    def test_reshuffles_when_exhausted_without_duplicates(self) -> None:
+        """山札の残りが足りない場合はシャッフルし直し、1回の結果に重複を含めないこと."""
+        # Arrange
+        sampler = DeckRandomIdSampler(random.Random(0))
+        ids = _ids(10)
+
+        # Act
+        results = [sampler.sample(ids, 4) for _ in range(10)]
+
+        # Assert
+        for result in results:
+            assert len(result) == 4
+            assert len(set(result)) == 4
+            assert set(result) <= set(ids)
+
+    def test_reshuffles_when_new_ids_arrive(self) -> None:
+        """新しい画像が追加された場合は新しいIDを含めてシャッフルし直すこと."""
+        # Arrange
+        sampler = DeckRandomIdSampler(random.Random(1))
+        ids = _ids(10)
+        sampler.sample(ids, 3)
+        new_ids = [*ids, LgtmImageId(11)]
+
+        # Act
+        dealt = [sampler.sample(new_ids, 1) for _ in range(11)]
+
+        # Assert
+        assert sorted(id_ for window in dealt for id_ in window) == new_ids
+
+    def test_returns_empty_list_for_empty_pool(self) -> None:
+        """IDの一覧が空の場合は空のリストを返すこと."""
+        # Act & Assert
+        assert DeckRandomIdSampler().sample([], 3) == []
+
+
+class TestRecencyWeightedRandomIdSampler:
+    def test_favours_recent_ids(self) -> None:
+        """新しい画像ほど選ばれやすいこと."""
+        # Arrange
+        ids = _ids(1000)
+        sampler = RecencyWeightedRandomIdSampler(half_life=100, rng=random.Random(0))
+
+        # Act
+        sampled = [id_ for _ in range(200) for id_ in sampler.sample(ids, 9)]
+
+        # Assert
+        # 最新の100件が全体の重みのおよそ半分を占める
+        recent = sum(1 for id_ in sampled if id_ > 900)
+        assert 0.4 < recent / len(sampled) < 0.6
+
+    def test_returns_unique_ids(self) -> None:
+        """1回の抽選で同じ画像を重ねて選ばないこと."""
+        # Arrange
+        ids = _ids(30)
+        sampler = RecencyWeightedRandomIdSampler(half_life=1, rng=random.Random(0))
+
+        # Act
+        sampled = sampler.sample(ids, 30)
+
+        # Assert
+        assert sorted(sampled) == ids
+
+    def test_does_not_modify_weights_when_sampling(self) -> None:
+        """抽選を繰り返しても重みが変わらない（浮動小数点の誤差が蓄積しない）こと."""
+        # Arrange
+        ids = _ids(1000)
+        sampler = RecencyWeightedRandomIdSampler(half_life=100, rng=random.Random(0))
+        sampler.sample(ids, 9)
+        tree = list(sampler._weights._tree)
+
+        # Act
+        for _ in range(1000):
+            sampler.sample(ids, 100)
+
+        # Assert
+        assert sampler._weights._tree == tree
+
+    def test_appends_new_ids_incrementally(self) -> None:
+        """新しい画像が追加された場合は重みを作り直さずに追加すること."""
+        # Arrange
+        sampler = RecencyWeightedRandomIdSampler(half_life=10, rng=random.Random(0))
+        sampler.sample(_ids(50), 9)
+        weights = sampler._weights
+
+        # Act
+        sampled = sampler.sample(_ids(60), 60)
+
+        # Assert
+        assert sampler._weights is weights
+        assert len(weights) == 60
+        assert sorted(sampled) == _ids(60)
+
+    def test_rejects_non_positive_half_life(self) -> None:
+        """half_lifeが0以下の場合はValueErrorを送出すること."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            RecencyWeightedRandomIdSampler(half_life=0)
+
+
+class TestCreateRandomIdSampler:
+    def test_creates_sampler_for_mode(self) -> None:
+        """抽選方式に応じたサンプラーを作成すること."""
+        # Act & Assert
+        assert isinstance(create_random_id_sampler("uniform"), UniformRandomIdSampler)
+        assert isinstance(create_random_id_sampler("deck"), DeckRandomIdSampler)
+        assert isinstance(
+            create_random_id_sampler("recency"), RecencyWeightedRandomIdSampler
+        )
+
+    def test_raises_error_for_unknown_mode(self) -> None:
+        """未知の抽選方式の場合はValueErrorを送出すること."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            create_random_id_sampler("unknown")
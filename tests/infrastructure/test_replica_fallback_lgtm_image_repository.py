@@ -0,0 +1,94 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_errors import ErrDatabaseBusy
+from domain.lgtm_image_object import LgtmImageObject
+from infrastructure.replica_fallback_lgtm_image_repository import (
+    ReplicaFallbackLgtmImageRepository,
+)
+
+
+def _create_image_object(id_: int) -> LgtmImageObject:
+    return LgtmImageObject(
+        id=LgtmImageId(id_), path="2024/01/15/14", filename=f"{id_}.webp"
+    )
+
+
+class TestReplicaFallbackLgtmImageRepository:
+    @pytest.mark.asyncio
+    async def test_reads_from_replica(self) -> None:
+        """レプリカが正常な場合はレプリカから読み取ること."""
+        # Arrange
+        replica = Mock()
+        replica.find_all_ids = AsyncMock(return_value=[LgtmImageId(1)])
+        primary = Mock()
+        primary.find_all_ids = AsyncMock()
+        repository = ReplicaFallbackLgtmImageRepository(replica, primary)
+
+        # Act
+        ids = await repository.find_all_ids()
+
+        # Assert
+        assert ids == [LgtmImageId(1)]
+        primary.find_all_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_primary_on_replica_error(self) -> None:
+        """レプリカへの問い合わせに失敗した場合はプライマリから読み取ること."""
+        # Arrange
+        replica = Mock()
+        replica.find_recently_created = AsyncMock(
+            side_effect=OperationalError("SELECT", {}, Exception("lost"))
+        )
+        primary = Mock()
+        primary.find_recently_created = AsyncMock(
+            return_value=[_create_image_object(1)]
+        )
+        repository = ReplicaFallbackLgtmImageRepository(replica, primary)
+
+        # Act
+        images = await repository.find_recently_created(9)
+
+        # Assert
+        assert images == [_create_image_object(1)]
+        primary.find_recently_created.assert_awaited_once_with(9, None)
+
+    @pytest.mark.asyncio
+    async def test_uses_primary_after_fallback(self) -> None:
+        """一度フォールバックした後はレプリカに問い合わせないこと."""
+        # Arrange
+        replica = Mock()
+        replica.find_all_ids = AsyncMock(side_effect=ErrDatabaseBusy("timeout"))
+        replica.find_by_ids = AsyncMock()
+        primary = Mock()
+        primary.find_all_ids = AsyncMock(return_value=[LgtmImageId(1)])
+        primary.find_by_ids = AsyncMock(return_value=[_create_image_object(1)])
+        repository = ReplicaFallbackLgtmImageRepository(replica, primary)
+
+        # Act
+        ids = await repository.find_all_ids()
+        images = await repository.find_by_ids(ids)
+
+        # Assert
+        assert images == [_create_image_object(1)]
+        replica.find_by_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_does_not_fall_back_on_unexpected_error(self) -> None:
+        """DB以外のエラーはフォールバックせずに送出すること."""
+        # Arrange
+        replica = Mock()
+        replica.find_all_ids = AsyncMock(side_effect=ValueError("bug"))
+        primary = Mock()
+        primary.find_all_ids = AsyncMock()
+        repository = ReplicaFallbackLgtmImageRepository(replica, primary)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await repository.find_all_ids()
+        primary.find_all_ids.assert_not_called()
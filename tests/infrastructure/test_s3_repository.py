@@ -0,0 +1,49 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domain.create_lgtm_image import UploadObjectStorageDto
+from infrastructure.s3_repository import S3Repository
+
+
+class TestS3Repository:
+    @pytest.mark.asyncio
+    async def test_upload_uses_shared_client(self) -> None:
+        """共有のS3クライアントでアップロードすること."""
+        # Arrange
+        s3_client = MagicMock()
+        s3_client.put_object = AsyncMock()
+        repository = S3Repository("test-bucket", s3_client)
+        param = UploadObjectStorageDto(
+            body=b"test image", image_extension=".png", key="2024/01/15/14/a.png"
+        )
+
+        # Act
+        await repository.upload(param)
+        await repository.upload(param)
+
+        # Assert
+        assert s3_client.put_object.call_count == 2
+        s3_client.put_object.assert_called_with(
+            Bucket="test-bucket",
+            Key="2024/01/15/14/a.png",
+            Body=b"test image",
+            ContentType="image/png",
+        )
+
+    @pytest.mark.asyncio
+    async def test_upload_propagates_errors(self) -> None:
+        """アップロードに失敗した場合は例外を送出すること."""
+        # Arrange
+        s3_client = MagicMock()
+        s3_client.put_object = AsyncMock(side_effect=RuntimeError("upload failed"))
+        repository = S3Repository("test-bucket", s3_client)
+        param = UploadObjectStorageDto(
+            body=b"test image", image_extension=".jpg", key="a.jpg"
+        )
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            await repository.upload(param)
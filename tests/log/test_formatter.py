@@ -0,0 +1,187 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import json
+import logging
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from log.formatter import JsonFormatter, _UtcTimestampFormatter, get_json_encoder
+
+
+def _create_record(
+    msg: str = "test message",
+    extra: dict[str, Any] | None = None,
+    exc_info: Any = None,
+) -> logging.LogRecord:
+    logger = logging.getLogger("test.formatter")
+    return logger.makeRecord(
+        "test.formatter",
+        logging.INFO,
+        __file__,
+        10,
+        msg,
+        (),
+        exc_info,
+        extra=extra,
+    )
+
+
+class TestJsonFormatter:
+    def test_format_outputs_base_fields(self) -> None:
+        """基本フィールドがJSONとして出力されること."""
+        # Arrange
+        formatter = JsonFormatter()
+        record = _create_record()
+
+        # Act
+        result = json.loads(formatter.format(record))
+
+        # Assert
+        assert result["level"] == "INFO"
+        assert result["logger"] == "test.formatter"
+        assert result["message"] == "test message"
+        assert result["timestamp"] == (
+            datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat()
+        )
+
+    def test_format_includes_extra_fields_and_excludes_reserved_attrs(self) -> None:
+        """extraのフィールドは出力され、LogRecordの標準属性は出力されないこと."""
+        # Arrange
+        formatter = JsonFormatter()
+        record = _create_record(extra={"count": 3, "path": "/lgtm-images"})
+
+        # Act
+        result = json.loads(formatter.format(record))
+
+        # Assert
+        assert result["count"] == 3
+        assert result["path"] == "/lgtm-images"
+        for key in ["msg", "args", "levelno", "pathname", "lineno", "exc_info"]:
+            assert key not in result
+
+    def test_format_includes_request_id(self) -> None:
+        """request_idが設定されている場合に出力されること."""
+        # Arrange
+        formatter = JsonFormatter()
+        record = _create_record()
+        setattr(record, "request_id", "test-request-id")
+
+        # Act
+        result = json.loads(formatter.format(record))
+
+        # Assert
+        assert result["request_id"] == "test-request-id"
+
+    def test_format_includes_traceback(self) -> None:
+        """例外情報がある場合にtracebackが出力されること."""
+        # Arrange
+        formatter = JsonFormatter()
+        try:
+            raise ValueError("test error")
+        except ValueError:
+            record = _create_record(exc_info=sys.exc_info())
+
+        # Act
+        result = json.loads(formatter.format(record))
+
+        # Assert
+        assert "ValueError: test error" in result["traceback"]
+
+    def test_format_serializes_non_json_values_as_str(self) -> None:
+        """JSONにできない値は文字列として出力されること."""
+        # Arrange
+        formatter = JsonFormatter()
+        record = _create_record(extra={"value": {"a"}})
+
+        # Act
+        result = json.loads(formatter.format(record))
+
+        # Assert
+        assert result["value"] == "{'a'}"
+
+    def test_format_keeps_non_ascii_characters(self) -> None:
+        """日本語がエスケープされずに出力されること."""
+        # Arrange
+        formatter = JsonFormatter()
+        record = _create_record(msg="画像を取得")
+
+        # Act
+        output = formatter.format(record)
+
+        # Assert
+        assert "画像を取得" in output
+
+    def test_format_uses_custom_encoder(self) -> None:
+        """指定したエンコーダーが使われること."""
+        # Arrange
+        captured: list[dict[str, Any]] = []
+
+        def encoder(log_data: dict[str, Any]) -> str:
+            captured.append(log_data)
+            return "encoded"
+
+        formatter = JsonFormatter(encoder=encoder)
+
+        # Act
+        output = formatter.format(_create_record())
+
+        # Assert
+        assert output == "encoded"
+        assert captured[0]["message"] == "test message"
+
+
+class TestUtcTimestampFormatter:
+    @pytest.mark.parametrize(
+        "created",
+        [0.0, 1705296600.0, 1705296600.5, 1705296600.123456, 1705296600.9999996],
+    )
+    def test_format_matches_datetime_isoformat(self, created: float) -> None:
+        """datetime.isoformat()と同じ文字列を返すこと."""
+        # Arrange
+        formatter = _UtcTimestampFormatter()
+
+        # Act & Assert
+        assert formatter.format(created) == (
+            datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+        )
+
+    def test_format_matches_datetime_isoformat_with_cache(self) -> None:
+        """同一秒内で連続して呼び出してもdatetime.isoformat()と一致すること."""
+        # Arrange
+        formatter = _UtcTimestampFormatter()
+        rng = random.Random(42)
+        base = 1705296600.0
+        values = sorted(base + rng.random() * 5 for _ in range(1000))
+
+        # Act & Assert
+        for created in values:
+            assert formatter.format(created) == (
+                datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+            )
+
+
+class TestGetJsonEncoder:
+    def test_returns_json_encoder_by_default(self) -> None:
+        """標準のjsonエンコーダーを返すこと."""
+        # Act
+        encoder = get_json_encoder("json")
+
+        # Assert
+        assert encoder({"message": "テスト"}) == '{"message": "テスト"}'
+
+    def test_falls_back_to_json_when_orjson_is_unavailable(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """orjsonが使えない場合は標準のjsonエンコーダーを返すこと."""
+        # Arrange
+        monkeypatch.setattr("log.formatter.orjson", None)
+
+        # Act
+        encoder = get_json_encoder("orjson")
+
+        # Assert
+        assert encoder is get_json_encoder("json")
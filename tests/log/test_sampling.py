@@ -0,0 +1,83 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import logging
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from log.logger import SamplingFilter
+from log.sampling import LogSampler, _log_sampled_var, is_log_sampled, set_log_sampled
+
+
+@pytest.fixture(autouse=True)
+def reset_log_sampled() -> Generator[None, None, None]:
+    token = _log_sampled_var.set(True)
+    yield
+    _log_sampled_var.reset(token)
+
+
+def _create_record(level: int) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, "message", (), None)
+
+
+class TestLogSampler:
+    def test_always_logs_when_rate_is_one(self) -> None:
+        """rateが1の場合は常に出力すること."""
+        # Arrange
+        sampler = LogSampler(rate=1, paths=["/lgtm-images"])
+
+        # Act & Assert
+        assert all(sampler.should_log("/lgtm-images") for _ in range(100))
+
+    def test_always_logs_paths_not_configured(self) -> None:
+        """対象外のパスは常に出力すること."""
+        # Arrange
+        sampler = LogSampler(rate=1000, paths=["/lgtm-images"])
+
+        # Act & Assert
+        assert all(sampler.should_log("/health-checks") for _ in range(100))
+
+    def test_samples_one_in_rate_for_configured_paths(self) -> None:
+        """対象パスはrate件に1件の割合で出力すること."""
+        # Arrange
+        sampler = LogSampler(rate=10, paths=["/lgtm-images"])
+
+        # Act
+        with patch("log.sampling.random.random", side_effect=[0.05, 0.1, 0.5]):
+            results = [sampler.should_log("/lgtm-images") for _ in range(3)]
+
+        # Assert
+        assert results == [True, False, False]
+
+
+class TestSamplingFilter:
+    def test_passes_info_when_sampled(self) -> None:
+        """サンプリング対象のリクエストではINFOログを出力すること."""
+        # Arrange
+        set_log_sampled(True)
+
+        # Act & Assert
+        assert SamplingFilter().filter(_create_record(logging.INFO)) is True
+
+    def test_drops_info_when_not_sampled(self) -> None:
+        """サンプリング対象外のリクエストではINFOログを出力しないこと."""
+        # Arrange
+        set_log_sampled(False)
+
+        # Act & Assert
+        assert SamplingFilter().filter(_create_record(logging.INFO)) is False
+
+    @pytest.mark.parametrize("level", [logging.WARNING, logging.ERROR])
+    def test_always_passes_warning_and_above(self, level: int) -> None:
+        """WARNING以上のログはサンプリングに関わらず出力すること."""
+        # Arrange
+        set_log_sampled(False)
+
+        # Act & Assert
+        assert SamplingFilter().filter(_create_record(level)) is True
+
+    def test_default_is_sampled(self) -> None:
+        """リクエスト外（デフォルト）ではログを出力すること."""
+        # Act & Assert
+        assert is_log_sampled() is True
@@ -0,0 +1,51 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import os
+
+from metrics.registry import Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    def test_counts_observations_cumulatively(self) -> None:
+        """観測値をバケットの上限値ごとに累積で集計すること."""
+        # Arrange
+        histogram = Histogram(buckets=(0.1, 1.0))
+
+        # Act
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(3.0)
+
+        # Assert
+        snapshot = histogram.snapshot()
+        assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == 3.65
+
+
+class TestMetricsRegistry:
+    def test_returns_same_metric_for_same_name(self) -> None:
+        """同じ名前のメトリクスは同じインスタンスを返すこと."""
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act & Assert
+        assert registry.counter("a") is registry.counter("a")
+        assert registry.histogram("b") is registry.histogram("b")
+
+    def test_snapshot_contains_pid_and_metrics(self) -> None:
+        """スナップショットにプロセスIDと全メトリクスの値が含まれること."""
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("requests").inc()
+        registry.counter("requests").inc(2)
+        registry.histogram("wait", buckets=(1.0,)).observe(0.5)
+
+        # Act
+        snapshot = registry.snapshot()
+
+        # Assert
+        assert snapshot["pid"] == os.getpid()
+        assert snapshot["counters"] == {"requests": 3}
+        assert snapshot["histograms"]["wait"]["buckets"] == {"1.0": 1, "+Inf": 1}
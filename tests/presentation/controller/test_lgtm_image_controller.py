@@ -10,6 +10,10 @@ from pydantic import ValidationError
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domain.lgtm_image import LgtmImageId
+from domain.lgtm_image_cursor import encode_lgtm_image_cursor
+from domain.lgtm_image_errors import ErrDatabaseBusy
+from domain.lgtm_image_object import LgtmImageObject
 from infrastructure.lgtm_image_repository import LgtmImageRepository
 from presentation.controller.lgtm_image_controller import LgtmImageController
 from presentation.controller.lgtm_image_request import LgtmImageCreateRequest
@@ -164,6 +168,158 @@ class TestLgtmImageController:
         assert "error" in content
         assert "Internal server error" in content["error"]
 
+    @pytest.mark.asyncio
+    async def test_exec_returns_503_when_database_is_busy(self) -> None:
+        """異常系: DBコネクションの取得待ちが上限を超えた場合は503を返す."""
+        # Arrange
+        repository = Mock()
+        repository.find_all_ids = AsyncMock(side_effect=ErrDatabaseBusy("timeout"))
+
+        # Act
+        result = await LgtmImageController.exec(
+            repository=repository,
+            base_url="example.com",
+        )
+
+        # Assert
+        assert result.status_code == 503
+        assert result.headers["Retry-After"] == "1"
+        content = json.loads(bytes(result.body))
+        assert content["error"] == "Service temporarily unavailable"
+
+    @pytest.mark.asyncio
+    async def test_exec_with_custom_limit(self) -> None:
+        """正常系: 指定したlimitの件数を返す."""
+        # Arrange
+        ids = [LgtmImageId(i) for i in range(1, 101)]
+        repository = Mock()
+        repository.find_all_ids = AsyncMock(return_value=ids)
+        repository.find_by_ids = AsyncMock(
+            side_effect=lambda requested: [
+                LgtmImageObject(id=id_, path="2024/01/15/14", filename=f"{id_}")
+                for id_ in requested
+            ]
+        )
+
+        # Act
+        result = await LgtmImageController.exec(
+            repository=repository,
+            base_url="example.com",
+            limit=100,
+        )
+
+        # Assert
+        assert result.status_code == 200
+        content = json.loads(bytes(result.body))
+        assert len(content["lgtmImages"]) == 100
+
+    @pytest.mark.asyncio
+    async def test_exec_with_cursor_includes_next_cursor(self) -> None:
+        """正常系: cursor指定時はnextCursorを含める."""
+        # Arrange
+        repository = Mock()
+        repository.find_all_ids = AsyncMock(
+            return_value=[LgtmImageId(i) for i in range(1, 21)]
+        )
+        repository.find_by_ids = AsyncMock(
+            side_effect=lambda requested: [
+                LgtmImageObject(id=id_, path="2024/01/15/14", filename=f"{id_}")
+                for id_ in requested
+            ]
+        )
+
+        # Act
+        result = await LgtmImageController.exec(
+            repository=repository,
+            base_url="example.com",
+            cursor="",
+        )
+
+        # Assert
+        assert result.status_code == 200
+        content = json.loads(bytes(result.body))
+        assert len(content["lgtmImages"]) == 9
+        assert "nextCursor" in content
+
+    @pytest.mark.asyncio
+    async def test_exec_seeded_returns_cacheable_response(self) -> None:
+        """正常系: seed指定時はETagとCache-Controlを付与し、一致するETagには304を返す."""
+        # Arrange
+        repository = Mock()
+        repository.find_all_ids = AsyncMock(
+            return_value=[LgtmImageId(i) for i in range(1, 21)]
+        )
+        repository.find_by_ids = AsyncMock(
+            side_effect=lambda requested: [
+                LgtmImageObject(id=id_, path="2024/01/15/14", filename=f"{id_}")
+                for id_ in requested
+            ]
+        )
+
+        # Act
+        result = await LgtmImageController.exec_seeded(
+            repository=repository, base_url="example.com", seed=1, cache_max_age=60
+        )
+        etag = result.headers["ETag"]
+        not_modified = await LgtmImageController.exec_seeded(
+            repository=repository,
+            base_url="example.com",
+            seed=1,
+            if_none_match=etag,
+            cache_max_age=60,
+        )
+
+        # Assert
+        assert result.status_code == 200
+        assert result.headers["Cache-Control"] == "private, max-age=60"
+        assert len(json.loads(bytes(result.body))["lgtmImages"]) == 9
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+        repository.find_by_ids.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_exec_batch_returns_images_in_requested_order(self) -> None:
+        """正常系: 指定したIDの画像を1回のクエリで取得し、指定した順序で返す."""
+        # Arrange
+        repository = Mock()
+        repository.find_by_ids = AsyncMock(
+            return_value=[
+                LgtmImageObject(
+                    id=LgtmImageId(i), path="2024/01/15/14", filename=f"{i}"
+                )
+                for i in (1, 3)
+            ]
+        )
+
+        # Act
+        result = await LgtmImageController.exec_batch(
+            repository=repository, base_url="example.com", ids="3,2,1"
+        )
+
+        # Assert
+        assert result.status_code == 200
+        content = json.loads(bytes(result.body))
+        assert [image["id"] for image in content["lgtmImages"]] == ["3", "1"]
+        repository.find_by_ids.assert_awaited_once_with([3, 2, 1])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ids", ["1,abc", "1,²"])
+    async def test_exec_batch_returns_422_with_invalid_ids(self, ids: str) -> None:
+        """異常系: IDの形式が不正な場合は422を返す."""
+        # Arrange
+        repository = Mock()
+        repository.find_by_ids = AsyncMock()
+
+        # Act
+        result = await LgtmImageController.exec_batch(
+            repository=repository, base_url="example.com", ids=ids
+        )
+
+        # Assert
+        assert result.status_code == 422
+        assert json.loads(bytes(result.body)) == {"error": "Invalid image ids provided"}
+        repository.find_by_ids.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_exec_recently_created_success(
         self, test_db_session: AsyncSession
@@ -311,6 +467,76 @@ class TestLgtmImageController:
         assert "error" in content
         assert "Internal server error" in content["error"]
 
+    @pytest.mark.asyncio
+    async def test_exec_recently_created_returns_503_when_database_is_busy(
+        self,
+    ) -> None:
+        """異常系: DBコネクションの取得待ちが上限を超えた場合は503を返す."""
+        # Arrange
+        repository = Mock()
+        repository.find_recently_created = AsyncMock(
+            side_effect=ErrDatabaseBusy("timeout")
+        )
+
+        # Act
+        result = await LgtmImageController.exec_recently_created(
+            repository=repository,
+            base_url="example.com",
+        )
+
+        # Assert
+        assert result.status_code == 503
+        content = json.loads(bytes(result.body))
+        assert content["error"] == "Service temporarily unavailable"
+
+    @pytest.mark.asyncio
+    async def test_exec_recently_created_returns_422_with_invalid_cursor(
+        self,
+    ) -> None:
+        """異常系: 不正なカーソルの場合は422を返す."""
+        # Arrange
+        repository = Mock()
+        repository.find_recently_created = AsyncMock()
+
+        # Act
+        result = await LgtmImageController.exec_recently_created(
+            repository=repository,
+            base_url="example.com",
+            before="invalid!",
+        )
+
+        # Assert
+        assert result.status_code == 422
+        content = json.loads(bytes(result.body))
+        assert content["error"] == "Invalid cursor provided"
+
+    @pytest.mark.asyncio
+    async def test_exec_recently_created_includes_next_cursor(self) -> None:
+        """正常系: 次のページがある場合はnextCursorを含める."""
+        # Arrange
+        repository = Mock()
+        repository.find_recently_created = AsyncMock(
+            return_value=[
+                LgtmImageObject(
+                    id=LgtmImageId(i), path="2024/01/15/14", filename=f"{i}.webp"
+                )
+                for i in (3, 2, 1)
+            ]
+        )
+
+        # Act
+        result = await LgtmImageController.exec_recently_created(
+            repository=repository,
+            base_url="example.com",
+            limit=2,
+        )
+
+        # Assert
+        assert result.status_code == 200
+        content = json.loads(bytes(result.body))
+        assert [item["id"] for item in content["lgtmImages"]] == ["3", "2"]
+        assert content["nextCursor"] == encode_lgtm_image_cursor(LgtmImageId(2))
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("extension", [".png", ".jpg", ".jpeg"])
     async def test_create_success_with_valid_extensions(self, extension: str) -> None:
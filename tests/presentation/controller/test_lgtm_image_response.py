@@ -0,0 +1,39 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from domain.lgtm_image import LgtmImage
+from presentation.controller.lgtm_image_response import (
+    LgtmImageRecentlyCreatedListResponse,
+    create_lgtm_image_list_content,
+)
+
+
+class TestCreateLgtmImageListContent:
+    def test_matches_response_model(self) -> None:
+        """レスポンスのモデルと同じ形の本文を作成すること."""
+        # Arrange
+        images = [
+            LgtmImage(id="1", url="https://example.com/2024/01/15/14/a.webp"),
+            LgtmImage(id="2", url="https://example.com/2024/01/15/14/b.webp"),
+        ]
+
+        # Act
+        content = create_lgtm_image_list_content(images, "cursor")
+
+        # Assert
+        response = LgtmImageRecentlyCreatedListResponse.model_validate(content)
+        assert (
+            response.model_dump(mode="json", by_alias=True, exclude_none=True)
+            == content
+        )
+
+    def test_omits_next_cursor_when_none(self) -> None:
+        """次のカーソルがない場合はnextCursorを含めないこと."""
+        # Act
+        content = create_lgtm_image_list_content(
+            [LgtmImage(id="1", url="https://example.com/a.webp")]
+        )
+
+        # Assert
+        assert content == {
+            "lgtmImages": [{"id": "1", "url": "https://example.com/a.webp"}]
+        }
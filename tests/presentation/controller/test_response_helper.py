@@ -2,7 +2,12 @@
 
 from unittest.mock import MagicMock, patch
 
-from presentation.controller.response_helper import create_error_response
+from presentation.controller.response_helper import (
+    create_error_response,
+    create_not_modified_response,
+    create_service_unavailable_response,
+    parse_if_none_match,
+)
 
 
 class TestHandleInternalError:
@@ -107,3 +112,42 @@ class TestHandleInternalError:
                 "request_id": "test-request-id-456",
             },
         )
+
+
+class TestCreateServiceUnavailableResponse:
+    def test_returns_503_with_retry_after(self) -> None:
+        """Retry-Afterヘッダー付きの503レスポンスを返すこと"""
+        # Act
+        response = create_service_unavailable_response(retry_after_seconds=2)
+
+        # Assert
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
+        assert response.body == b'{"error":"Service temporarily unavailable"}'
+
+
+class TestParseIfNoneMatch:
+    def test_returns_empty_list_without_header(self) -> None:
+        """ヘッダーがない場合は空のリストを返すこと"""
+        # Act & Assert
+        assert parse_if_none_match(None) == []
+
+    def test_parses_multiple_and_weak_tags(self) -> None:
+        """複数のタグと弱いタグから引用符とW/を除いて取り出すこと"""
+        # Act
+        tags = parse_if_none_match('"abc", W/"def" , invalid')
+
+        # Assert
+        assert tags == ["abc", "def"]
+
+
+class TestCreateNotModifiedResponse:
+    def test_returns_304_with_headers(self) -> None:
+        """ヘッダー付きの本文のない304レスポンスを返すこと"""
+        # Act
+        response = create_not_modified_response({"ETag": '"abc"'})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.headers["ETag"] == '"abc"'
+        assert response.body == b""
@@ -0,0 +1,165 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from types import SimpleNamespace
+from typing import Any, Optional, cast
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Request
+
+from infrastructure.app_resources import AppResources
+from infrastructure.cached_lgtm_image_repository import CachedLgtmImageRepository
+from infrastructure.catalog_snapshot import CatalogSnapshot
+from infrastructure.catalog_snapshot_lgtm_image_repository import (
+    CatalogSnapshotLgtmImageRepository,
+)
+from infrastructure.lgtm_image_object_cache import LgtmImageObjectCache
+from presentation.dependencies.auth import create_token_verifier_repository
+from infrastructure.lgtm_image_repository import LgtmImageRepository
+from infrastructure.replica_fallback_lgtm_image_repository import (
+    ReplicaFallbackLgtmImageRepository,
+)
+from presentation.dependencies.resources import (
+    create_db_session,
+    create_read_db_session,
+    get_app_resources,
+)
+from presentation.router.lgtm_image_router import create_lgtm_image_repository
+
+
+def _create_resources(
+    catalog_snapshot: Optional[CatalogSnapshot] = None,
+) -> AppResources:
+    return AppResources(
+        engine=MagicMock(),
+        session_factory=MagicMock(),
+        s3_client=MagicMock(),
+        http_session=MagicMock(),
+        token_verifier=MagicMock(),
+        catalog_snapshot=catalog_snapshot,
+    )
+
+
+class TestGetAppResources:
+    def test_returns_resources_from_app_state(self) -> None:
+        """app.stateに保持した共有リソースを返すこと."""
+        # Arrange
+        resources = _create_resources()
+        app = SimpleNamespace(state=SimpleNamespace(resources=resources))
+        request = cast(Request, SimpleNamespace(app=app))
+
+        # Act & Assert
+        assert get_app_resources(request) is resources
+
+    def test_token_verifier_is_shared(self) -> None:
+        """トークン検証リポジトリはリクエスト間で同じインスタンスを使うこと."""
+        # Arrange
+        resources = _create_resources()
+
+        # Act & Assert
+        assert create_token_verifier_repository(resources) is resources.token_verifier
+        assert create_token_verifier_repository(resources) is resources.token_verifier
+
+
+class TestCreateDbSession:
+    @pytest.mark.asyncio
+    async def test_yields_session_from_session_factory(self) -> None:
+        """共有のセッションファクトリーからセッションを作成すること."""
+        # Arrange
+        session = MagicMock()
+        session_cm = MagicMock()
+
+        async def enter(*args: Any) -> MagicMock:
+            return session
+
+        async def exit_(*args: Any) -> None:
+            return None
+
+        session_cm.__aenter__ = enter
+        session_cm.__aexit__ = exit_
+        resources = _create_resources()
+        cast(MagicMock, resources.session_factory).return_value = session_cm
+
+        # Act
+        sessions = [s async for s in create_db_session(resources)]
+
+        # Assert
+        assert sessions == [session]
+
+
+class TestCreateReadDbSession:
+    @pytest.mark.asyncio
+    async def test_yields_none_without_replica(self) -> None:
+        """レプリカが未設定の場合はNoneを返すこと."""
+        # Arrange
+        resources = _create_resources()
+
+        # Act
+        sessions = [s async for s in create_read_db_session(resources)]
+
+        # Assert
+        assert sessions == [None]
+
+
+class TestCreateLgtmImageRepository:
+    def test_uses_primary_without_replica(self) -> None:
+        """レプリカが未設定の場合はプライマリのリポジトリを返すこと."""
+        # Act
+        repository = create_lgtm_image_repository(
+            MagicMock(), None, _create_resources()
+        )
+
+        # Assert
+        assert isinstance(repository, LgtmImageRepository)
+
+    def test_routes_reads_to_replica(self) -> None:
+        """レプリカが設定されている場合はレプリカに振り分けること."""
+        # Act
+        repository = create_lgtm_image_repository(
+            MagicMock(), MagicMock(), _create_resources()
+        )
+
+        # Assert
+        assert isinstance(repository, ReplicaFallbackLgtmImageRepository)
+
+    def test_wraps_repository_with_cache(self) -> None:
+        """画像のキャッシュが有効な場合はキャッシュ付きのリポジトリを返すこと."""
+        # Arrange
+        resources = AppResources(
+            engine=MagicMock(),
+            session_factory=MagicMock(),
+            s3_client=MagicMock(),
+            http_session=MagicMock(),
+            token_verifier=MagicMock(),
+            lgtm_image_object_cache=LgtmImageObjectCache(10),
+        )
+
+        # Act
+        repository = create_lgtm_image_repository(MagicMock(), None, resources)
+
+        # Assert
+        assert isinstance(repository, CachedLgtmImageRepository)
+
+    def test_reads_from_loaded_snapshot(self) -> None:
+        """スナップショットを読み込み済みの場合はスナップショットから読み取ること."""
+        # Arrange
+        snapshot = CatalogSnapshot()
+        snapshot._loaded = True
+
+        # Act
+        repository = create_lgtm_image_repository(
+            MagicMock(), None, _create_resources(snapshot)
+        )
+
+        # Assert
+        assert isinstance(repository, CatalogSnapshotLgtmImageRepository)
+
+    def test_uses_database_until_snapshot_is_loaded(self) -> None:
+        """スナップショットの読み込み前はDBから読み取ること."""
+        # Act
+        repository = create_lgtm_image_repository(
+            MagicMock(), None, _create_resources(CatalogSnapshot())
+        )
+
+        # Assert
+        assert isinstance(repository, LgtmImageRepository)
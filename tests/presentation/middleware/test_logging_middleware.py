@@ -0,0 +1,96 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+from fastapi import Request
+from starlette.responses import Response
+
+from log.sampling import LogSampler, _log_sampled_var, is_log_sampled
+from presentation.middleware.logging_middleware import LoggingMiddleware
+
+
+@pytest.fixture(autouse=True)
+def reset_log_sampled() -> Generator[None, None, None]:
+    token = _log_sampled_var.set(True)
+    yield
+    _log_sampled_var.reset(token)
+
+
+def _create_request(path: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "headers": [],
+            "query_string": b"",
+            "client": ("127.0.0.1", 12345),
+            "server": ("testserver", 80),
+            "scheme": "http",
+            "root_path": "",
+        }
+    )
+
+
+async def _dummy_app(scope: object, receive: object, send: object) -> None:
+    pass
+
+
+class TestLoggingMiddleware:
+    @pytest.mark.asyncio
+    async def test_sampling_decision_is_visible_to_downstream(self) -> None:
+        """サンプリングの判定が後続の処理から参照できること."""
+        # Arrange
+        middleware = LoggingMiddleware(
+            _dummy_app, sampler=LogSampler(rate=10, paths=["/a"])
+        )
+        observed: list[bool] = []
+
+        async def call_next(request: Request) -> Response:
+            observed.append(is_log_sampled())
+            return Response(status_code=200)
+
+        # Act
+        with patch("log.sampling.random.random", return_value=0.5):
+            await middleware.dispatch(_create_request("/a"), call_next)
+
+        # Assert
+        assert observed == [False]
+        assert is_log_sampled() is False
+
+    @pytest.mark.asyncio
+    async def test_error_response_forces_completion_log(self) -> None:
+        """エラーレスポンスの場合はサンプリング対象外でも完了ログを出力すること."""
+        # Arrange
+        middleware = LoggingMiddleware(
+            _dummy_app, sampler=LogSampler(rate=10, paths=["/a"])
+        )
+
+        async def call_next(request: Request) -> Response:
+            return Response(status_code=500)
+
+        # Act
+        with patch("log.sampling.random.random", return_value=0.5):
+            await middleware.dispatch(_create_request("/a"), call_next)
+
+        # Assert
+        assert is_log_sampled() is True
+
+    @pytest.mark.asyncio
+    async def test_without_sampler_logs_every_request(self) -> None:
+        """samplerを指定しない場合は全リクエストのログを出力すること."""
+        # Arrange
+        middleware = LoggingMiddleware(_dummy_app)
+        observed: list[bool] = []
+
+        async def call_next(request: Request) -> Response:
+            observed.append(is_log_sampled())
+            return Response(status_code=200)
+
+        # Act
+        await middleware.dispatch(_create_request("/a"), call_next)
+
+        # Assert
+        assert observed == [True]
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from domain.create_lgtm_image import UploadObjectStorageDto
+from domain.create_lgtm_image import UploadedLgtmImage, UploadObjectStorageDto
 from usecase.create_lgtm_image_usecase import CreateLgtmImageUsecase
 
 
@@ -35,10 +35,10 @@ async def test_create_lgtm_image_usecase_success() -> None:
         )
 
     # Assert
-    assert "url" in result
-    assert "lgtm-images.lgtmeow.com" in result["url"]
-    assert "test-uuid-123" in result["url"]
-    assert result["url"].endswith(".webp")
+    assert isinstance(result, UploadedLgtmImage)
+    assert "lgtm-images.lgtmeow.com" in result.url
+    assert "test-uuid-123" in result.url
+    assert result.url.endswith(".webp")
 
     # リポジトリのuploadが1回呼ばれたことを確認
     object_storage_repository.upload.assert_called_once()
@@ -46,9 +46,9 @@ async def test_create_lgtm_image_usecase_success() -> None:
     # uploadに渡されたパラメータを確認
     call_args = object_storage_repository.upload.call_args
     upload_param: UploadObjectStorageDto = call_args[0][0]
-    assert upload_param["body"] == test_image_data
-    assert upload_param["image_extension"] == ".png"
-    assert "test-uuid-123.png" in upload_param["key"]
+    assert upload_param.body == test_image_data
+    assert upload_param.image_extension == ".png"
+    assert "test-uuid-123.png" in upload_param.key
 
 
 @pytest.mark.asyncio
@@ -77,10 +77,10 @@ async def test_create_lgtm_image_usecase_decodes_base64() -> None:
         )
 
     # Assert
-    assert "url" in result
+    assert isinstance(result, UploadedLgtmImage)
     object_storage_repository.upload.assert_called_once()
 
     # デコードされたデータが正しく渡されていることを確認
     call_args = object_storage_repository.upload.call_args
     upload_param: UploadObjectStorageDto = call_args[0][0]
-    assert upload_param["body"] == test_data.encode()
+    assert upload_param.body == test_data.encode()
@@ -1,12 +1,14 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
 import random
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT
+from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT, LgtmImage, LgtmImageId
 from domain.lgtm_image_errors import ErrRecordCount
+from domain.lgtm_image_object import LgtmImageObject
 from infrastructure.lgtm_image_repository import LgtmImageRepository
 from usecase.extract_random_lgtm_images_usecase import (
     ExtractRandomLgtmImagesUsecase,
@@ -35,13 +37,12 @@ class TestExtractRandomLgtmImagesUsecase:
 
         # Assert
         assert len(result) == DEFAULT_RANDOM_IMAGES_LIMIT
-        assert all(isinstance(image, dict) for image in result)
-        assert all("id" in image and "url" in image for image in result)
+        assert all(isinstance(image, LgtmImage) for image in result)
 
         # URLが正しい形式であることを確認
         for image in result:
-            assert image["url"].startswith(f"https://{base_url}")
-            assert image["url"].endswith(".webp")
+            assert image.url.startswith(f"https://{base_url}")
+            assert image.url.endswith(".webp")
 
     @pytest.mark.asyncio
     async def test_execute_success_with_custom_limit(
@@ -65,8 +66,7 @@ class TestExtractRandomLgtmImagesUsecase:
 
         # Assert
         assert len(result) == custom_limit
-        assert all(isinstance(image, dict) for image in result)
-        assert all("id" in image and "url" in image for image in result)
+        assert all(isinstance(image, LgtmImage) for image in result)
 
     @pytest.mark.asyncio
     async def test_execute_raises_err_record_count_when_insufficient_images(
@@ -112,13 +112,13 @@ class TestExtractRandomLgtmImagesUsecase:
         assert len(result) == limit
         for image in result:
             # URLの形式が正しいか確認
-            assert image["url"].startswith(f"https://{base_url}")
-            assert "/" in image["url"]  # pathが含まれている
-            assert image["url"].endswith(".webp")
+            assert image.url.startswith(f"https://{base_url}")
+            assert "/" in image.url  # pathが含まれている
+            assert image.url.endswith(".webp")
 
             # IDが文字列として正しく設定されているか確認
-            assert isinstance(image["id"], str)
-            assert image["id"].isdigit()
+            assert isinstance(image.id, str)
+            assert image.id.isdigit()
 
     @pytest.mark.asyncio
     async def test_execute_returns_different_results_with_different_seeds(
@@ -148,6 +148,60 @@ class TestExtractRandomLgtmImagesUsecase:
         )
 
         # Assert - 結果が異なることを確認
-        result1_ids = {img["id"] for img in result1}
-        result2_ids = {img["id"] for img in result2}
+        result1_ids = {img.id for img in result1}
+        result2_ids = {img.id for img in result2}
         assert result1_ids != result2_ids
+
+    @pytest.mark.asyncio
+    async def test_execute_keeps_sampled_order(self) -> None:
+        """正常系: find_by_idsの返却順に関わらず抽選した順序で返す."""
+        # Arrange - find_by_idsはID順で返す
+        ids = [LgtmImageId(i) for i in range(1, 101)]
+        repository = Mock()
+        repository.find_all_ids = AsyncMock(return_value=ids)
+
+        async def find_by_ids(
+            requested: list[LgtmImageId],
+        ) -> list[LgtmImageObject]:
+            return [
+                LgtmImageObject(id=id_, path="2024/01/15/14", filename=f"{id_}")
+                for id_ in sorted(requested)
+            ]
+
+        repository.find_by_ids = AsyncMock(side_effect=find_by_ids)
+        random.seed(42)
+
+        # Act
+        result = await ExtractRandomLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", limit=50
+        )
+
+        # Assert
+        sampled_ids = repository.find_by_ids.call_args.args[0]
+        assert len(result) == 50
+        assert [image.id for image in result] == [str(id_) for id_ in sampled_ids]
+
+    @pytest.mark.asyncio
+    async def test_execute_uses_given_sampler(self) -> None:
+        """正常系: サンプラーが指定された場合はサンプラーで抽選する."""
+        # Arrange
+        ids = [LgtmImageId(i) for i in range(1, 21)]
+        repository = Mock()
+        repository.find_all_ids = AsyncMock(return_value=ids)
+        repository.find_by_ids = AsyncMock(
+            side_effect=lambda requested: [
+                LgtmImageObject(id=id_, path="2024/01/15/14", filename=f"{id_}")
+                for id_ in requested
+            ]
+        )
+        sampler = Mock()
+        sampler.sample = Mock(return_value=[LgtmImageId(3), LgtmImageId(1)])
+
+        # Act
+        result = await ExtractRandomLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", limit=2, sampler=sampler
+        )
+
+        # Assert
+        sampler.sample.assert_called_once_with(ids, 2)
+        assert [image.id for image in result] == ["3", "1"]
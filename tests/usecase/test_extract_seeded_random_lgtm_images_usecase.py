@@ -0,0 +1,85 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import pytest
+
+from domain.lgtm_image_errors import ErrRecordCount
+from tests.fixtures.test_data_helpers import create_mock_lgtm_image_repository
+from usecase.extract_seeded_random_lgtm_images_usecase import (
+    ExtractSeededRandomLgtmImagesUsecase,
+)
+
+
+class TestExtractSeededRandomLgtmImagesUsecase:
+    @pytest.mark.asyncio
+    async def test_execute_returns_same_images_for_same_seed(self) -> None:
+        """正常系: 同じseedであれば同じ画像を同じ順序で返す."""
+        # Arrange
+        repository = create_mock_lgtm_image_repository(100)
+
+        # Act
+        first = await ExtractSeededRandomLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", seed=42
+        )
+        second = await ExtractSeededRandomLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", seed=42
+        )
+        other = await ExtractSeededRandomLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", seed=43
+        )
+
+        # Assert
+        assert first == second
+        assert first["images"] is not None
+        assert len({image.id for image in first["images"]}) == 9
+        assert other["tag"] != first["tag"]
+        assert other["images"] != first["images"]
+
+    @pytest.mark.asyncio
+    async def test_execute_changes_tag_when_images_are_added(self) -> None:
+        """正常系: 画像が追加された場合はタグが変わる."""
+        # Act
+        before = await ExtractSeededRandomLgtmImagesUsecase.execute(
+            repository=create_mock_lgtm_image_repository(100),
+            base_url="example.com",
+            seed=42,
+        )
+        after = await ExtractSeededRandomLgtmImagesUsecase.execute(
+            repository=create_mock_lgtm_image_repository(101),
+            base_url="example.com",
+            seed=42,
+        )
+
+        # Assert
+        assert before["tag"] != after["tag"]
+
+    @pytest.mark.asyncio
+    async def test_execute_skips_images_for_known_tag(self) -> None:
+        """正常系: 既知のタグの場合は画像を取得しない."""
+        # Arrange
+        repository = create_mock_lgtm_image_repository(100)
+        first = await ExtractSeededRandomLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", seed=42
+        )
+
+        # Act
+        result = await ExtractSeededRandomLgtmImagesUsecase.execute(
+            repository=repository,
+            base_url="example.com",
+            seed=42,
+            known_tags=[first["tag"]],
+        )
+
+        # Assert
+        assert result == {"tag": first["tag"], "images": None}
+        repository.find_by_ids.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_error_when_insufficient_records(self) -> None:
+        """異常系: 画像数がlimitより少ない場合はErrRecordCountを発生させる."""
+        # Act & Assert
+        with pytest.raises(ErrRecordCount):
+            await ExtractSeededRandomLgtmImagesUsecase.execute(
+                repository=create_mock_lgtm_image_repository(3),
+                base_url="example.com",
+                seed=1,
+            )
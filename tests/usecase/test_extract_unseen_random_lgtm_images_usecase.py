@@ -0,0 +1,102 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+import pytest
+
+from domain.lgtm_image_cursor import (
+    RandomLgtmImageCursor,
+    decode_random_lgtm_image_cursor,
+    encode_random_lgtm_image_cursor,
+)
+from domain.lgtm_image_errors import ErrInvalidCursor, ErrRecordCount
+from tests.fixtures.test_data_helpers import create_mock_lgtm_image_repository
+from usecase.extract_unseen_random_lgtm_images_usecase import (
+    ExtractUnseenRandomLgtmImagesUsecase,
+)
+
+
+class TestExtractUnseenRandomLgtmImagesUsecase:
+    @pytest.mark.asyncio
+    async def test_execute_returns_unseen_images_until_all_are_shown(self) -> None:
+        """正常系: カーソルを引き継ぐと、全件を返すまで同じ画像を返さない."""
+        # Arrange
+        repository = create_mock_lgtm_image_repository(30)
+        cursor = ""
+        shown: list[str] = []
+
+        # Act
+        for _ in range(3):
+            page = await ExtractUnseenRandomLgtmImagesUsecase.execute(
+                repository=repository, base_url="example.com", limit=10, cursor=cursor
+            )
+            shown.extend(image.id for image in page["images"])
+            assert page["next_cursor"] is not None
+            cursor = page["next_cursor"]
+
+        # Assert
+        assert sorted(shown, key=int) == [str(i) for i in range(1, 31)]
+
+    @pytest.mark.asyncio
+    async def test_execute_starts_next_cycle_without_duplicates(self) -> None:
+        """正常系: 周をまたぐ場合も1回のレスポンスに同じ画像を含めない."""
+        # Arrange
+        repository = create_mock_lgtm_image_repository(10)
+        cursor = encode_random_lgtm_image_cursor(
+            RandomLgtmImageCursor(seed=1, pool_size=10, position=7)
+        )
+
+        # Act
+        page = await ExtractUnseenRandomLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", limit=9, cursor=cursor
+        )
+
+        # Assert
+        ids = [image.id for image in page["images"]]
+        assert len(ids) == 9
+        assert len(set(ids)) == 9
+        assert page["next_cursor"] is not None
+        next_state = decode_random_lgtm_image_cursor(page["next_cursor"])
+        assert next_state["seed"] != 1
+        assert next_state["pool_size"] == 10
+
+    @pytest.mark.asyncio
+    async def test_execute_restarts_when_images_were_deleted(self) -> None:
+        """正常系: カーソルの画像数が現在の画像数を超える場合は新しい周を開始する."""
+        # Arrange
+        repository = create_mock_lgtm_image_repository(10)
+        cursor = encode_random_lgtm_image_cursor(
+            RandomLgtmImageCursor(seed=1, pool_size=20, position=0)
+        )
+
+        # Act
+        page = await ExtractUnseenRandomLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", limit=5, cursor=cursor
+        )
+
+        # Assert
+        assert len(page["images"]) == 5
+        assert page["next_cursor"] is not None
+        assert decode_random_lgtm_image_cursor(page["next_cursor"])["pool_size"] == 10
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_error_with_invalid_cursor(self) -> None:
+        """異常系: 不正なカーソルの場合はErrInvalidCursorを発生させる."""
+        # Arrange
+        repository = create_mock_lgtm_image_repository(10)
+
+        # Act & Assert
+        with pytest.raises(ErrInvalidCursor):
+            await ExtractUnseenRandomLgtmImagesUsecase.execute(
+                repository=repository, base_url="example.com", cursor="invalid!"
+            )
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_error_when_insufficient_records(self) -> None:
+        """異常系: 画像数がlimitより少ない場合はErrRecordCountを発生させる."""
+        # Arrange
+        repository = create_mock_lgtm_image_repository(3)
+
+        # Act & Assert
+        with pytest.raises(ErrRecordCount):
+            await ExtractUnseenRandomLgtmImagesUsecase.execute(
+                repository=repository, base_url="example.com", limit=9
+            )
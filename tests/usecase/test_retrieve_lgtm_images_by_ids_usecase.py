@@ -0,0 +1,53 @@
+# 絶対厳守：編集前に必ずAI実装ルールを読む
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from domain.lgtm_image import LgtmImage, LgtmImageId
+from domain.lgtm_image_errors import ErrInvalidImageIds
+from domain.lgtm_image_object import LgtmImageObject
+from usecase.retrieve_lgtm_images_by_ids_usecase import (
+    RetrieveLgtmImagesByIdsUsecase,
+)
+
+
+class TestRetrieveLgtmImagesByIdsUsecase:
+    @pytest.mark.asyncio
+    async def test_execute_skips_missing_ids(self) -> None:
+        """正常系: 存在しないIDを除いて指定した順序で返す."""
+        # Arrange
+        repository = Mock()
+        repository.find_by_ids = AsyncMock(
+            return_value=[
+                LgtmImageObject(
+                    id=LgtmImageId(i), path="2024/01/15/14", filename=f"image{i}"
+                )
+                for i in (2, 5)
+            ]
+        )
+
+        # Act
+        images = await RetrieveLgtmImagesByIdsUsecase.execute(
+            repository=repository, base_url="example.com", ids="5,4,2"
+        )
+
+        # Assert
+        assert images == [
+            LgtmImage(id="5", url="https://example.com/2024/01/15/14/image5.webp"),
+            LgtmImage(id="2", url="https://example.com/2024/01/15/14/image2.webp"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_error_with_invalid_ids(self) -> None:
+        """異常系: IDの形式が不正な場合はErrInvalidImageIdsを発生させる."""
+        # Arrange
+        repository = Mock()
+        repository.find_by_ids = AsyncMock()
+
+        # Act & Assert
+        with pytest.raises(ErrInvalidImageIds):
+            await RetrieveLgtmImagesByIdsUsecase.execute(
+                repository=repository, base_url="example.com", ids="1,,2"
+            )
+        repository.find_by_ids.assert_not_awaited()
@@ -1,10 +1,14 @@
 # 絶対厳守：編集前に必ずAI実装ルールを読む
 
+from unittest.mock import AsyncMock, Mock
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT
-from domain.lgtm_image_errors import ErrRecordCount
+from domain.lgtm_image import DEFAULT_RANDOM_IMAGES_LIMIT, LgtmImage, LgtmImageId
+from domain.lgtm_image_cursor import encode_lgtm_image_cursor
+from domain.lgtm_image_errors import ErrInvalidCursor, ErrRecordCount
+from domain.lgtm_image_object import LgtmImageObject
 from infrastructure.lgtm_image_repository import LgtmImageRepository
 from usecase.retrieve_recently_created_lgtm_images_usecase import (
     RetrieveRecentlyCreatedLgtmImagesUsecase,
@@ -25,26 +29,26 @@ class TestRetrieveRecentlyCreatedLgtmImagesUsecase:
         base_url = "cdn.example.com"
 
         # Act - デフォルトlimitで取得
-        result = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+        page = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
             repository=repository,
             base_url=base_url,
         )
+        result = page["images"]
 
         # Assert - 件数とデータ型の確認
         assert len(result) == DEFAULT_RANDOM_IMAGES_LIMIT
-        assert all(isinstance(image, dict) for image in result)
-        assert all("id" in image and "url" in image for image in result)
+        assert all(isinstance(image, LgtmImage) for image in result)
 
         # URLとIDの詳細な形式確認
         for image in result:
             # URLの形式が正しいか確認
-            assert image["url"].startswith(f"https://{base_url}")
-            assert "/" in image["url"]  # pathが含まれている
-            assert image["url"].endswith(".webp")
+            assert image.url.startswith(f"https://{base_url}")
+            assert "/" in image.url  # pathが含まれている
+            assert image.url.endswith(".webp")
 
             # IDが文字列として正しく設定されているか確認
-            assert isinstance(image["id"], str)
-            assert image["id"].isdigit()
+            assert isinstance(image.id, str)
+            assert image.id.isdigit()
 
     @pytest.mark.asyncio
     async def test_execute_success_with_custom_limit(
@@ -59,16 +63,16 @@ class TestRetrieveRecentlyCreatedLgtmImagesUsecase:
         base_url = "example.com"
 
         # Act
-        result = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+        page = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
             repository=repository,
             base_url=base_url,
             limit=custom_limit,
         )
+        result = page["images"]
 
         # Assert
         assert len(result) == custom_limit
-        assert all(isinstance(image, dict) for image in result)
-        assert all("id" in image and "url" in image for image in result)
+        assert all(isinstance(image, LgtmImage) for image in result)
 
     @pytest.mark.asyncio
     async def test_execute_returns_results_in_recent_order(
@@ -101,18 +105,19 @@ class TestRetrieveRecentlyCreatedLgtmImagesUsecase:
         limit = 3
 
         # Act
-        result = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+        page = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
             repository=repository,
             base_url=base_url,
             limit=limit,
         )
+        result = page["images"]
 
         # Assert - 最新の3件が返され、新しい順に並んでいる
         assert len(result) == 3
         # ID順で新しい順（1, 2, 3）
-        assert result[0]["id"] == "1"
-        assert result[1]["id"] == "2"
-        assert result[2]["id"] == "3"
+        assert result[0].id == "1"
+        assert result[1].id == "2"
+        assert result[2].id == "3"
 
     @pytest.mark.asyncio
     async def test_execute_raises_error_when_no_data(
@@ -149,3 +154,106 @@ class TestRetrieveRecentlyCreatedLgtmImagesUsecase:
                 base_url=base_url,
                 limit=limit,
             )
+
+    @pytest.mark.asyncio
+    async def test_execute_paginates_with_cursor(
+        self, test_db_session: AsyncSession
+    ) -> None:
+        """正常系: nextCursorを使って重複・欠落なく続きのページを取得できる."""
+        # Arrange - 同じcreated_atの画像を含む7件を挿入
+        await insert_test_lgtm_images(test_db_session, count=7)
+
+        repository = LgtmImageRepository(test_db_session)
+        base_url = "example.com"
+
+        # Act
+        first_page = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+            repository=repository, base_url=base_url, limit=3
+        )
+        second_page = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+            repository=repository,
+            base_url=base_url,
+            limit=3,
+            before=first_page["next_cursor"],
+        )
+        last_page = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+            repository=repository,
+            base_url=base_url,
+            limit=3,
+            before=second_page["next_cursor"],
+        )
+
+        # Assert - created_atが同じ場合はidの降順
+        ids = [
+            image.id
+            for page in (first_page, second_page, last_page)
+            for image in page["images"]
+        ]
+        assert ids == ["7", "6", "5", "4", "3", "2", "1"]
+        assert last_page["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_next_cursor_only_when_more_images_exist(
+        self,
+    ) -> None:
+        """正常系: 次のページがある場合のみnextCursorを返す."""
+        # Arrange - limit+1件を返すリポジトリ
+        repository = Mock()
+        repository.find_recently_created = AsyncMock(
+            return_value=[
+                LgtmImageObject(
+                    id=LgtmImageId(i), path="2024/01/15/14", filename=f"{i}.webp"
+                )
+                for i in (5, 4, 3)
+            ]
+        )
+
+        # Act
+        page = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+            repository=repository, base_url="example.com", limit=2
+        )
+
+        # Assert
+        repository.find_recently_created.assert_awaited_once_with(3, None)
+        assert [image.id for image in page["images"]] == ["5", "4"]
+        assert page["next_cursor"] == encode_lgtm_image_cursor(LgtmImageId(4))
+
+    @pytest.mark.asyncio
+    async def test_execute_allows_short_last_page(self) -> None:
+        """正常系: カーソル指定時は件数がlimit未満でもエラーにしない."""
+        # Arrange
+        repository = Mock()
+        repository.find_recently_created = AsyncMock(
+            return_value=[
+                LgtmImageObject(
+                    id=LgtmImageId(1), path="2024/01/15/14", filename="1.webp"
+                )
+            ]
+        )
+
+        # Act
+        page = await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+            repository=repository,
+            base_url="example.com",
+            limit=9,
+            before=encode_lgtm_image_cursor(LgtmImageId(2)),
+        )
+
+        # Assert
+        repository.find_recently_created.assert_awaited_once_with(10, LgtmImageId(2))
+        assert len(page["images"]) == 1
+        assert page["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_error_with_invalid_cursor(self) -> None:
+        """異常系: 不正なカーソルの場合はErrInvalidCursorを発生させる."""
+        # Arrange
+        repository = Mock()
+        repository.find_recently_created = AsyncMock()
+
+        # Act & Assert
+        with pytest.raises(ErrInvalidCursor):
+            await RetrieveRecentlyCreatedLgtmImagesUsecase.execute(
+                repository=repository, base_url="example.com", before="invalid!"
+            )
+        repository.find_recently_created.assert_not_called()